@@ -19,8 +19,11 @@ class Settings(BaseSettings):
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
     
-    # Database
+    # Database (for PostgreSQL in production, point this at PgBouncer, e.g. ...@host:6432/db)
     DATABASE_URL: str = os.getenv("DATABASE_URL", "sqlite:///./recruitai.db")
+    DB_POOL_SIZE: int = 0  # Connections per process; 0 sizes it to cpu_count * 2 + 1
+    DB_POOL_TIMEOUT: int = 5  # Seconds to wait for a free connection before failing
+    DB_POOL_RECYCLE: int = 1800  # Seconds before a pooled connection is replaced
     
     # CORS
     CORS_ORIGINS: List[str] = ["*"]  # In production, specify exact origins
@@ -36,7 +39,18 @@ class Settings(BaseSettings):
     OPENAI_API_KEY: str = os.getenv("OPENAI_API_KEY", "")
     DEEPSEEK_API_KEY: str = os.getenv("DEEPSEEK_API_KEY", "")
     GOOGLE_AI_API_KEY: str = os.getenv("GOOGLE_AI_API_KEY", "")
+    GOOGLE_AI_MAX_CONCURRENCY: int = 8  # Concurrent Google AI requests per process; keep under the RPM quota
+    AI_HTTP_BACKEND: str = "httpx"  # "aiohttp" sends Google AI requests through aiohttp when it is installed
+    OPENAI_MAX_CONCURRENCY: int = 8  # Concurrent OpenAI requests per process
+    AI_BATCH_POLL_SECONDS: int = 300  # How often submitted OpenAI batches are checked for results
     RESUME_MATCH_THRESHOLD: float = 0.6  # 60% match threshold
+    TFIDF_WEIGHTS_PATH: str = "uploads/tfidf_idf.joblib"
+    TFIDF_BOOTSTRAP_DOCS: int = 50  # Documents collected before fitting the shared IDF weights
+    AI_CACHE_SIZE: int = 1024  # Provider responses kept in memory
+    AI_CACHE_TTL: int = 7 * 24 * 3600  # Seconds a cached response lives in Redis and a stored parse stays valid
+    REDIS_URL: str = os.getenv("REDIS_URL", "")  # Optional; persists the AI response cache
+    ANALYTICS_CACHE_TTL: int = 60  # Seconds dashboard/admin analytics are served from cache
+    ADMIN_ANALYTICS_REFRESH_SECONDS: int = 300  # Refresh interval of the admin analytics view (PostgreSQL)
     
     # Credit System
     FREE_CREDITS_ON_SIGNUP: int = 10
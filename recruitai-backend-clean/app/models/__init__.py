@@ -8,6 +8,8 @@ from .candidate import Candidate
 from .interview import Interview
 from .resume import Resume
 from .credit import Credit
+from .credit_stats import CreditStats
+from .ai_parse_cache import AIParseCache
 
-__all__ = ["User", "Job", "Candidate", "Interview", "Resume", "Credit"]
+__all__ = ["User", "Job", "Candidate", "Interview", "Resume", "Credit", "CreditStats", "AIParseCache"]
 
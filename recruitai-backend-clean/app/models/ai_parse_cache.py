@@ -0,0 +1,22 @@
+"""
+AI parse cache model persisting Google AI parses keyed by content hash
+"""
+
+from sqlalchemy import Column, String, DateTime, JSON
+from sqlalchemy.sql import func
+
+from ..core.database import Base
+
+class AIParseCache(Base):
+    __tablename__ = "ai_parse_cache"
+    
+    # blake2b digest of the parse kind and the parsed text
+    content_hash = Column(String(32), primary_key=True)
+    kind = Column(String(50), nullable=False)  # google_resume, google_job
+    result = Column(JSON, nullable=False)
+    
+    # Timestamps
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    
+    def __repr__(self):
+        return f"<AIParseCache(content_hash='{self.content_hash}', kind='{self.kind}')>"
@@ -2,7 +2,7 @@
 Candidate model for candidate management and job applications
 """
 
-from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, ForeignKey, JSON, Float
+from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, ForeignKey, JSON, Float, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 
@@ -51,6 +51,15 @@ class Candidate(Base):
     job_id = Column(Integer, ForeignKey("jobs.id"), nullable=False)
     resume_id = Column(Integer, ForeignKey("resumes.id"), nullable=True)
     
+    # Indexes for per-job analytics filters
+    __table_args__ = (
+        Index(
+            "ix_candidates_job_qualified", job_id,
+            postgresql_include=["is_qualified", "interview_completed", "application_status", "match_score"]
+        ),
+        Index("ix_candidates_job_appdate", job_id, application_date.desc()),
+    )
+    
     # Relationships
     job = relationship("Job", back_populates="candidates")
     resume = relationship("Resume", back_populates="candidates")
@@ -2,7 +2,7 @@
 Credit model for tracking user credits and usage
 """
 
-from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, ForeignKey, Float
+from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, ForeignKey, Float, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 
@@ -38,6 +38,23 @@ class Credit(Base):
     # Foreign keys
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     
+    # Latest-balance and history reads order a user's transactions by time; INCLUDE makes
+    # them index-only on PostgreSQL. The partial indexes serve the earned/spent sums.
+    __table_args__ = (
+        Index(
+            "ix_credits_user_created", user_id, created_at.desc(), id.desc(),
+            postgresql_include=["balance_after", "amount"]
+        ),
+        Index(
+            "ix_credits_user_earned", user_id,
+            postgresql_where=amount > 0, sqlite_where=amount > 0, postgresql_include=["amount"]
+        ),
+        Index(
+            "ix_credits_user_spent", user_id,
+            postgresql_where=amount < 0, sqlite_where=amount < 0, postgresql_include=["amount"]
+        ),
+    )
+    
     # Relationships
     user = relationship("User", back_populates="credits")
     
@@ -0,0 +1,25 @@
+"""
+Credit statistics model holding per-user running totals of the credit ledger
+"""
+
+from sqlalchemy import Column, Integer, DateTime, ForeignKey
+from sqlalchemy.sql import func
+
+from ..core.database import Base
+
+class CreditStats(Base):
+    __tablename__ = "credit_stats"
+    
+    user_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
+    
+    # Running totals, updated with every ledger write
+    total_earned = Column(Integer, default=0, server_default="0", nullable=False)
+    total_spent = Column(Integer, default=0, server_default="0", nullable=False)
+    current_balance = Column(Integer, default=0, server_default="0", nullable=False)
+    last_transaction_at = Column(DateTime(timezone=True), nullable=True)
+    
+    # Timestamps
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    
+    def __repr__(self):
+        return f"<CreditStats(user_id={self.user_id}, balance={self.current_balance})>"
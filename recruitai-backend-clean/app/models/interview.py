@@ -2,7 +2,7 @@
 Interview model for AI-powered video interviews
 """
 
-from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, ForeignKey, JSON, Float
+from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, ForeignKey, JSON, Float, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 
@@ -63,6 +63,11 @@ class Interview(Base):
     job_id = Column(Integer, ForeignKey("jobs.id"), nullable=False)
     interviewer_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     
+    # Indexes for per-job analytics filters
+    __table_args__ = (
+        Index("ix_interviews_job_status", job_id, status, postgresql_include=["overall_score", "created_at"]),
+    )
+    
     # Relationships
     candidate = relationship("Candidate", back_populates="interviews")
     job = relationship("Job", back_populates="interviews")
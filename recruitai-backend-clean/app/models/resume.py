@@ -2,7 +2,7 @@
 Resume model for resume storage and analysis
 """
 
-from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, ForeignKey, JSON, Float
+from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, ForeignKey, JSON, Float, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 
@@ -48,6 +48,11 @@ class Resume(Base):
     # Foreign keys
     uploaded_by = Column(Integer, ForeignKey("users.id"), nullable=False)
     
+    # Indexes for per-uploader analytics filters
+    __table_args__ = (
+        Index("ix_resumes_uploader_created", uploaded_by, created_at.desc()),
+    )
+    
     # Relationships
     uploader = relationship("User")
     candidates = relationship("Candidate", back_populates="resume")
@@ -20,6 +20,7 @@ class User(Base):
     role = Column(String(20), default="user", nullable=False)  # user, admin
     is_active = Column(Boolean, default=True)
     is_verified = Column(Boolean, default=False)
+    credit_balance = Column(Integer, default=0, server_default="0", nullable=False)  # Running total of the credit ledger
     
     # Timestamps
     created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -22,6 +22,10 @@ from ..schemas.candidate import (
 )
 from ..services.resume_service import match_resume_to_job
 from ..services.credit_service import deduct_credits
+from ..services.analytics_service import invalidate_dashboard_cache
+from ..services.ai_batch_service import (
+    submit_pending_resume_extractions, submit_job_match_scoring, apply_batch_results
+)
 
 router = APIRouter()
 
@@ -93,6 +97,8 @@ async def create_candidate(
     db.commit()
     db.refresh(db_candidate)
     
+    await invalidate_dashboard_cache(job.owner_id)
+    
     # If resume is provided, calculate match score in background
     if resume and resume.is_processed:
         background_tasks.add_task(calculate_candidate_match, db_candidate.id, db)
@@ -242,6 +248,64 @@ async def get_candidate_statistics(
         rejected_candidates=rejected_candidates
     )
 
+@router.post("/batch/resume-extraction")
+async def submit_resume_extraction_batch(
+    limit: int = Query(1000, ge=1, le=50000),
+    admin_user: User = Depends(get_admin_user),
+    db: Session = Depends(get_db)
+):
+    """Queue AI extraction of pending resumes through the OpenAI Batch API (admin only)"""
+    
+    batch_id = await submit_pending_resume_extractions(db, limit)
+    if not batch_id:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="No pending resumes to submit, or OpenAI is not configured"
+        )
+    
+    return {"batch_id": batch_id}
+
+@router.post("/batch/match/{job_id}")
+async def submit_match_scoring_batch(
+    job_id: int,
+    admin_user: User = Depends(get_admin_user),
+    db: Session = Depends(get_db)
+):
+    """Queue match scoring of a job's candidates through the OpenAI Batch API (admin only)"""
+    
+    job = db.query(Job).filter(Job.id == job_id).first()
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job not found"
+        )
+    
+    batch_id = await submit_job_match_scoring(job, db)
+    if not batch_id:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="No processed resumes to score, or OpenAI is not configured"
+        )
+    
+    return {"batch_id": batch_id}
+
+@router.get("/batch/{batch_id}")
+async def get_batch_status(
+    batch_id: str,
+    admin_user: User = Depends(get_admin_user),
+    db: Session = Depends(get_db)
+):
+    """Check an OpenAI batch, applying its results if it has finished (admin only)"""
+    
+    batch_status = await apply_batch_results(batch_id, db)
+    if batch_status is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="OpenAI is not configured"
+        )
+    
+    return {"batch_id": batch_id, "status": batch_status}
+
 @router.get("/{candidate_id}", response_model=CandidateResponse)
 async def get_candidate(
     candidate_id: int,
@@ -46,17 +46,30 @@ async def get_credit_transaction_history(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
     transaction_type: Optional[str] = Query(None),
+    after_created_at: Optional[datetime] = Query(None),
+    after_id: Optional[int] = Query(None),
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
-    """Get credit transaction history for current user"""
+    """Get credit transaction history for current user
+    
+    To page through history, pass the created_at and id of the last item received as
+    after_created_at/after_id; skip is kept for existing clients but slows down on deep pages.
+    """
+    
+    if skip == 0 or (after_created_at is not None and after_id is not None):
+        after = (after_created_at, after_id) if after_created_at is not None and after_id is not None else None
+        credits, _ = await get_credit_history(
+            current_user.id, db, after=after, limit=limit, transaction_type=transaction_type
+        )
+        return credits
     
     query = db.query(Credit).filter(Credit.user_id == current_user.id)
     
     if transaction_type:
         query = query.filter(Credit.transaction_type == transaction_type)
     
-    credits = query.order_by(Credit.created_at.desc()).offset(skip).limit(limit).all()
+    credits = query.order_by(Credit.created_at.desc(), Credit.id.desc()).offset(skip).limit(limit).all()
     return credits
 
 @router.post("/purchase", response_model=CreditResponse)
@@ -92,10 +105,12 @@ async def purchase_credits(
             detail="Failed to process credit purchase"
         )
     
+    db.commit()
+    
     # Get the latest credit transaction
     latest_credit = db.query(Credit).filter(
         Credit.user_id == current_user.id
-    ).order_by(Credit.created_at.desc()).first()
+    ).order_by(Credit.created_at.desc(), Credit.id.desc()).first()
     
     return latest_credit
 
@@ -275,6 +290,8 @@ async def admin_add_credits(
             detail="Failed to add credits"
         )
     
+    db.commit()
+    
     # Get new balance
     new_balance = await get_user_credit_balance(user_id, db)
     
@@ -322,6 +339,8 @@ async def admin_deduct_credits(
             detail="Failed to deduct credits (insufficient balance)"
         )
     
+    db.commit()
+    
     # Get new balance
     new_balance = await get_user_credit_balance(user_id, db)
     
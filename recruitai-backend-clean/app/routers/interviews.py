@@ -2,7 +2,7 @@
 Interviews router for AI-powered video interviews
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, status, Query, BackgroundTasks, Response
 from sqlalchemy.orm import Session
 from sqlalchemy import func, and_, or_
 from typing import List, Optional
@@ -19,10 +19,13 @@ from ..models.job import Job
 from ..schemas.interview import (
     InterviewCreate, InterviewUpdate, InterviewResponse, 
     InterviewListResponse, InterviewStats, InterviewStartRequest,
-    InterviewSubmitResponse, InterviewCompleteRequest, InterviewAnalysis
+    InterviewSubmitResponse, InterviewCompleteRequest, InterviewAnalysis,
+    InterviewAnalysisBundle, INTERVIEW_LIST_ADAPTER
 )
+from ..schemas.base import STATS_ENCODER, stats_responses
 from ..services.ai_service import generate_interview_questions_with_ai
 from ..services.credit_service import deduct_credits
+from ..services.analytics_service import invalidate_dashboard_cache
 
 router = APIRouter()
 
@@ -103,7 +106,9 @@ async def create_interview(
     candidate.interview_link = f"/interview/{interview_token}"
     db.commit()
     
-    return db_interview
+    await invalidate_dashboard_cache(job.owner_id)
+    
+    return InterviewResponse.from_orm_fast(db_interview)
 
 @router.get("/", response_model=List[InterviewListResponse])
 async def get_interviews(
@@ -142,7 +147,7 @@ async def get_interviews(
         candidate = db.query(Candidate).filter(Candidate.id == interview.candidate_id).first()
         job = db.query(Job).filter(Job.id == interview.job_id).first()
         
-        interview_response = InterviewListResponse(
+        interview_response = InterviewListResponse.model_construct(
             id=interview.id,
             interview_token=interview.interview_token,
             title=interview.title,
@@ -158,9 +163,10 @@ async def get_interviews(
         )
         interview_responses.append(interview_response)
     
-    return interview_responses
+    # Rows come straight from the DB, so skip FastAPI's response validation
+    return Response(content=INTERVIEW_LIST_ADAPTER.dump_json(interview_responses), media_type="application/json")
 
-@router.get("/stats", response_model=InterviewStats)
+@router.get("/stats", responses=stats_responses(InterviewStats))
 async def get_interview_statistics(
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
@@ -193,7 +199,7 @@ async def get_interview_statistics(
         and_(Interview.status == "completed", Interview.overall_score.isnot(None))
     ).with_entities(func.avg(Interview.overall_score)).scalar()
     
-    return InterviewStats(
+    stats = InterviewStats(
         total_interviews=total_interviews,
         scheduled_interviews=scheduled_interviews,
         completed_interviews=completed_interviews,
@@ -201,14 +207,16 @@ async def get_interview_statistics(
         cancelled_interviews=cancelled_interviews,
         average_score=float(avg_score) if avg_score else None
     )
+    return Response(content=STATS_ENCODER.encode(stats), media_type="application/json")
 
 @router.get("/{interview_id}", response_model=InterviewResponse)
 async def get_interview(
     interview_id: int,
+    include: Optional[str] = Query(None),
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
-    """Get interview by ID"""
+    """Get interview by ID (pass include=analysis for the AI analysis payloads)"""
     
     interview = db.query(Interview).filter(Interview.id == interview_id).first()
     if not interview:
@@ -225,7 +233,12 @@ async def get_interview(
             detail="Not enough permissions"
         )
     
-    return interview
+    if include == "analysis":
+        return InterviewResponse.from_orm_fast(
+            interview, analysis=InterviewAnalysisBundle.from_orm_fast(interview)
+        )
+    
+    return InterviewResponse.from_orm_fast(interview)
 
 @router.get("/token/{interview_token}", response_model=InterviewResponse)
 async def get_interview_by_token(
@@ -241,7 +254,7 @@ async def get_interview_by_token(
             detail="Interview not found"
         )
     
-    return interview
+    return InterviewResponse.from_orm_fast(interview)
 
 @router.post("/start")
 async def start_interview(
@@ -418,7 +431,7 @@ async def update_interview(
     db.commit()
     db.refresh(interview)
     
-    return interview
+    return InterviewResponse.from_orm_fast(interview)
 
 @router.post("/{interview_id}/cancel")
 async def cancel_interview(
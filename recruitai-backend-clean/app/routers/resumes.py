@@ -7,7 +7,9 @@ import aiofiles
 from datetime import datetime
 import uuid
 import json
+import zlib
 from pathlib import Path
+import numpy as np
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -18,6 +20,14 @@ router = APIRouter()
 # In-memory storage for resumes (no database required)
 resumes_storage = []
 
+# 64-bit skill masks, parallel to resumes_storage (one uint64 per resume). SKILL_MASKS is
+# the filled prefix of a buffer that doubles when full, so appends are amortized O(1)
+_SKILL_MASK_BUFFER = np.zeros(64, dtype=np.uint64)
+SKILL_MASKS = _SKILL_MASK_BUFFER[:0]
+
+# Bit assigned to every skill seen so far (lowercased skill -> bit index)
+SKILL_BITS: Dict[str, int] = {}
+
 # File processing utilities
 UPLOAD_DIR = "uploads/resumes"
 ALLOWED_EXTENSIONS = {".pdf", ".docx", ".txt", ".doc"}
@@ -26,53 +36,96 @@ MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
 # Ensure upload directory exists
 os.makedirs(UPLOAD_DIR, exist_ok=True)
 
+# Demo data, built once at import
+_DEMO_TS = datetime.utcnow().isoformat()
+
+_DEMO_RESUMES = (
+    {
+        "id": "demo_resume_1",
+        "filename": "john_doe_resume.pdf",
+        "original_filename": "john_doe_resume.pdf",
+        "candidate_name": "John Doe",
+        "candidate_email": "john.doe@email.com",
+        "skills": ["JavaScript", "React", "Node.js", "Python", "SQL", "Git"],
+        "upload_date": _DEMO_TS,
+        "file_size": 245760,
+        "processed": True,
+        "extracted_text": "Experienced software developer with 5+ years in web development...",
+        "match_scores": {}
+    },
+    {
+        "id": "demo_resume_2", 
+        "filename": "jane_smith_resume.pdf",
+        "original_filename": "jane_smith_resume.pdf",
+        "candidate_name": "Jane Smith",
+        "candidate_email": "jane.smith@email.com",
+        "skills": ["Python", "Django", "PostgreSQL", "Docker", "AWS", "Machine Learning"],
+        "upload_date": _DEMO_TS,
+        "file_size": 198432,
+        "processed": True,
+        "extracted_text": "Senior backend developer specializing in Python and cloud technologies...",
+        "match_scores": {}
+    },
+    {
+        "id": "demo_resume_3",
+        "filename": "mike_johnson_resume.pdf", 
+        "original_filename": "mike_johnson_resume.pdf",
+        "candidate_name": "Mike Johnson",
+        "candidate_email": "mike.johnson@email.com",
+        "skills": ["Java", "Spring Boot", "Microservices", "Kubernetes", "MongoDB", "DevOps"],
+        "upload_date": _DEMO_TS,
+        "file_size": 312576,
+        "processed": True,
+        "extracted_text": "Full-stack Java developer with expertise in microservices architecture...",
+        "match_scores": {}
+    }
+)
+
 # Initialize with some demo data
 def initialize_demo_data():
     """Initialize with demo resumes"""
-    if len(resumes_storage) == 0:
-        demo_resumes = [
-            {
-                "id": "demo_resume_1",
-                "filename": "john_doe_resume.pdf",
-                "original_filename": "john_doe_resume.pdf",
-                "candidate_name": "John Doe",
-                "candidate_email": "john.doe@email.com",
-                "skills": ["JavaScript", "React", "Node.js", "Python", "SQL", "Git"],
-                "upload_date": datetime.utcnow().isoformat(),
-                "file_size": 245760,
-                "processed": True,
-                "extracted_text": "Experienced software developer with 5+ years in web development...",
-                "match_scores": {}
-            },
-            {
-                "id": "demo_resume_2", 
-                "filename": "jane_smith_resume.pdf",
-                "original_filename": "jane_smith_resume.pdf",
-                "candidate_name": "Jane Smith",
-                "candidate_email": "jane.smith@email.com",
-                "skills": ["Python", "Django", "PostgreSQL", "Docker", "AWS", "Machine Learning"],
-                "upload_date": (datetime.utcnow()).isoformat(),
-                "file_size": 198432,
-                "processed": True,
-                "extracted_text": "Senior backend developer specializing in Python and cloud technologies...",
-                "match_scores": {}
-            },
-            {
-                "id": "demo_resume_3",
-                "filename": "mike_johnson_resume.pdf", 
-                "original_filename": "mike_johnson_resume.pdf",
-                "candidate_name": "Mike Johnson",
-                "candidate_email": "mike.johnson@email.com",
-                "skills": ["Java", "Spring Boot", "Microservices", "Kubernetes", "MongoDB", "DevOps"],
-                "upload_date": datetime.utcnow().isoformat(),
-                "file_size": 312576,
-                "processed": True,
-                "extracted_text": "Full-stack Java developer with expertise in microservices architecture...",
-                "match_scores": {}
-            }
-        ]
-        resumes_storage.extend(demo_resumes)
-        logger.info(f"Initialized with {len(demo_resumes)} demo resumes")
+    if not resumes_storage:
+        resumes_storage.extend(_DEMO_RESUMES)
+        for resume in _DEMO_RESUMES:
+            register_skill_mask(resume["skills"])
+        logger.info(f"Initialized with {len(_DEMO_RESUMES)} demo resumes")
+
+# Skill mask utilities
+def skill_bit(skill: str) -> int:
+    """Return the bucket (0-63) a skill hashes into"""
+    key = skill.lower()
+    bit = SKILL_BITS.get(key)
+    if bit is None:
+        bit = zlib.crc32(key.encode("utf-8")) & 63
+        SKILL_BITS[key] = bit
+    return bit
+
+def compute_skill_mask(skills: List[str]) -> int:
+    """OR together the bits of all skills into a 64-bit mask"""
+    mask = 0
+    for skill in skills:
+        mask |= 1 << skill_bit(skill)
+    return mask
+
+def register_skill_mask(skills: List[str]) -> None:
+    """Append the skill mask of a newly stored resume to SKILL_MASKS"""
+    global SKILL_MASKS, _SKILL_MASK_BUFFER
+    count = len(SKILL_MASKS)
+    if count == len(_SKILL_MASK_BUFFER):
+        grown = np.zeros(2 * count, dtype=np.uint64)
+        grown[:count] = SKILL_MASKS
+        _SKILL_MASK_BUFFER = grown
+    _SKILL_MASK_BUFFER[count] = compute_skill_mask(skills)
+    SKILL_MASKS = _SKILL_MASK_BUFFER[:count + 1]
+
+def compute_job_mask(job_description: str) -> int:
+    """Build the mask of every known resume skill mentioned in the job description"""
+    job_desc_lower = job_description.lower()
+    mask = 0
+    for skill, bit in SKILL_BITS.items():
+        if skill in job_desc_lower:
+            mask |= 1 << bit
+    return mask
 
 # Initialize demo data on module load
 initialize_demo_data()
@@ -258,6 +311,7 @@ async def upload_resume(
         
         # Store resume
         resumes_storage.append(resume_record)
+        register_skill_mask(skills)
         
         logger.info(f"Resume uploaded successfully: {file.filename}")
         
@@ -339,10 +393,29 @@ async def match_resumes_to_job(job_description: str):
         if not job_description.strip():
             raise HTTPException(status_code=400, detail="Job description cannot be empty")
         
+        job_mask = compute_job_mask(job_description)
+        
+        # No known skill mentioned in the job description, so nothing can match
+        if not job_mask:
+            logger.info("Resume matching skipped: no recognized skills in job description")
+            return {
+                "success": True,
+                "job_description": job_description[:200] + "..." if len(job_description) > 200 else job_description,
+                "total_resumes": len(resumes_storage),
+                "matches": [],
+                "query_time": datetime.utcnow().isoformat()
+            }
+        
         matches = []
         
-        for resume in resumes_storage:
+        # Only resumes sharing at least one skill bit with the job can score above zero,
+        # so the rest are never visited; like an unmatched job, they are left out of the results
+        jd_mask = np.uint64(job_mask)
+        for idx in np.nonzero(SKILL_MASKS & jd_mask)[0].tolist():
+            resume = resumes_storage[idx]
             match_score = calculate_match_score(resume["skills"], job_description)
+            if not match_score:
+                continue
             
             matches.append({
                 "resume_id": resume["id"],
@@ -357,12 +430,12 @@ async def match_resumes_to_job(job_description: str):
         # Sort by match score (descending)
         matches.sort(key=lambda x: x["match_score"], reverse=True)
         
-        logger.info(f"Resume matching completed: {len(matches)} resumes processed")
+        logger.info(f"Resume matching completed: {len(matches)} of {len(resumes_storage)} resumes matched")
         
         return {
             "success": True,
             "job_description": job_description[:200] + "..." if len(job_description) > 200 else job_description,
-            "total_resumes": len(matches),
+            "total_resumes": len(resumes_storage),
             "matches": matches,
             "query_time": datetime.utcnow().isoformat()
         }
@@ -2,7 +2,7 @@
 Users management router for admin operations
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
 from sqlalchemy.orm import Session
 from sqlalchemy import func, and_
 from typing import List, Optional
@@ -12,8 +12,10 @@ from ..core.database import get_db
 from ..core.security import get_admin_user, get_current_active_user
 from ..models.user import User
 from ..models.credit import Credit
-from ..schemas.user import UserResponse, UserStats, UserUpdate
+from ..schemas.user import UserResponse, UserStats, UserUpdate, USER_LIST_ADAPTER
+from ..schemas.base import STATS_ENCODER, stats_responses
 from ..schemas.credit import CreditResponse
+from ..services.credit_service import add_credits
 
 router = APIRouter()
 
@@ -46,9 +48,12 @@ async def get_all_users(
         query = query.filter(User.is_active == is_active)
     
     users = query.offset(skip).limit(limit).all()
-    return users
+    return Response(
+        content=USER_LIST_ADAPTER.dump_json([UserResponse.from_orm_fast(u) for u in users]),
+        media_type="application/json"
+    )
 
-@router.get("/stats", response_model=UserStats)
+@router.get("/stats", responses=stats_responses(UserStats))
 async def get_user_statistics(
     admin_user: User = Depends(get_admin_user),
     db: Session = Depends(get_db)
@@ -68,12 +73,13 @@ async def get_user_statistics(
     # Total companies (unique company names)
     total_companies = db.query(func.count(func.distinct(User.company_name))).scalar()
     
-    return UserStats(
+    stats = UserStats(
         total_users=total_users,
         active_users=active_users,
         new_users_this_month=new_users_this_month,
         total_companies=total_companies
     )
+    return Response(content=STATS_ENCODER.encode(stats), media_type="application/json")
 
 @router.get("/{user_id}", response_model=UserResponse)
 async def get_user_by_id(
@@ -90,7 +96,7 @@ async def get_user_by_id(
             detail="User not found"
         )
     
-    return user
+    return UserResponse.from_orm_fast(user)
 
 @router.put("/{user_id}", response_model=UserResponse)
 async def update_user(
@@ -117,7 +123,7 @@ async def update_user(
     db.commit()
     db.refresh(user)
     
-    return user
+    return UserResponse.from_orm_fast(user)
 
 @router.post("/{user_id}/activate")
 async def activate_user(
@@ -236,25 +242,25 @@ async def add_credits_to_user(
             detail="Amount must be positive"
         )
     
-    # Get current balance
-    latest_credit = db.query(Credit).filter(Credit.user_id == user_id).order_by(Credit.created_at.desc()).first()
-    current_balance = latest_credit.balance_after if latest_credit else 0
-    
-    # Create credit transaction
-    credit_transaction = Credit(
+    success = await add_credits(
         user_id=user_id,
         amount=amount,
-        balance_after=current_balance + amount,
         transaction_type="admin_adjustment",
-        description=description,
-        status="completed"
+        db=db,
+        description=description
     )
     
-    db.add(credit_transaction)
+    if not success:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Failed to add credits"
+        )
+    
     db.commit()
+    db.refresh(user)
     
     return {
         "message": f"Added {amount} credits to user {user.username}",
-        "new_balance": current_balance + amount
+        "new_balance": user.credit_balance
     }
 
@@ -2,6 +2,7 @@
 Pydantic schemas for request/response validation
 """
 
+from .base import get_adapter
 from .auth import *
 from .user import *
 from .job import *
@@ -0,0 +1,67 @@
+"""
+Shared building blocks for response schemas
+"""
+
+from datetime import datetime
+from functools import lru_cache
+from typing import Annotated, Any, Dict, List, Optional
+
+import msgspec
+from pydantic import BaseModel, SkipValidation, TypeAdapter
+
+# Reused per process for encoding StatsStruct payloads
+STATS_ENCODER = msgspec.json.Encoder()
+
+@lru_cache(maxsize=None)
+def get_adapter(tp):
+    """Return a cached TypeAdapter so its core schema is only built once per type"""
+    return TypeAdapter(tp)
+
+# Stored JSON columns, passed through as-is instead of walked field by field
+RawJSONDict = Annotated[Optional[Dict[str, Any]], SkipValidation]
+RawJSONList = Annotated[Optional[List[Dict[str, Any]]], SkipValidation]
+
+class ORMFastMixin:
+    """Build response models from trusted ORM rows without re-validation"""
+
+    @classmethod
+    def from_orm_fast(cls, obj, **extra):
+        """Construct the model from an ORM object, skipping validation.
+
+        Only use this for rows that were validated when written; untrusted
+        input must still go through model_validate. Keyword arguments set
+        fields that are not plain attributes of the row.
+        """
+        data = {field: getattr(obj, field) for field in cls.model_fields if hasattr(obj, field)}
+        data.update(extra)
+        return cls.model_construct(**data)
+
+class StatsStruct(msgspec.Struct, frozen=True):
+    """Lightweight DTO for internal statistics payloads"""
+
+    def model_dump(self):
+        """Return the fields as a dict, matching the pydantic call sites"""
+        return msgspec.structs.asdict(self)
+
+def stats_responses(struct: type) -> Dict[int, Dict[str, Any]]:
+    """OpenAPI `responses` entry documenting a StatsStruct body
+
+    FastAPI can't derive a schema from a msgspec Struct, so routes that return
+    encoded StatsStruct bytes declare it with this instead of response_model.
+    """
+    _, components = msgspec.json.schema_components([struct])
+    return {200: {
+        "description": "Successful Response",
+        "content": {"application/json": {"schema": components[struct.__name__]}}
+    }}
+
+class _TimestampedModel(BaseModel):
+    """Identity and audit fields shared by full response models"""
+    id: int
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+
+class _CandidateJobRef(BaseModel):
+    """Candidate/job foreign keys shared by interview schemas"""
+    candidate_id: int
+    job_id: int
@@ -2,7 +2,7 @@
 Candidate schemas for request/response validation
 """
 
-from pydantic import BaseModel, EmailStr, validator
+from pydantic import BaseModel, ConfigDict, EmailStr, validator
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 
@@ -53,8 +53,7 @@ class CandidateResponse(CandidateBase):
     job_id: int
     resume_id: Optional[int] = None
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 class CandidateListResponse(BaseModel):
     id: int
@@ -70,8 +69,7 @@ class CandidateListResponse(BaseModel):
     job_id: int
     job_title: Optional[str] = None
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 class CandidateStats(BaseModel):
     total_candidates: int
@@ -89,8 +87,7 @@ class CandidateAssessment(BaseModel):
     recommendation: str  # hire, consider, reject
     confidence: float
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 class CandidateSearchFilters(BaseModel):
     search: Optional[str] = None
@@ -2,7 +2,7 @@
 Credit schemas for request/response validation
 """
 
-from pydantic import BaseModel, validator
+from pydantic import BaseModel, ConfigDict, validator
 from typing import Optional
 from datetime import datetime
 
@@ -27,8 +27,7 @@ class CreditResponse(CreditBase):
     updated_at: Optional[datetime] = None
     user_id: int
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 class CreditBalance(BaseModel):
     user_id: int
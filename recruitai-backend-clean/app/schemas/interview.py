@@ -2,24 +2,25 @@
 Interview schemas for request/response validation
 """
 
-from pydantic import BaseModel, validator
-from typing import List, Optional, Dict, Any
+from pydantic import BaseModel, ConfigDict, field_validator
+from typing import List, Literal, Optional, Dict, Any
 from datetime import datetime
 
+from .base import ORMFastMixin, get_adapter, RawJSONDict, RawJSONList, StatsStruct, _CandidateJobRef, _TimestampedModel
+
 class InterviewBase(BaseModel):
     title: str
     description: Optional[str] = None
     duration_minutes: int = 30
     
-    @validator('duration_minutes')
+    @field_validator('duration_minutes')
+    @classmethod
     def validate_duration(cls, v):
         if v < 5 or v > 120:
             raise ValueError('Duration must be between 5 and 120 minutes')
         return v
 
-class InterviewCreate(InterviewBase):
-    candidate_id: int
-    job_id: int
+class InterviewCreate(_CandidateJobRef, InterviewBase):
     scheduled_at: Optional[datetime] = None
 
 class InterviewUpdate(BaseModel):
@@ -27,32 +28,28 @@ class InterviewUpdate(BaseModel):
     description: Optional[str] = None
     duration_minutes: Optional[int] = None
     scheduled_at: Optional[datetime] = None
-    status: Optional[str] = None
+    status: Optional[Literal['scheduled', 'in_progress', 'completed', 'cancelled']] = None
+
+class InterviewAnalysisBundle(ORMFastMixin, BaseModel):
+    ai_analysis: RawJSONDict = None
+    emotion_analysis: RawJSONDict = None
+    speech_analysis: RawJSONDict = None
     
-    @validator('status')
-    def validate_status(cls, v):
-        if v is not None:
-            allowed_statuses = ['scheduled', 'in_progress', 'completed', 'cancelled']
-            if v not in allowed_statuses:
-                raise ValueError(f'Status must be one of: {", ".join(allowed_statuses)}')
-        return v
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra='forbid', strict=True)
 
-class InterviewResponse(InterviewBase):
-    id: int
+class InterviewResponse(ORMFastMixin, _TimestampedModel, _CandidateJobRef, InterviewBase):
     interview_token: str
     status: str
     scheduled_at: Optional[datetime] = None
     started_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
-    questions: Optional[List[Dict[str, Any]]] = None
-    responses: Optional[List[Dict[str, Any]]] = None
+    questions: RawJSONList = None
+    responses: RawJSONList = None
     overall_score: Optional[float] = None
     communication_score: Optional[float] = None
     technical_score: Optional[float] = None
     problem_solving_score: Optional[float] = None
-    ai_analysis: Optional[Dict[str, Any]] = None
-    emotion_analysis: Optional[Dict[str, Any]] = None
-    speech_analysis: Optional[Dict[str, Any]] = None
+    analysis: Optional[InterviewAnalysisBundle] = None  # only with ?include=analysis
     ai_recommendation: Optional[str] = None
     ai_confidence: Optional[float] = None
     ai_feedback: Optional[str] = None
@@ -61,16 +58,11 @@ class InterviewResponse(InterviewBase):
     transcript: Optional[str] = None
     recording_enabled: bool
     ai_analysis_enabled: bool
-    created_at: datetime
-    updated_at: Optional[datetime] = None
-    candidate_id: int
-    job_id: int
     interviewer_id: int
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra='forbid', strict=True)
 
-class InterviewListResponse(BaseModel):
+class InterviewListResponse(ORMFastMixin, _CandidateJobRef):
     id: int
     interview_token: str
     title: str
@@ -79,15 +71,12 @@ class InterviewListResponse(BaseModel):
     completed_at: Optional[datetime] = None
     overall_score: Optional[float] = None
     ai_recommendation: Optional[str] = None
-    candidate_id: int
     candidate_name: Optional[str] = None
-    job_id: int
     job_title: Optional[str] = None
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra='forbid', strict=True)
 
-class InterviewStats(BaseModel):
+class InterviewStats(StatsStruct):
     total_interviews: int
     scheduled_interviews: int
     completed_interviews: int
@@ -102,7 +91,7 @@ class InterviewQuestion(BaseModel):
     expected_duration: int  # seconds
     skills_assessed: List[str]
 
-class InterviewResponse(BaseModel):
+class InterviewQuestionResponse(BaseModel):
     question_id: int
     response_text: Optional[str] = None
     response_video_url: Optional[str] = None
@@ -121,8 +110,7 @@ class InterviewAnalysis(BaseModel):
     confidence: float
     feedback: str
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 class InterviewStartRequest(BaseModel):
     interview_token: str
@@ -136,3 +124,5 @@ class InterviewCompleteRequest(BaseModel):
     interview_token: str
     responses: List[InterviewSubmitResponse]
 
+# Compiled once and reused for interview list serialization
+INTERVIEW_LIST_ADAPTER = get_adapter(List[InterviewListResponse])
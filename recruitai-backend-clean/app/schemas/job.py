@@ -2,46 +2,34 @@
 Job schemas for request/response validation
 """
 
-from pydantic import BaseModel, validator
-from typing import List, Optional, Dict, Any
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+from typing import List, Literal, Optional, Dict, Any
 from datetime import datetime
 
+from .base import ORMFastMixin, get_adapter, RawJSONList, StatsStruct, _TimestampedModel
+
 class JobBase(BaseModel):
     title: str
     description: str
     company: str
     location: Optional[str] = None
-    job_type: str  # full-time, part-time, contract, internship
-    experience_level: str  # entry, mid, senior, executive
+    job_type: Literal['full-time', 'part-time', 'contract', 'internship']
+    experience_level: Literal['entry', 'mid', 'senior', 'executive']
     salary_min: Optional[int] = None
     salary_max: Optional[int] = None
     currency: str = "USD"
-    required_skills: Optional[List[str]] = []
-    preferred_skills: Optional[List[str]] = []
+    required_skills: Optional[List[str]] = Field(default_factory=list)
+    preferred_skills: Optional[List[str]] = Field(default_factory=list)
     education_requirements: Optional[str] = None
     experience_requirements: Optional[str] = None
     application_deadline: Optional[datetime] = None
     
-    @validator('job_type')
-    def validate_job_type(cls, v):
-        allowed_types = ['full-time', 'part-time', 'contract', 'internship']
-        if v not in allowed_types:
-            raise ValueError(f'Job type must be one of: {", ".join(allowed_types)}')
-        return v
-    
-    @validator('experience_level')
-    def validate_experience_level(cls, v):
-        allowed_levels = ['entry', 'mid', 'senior', 'executive']
-        if v not in allowed_levels:
-            raise ValueError(f'Experience level must be one of: {", ".join(allowed_levels)}')
-        return v
-    
-    @validator('salary_max')
-    def validate_salary_range(cls, v, values):
-        if v is not None and 'salary_min' in values and values['salary_min'] is not None:
-            if v < values['salary_min']:
+    @model_validator(mode='after')
+    def validate_salary_range(self):
+        if self.salary_max is not None and self.salary_min is not None:
+            if self.salary_max < self.salary_min:
                 raise ValueError('Maximum salary must be greater than minimum salary')
-        return v
+        return self
 
 class JobCreate(JobBase):
     pass
@@ -64,14 +52,11 @@ class JobUpdate(BaseModel):
     is_active: Optional[bool] = None
     is_published: Optional[bool] = None
 
-class JobResponse(JobBase):
-    id: int
+class JobResponse(ORMFastMixin, _TimestampedModel, JobBase):
     is_active: bool
     is_published: bool
-    ai_generated_questions: Optional[List[Dict[str, Any]]] = None
+    ai_generated_questions: RawJSONList = None
     job_summary: Optional[str] = None
-    created_at: datetime
-    updated_at: Optional[datetime] = None
     owner_id: int
     
     # Statistics
@@ -79,10 +64,9 @@ class JobResponse(JobBase):
     qualified_candidates: Optional[int] = 0
     interviews_completed: Optional[int] = 0
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra='forbid', strict=True)
 
-class JobListResponse(BaseModel):
+class JobListResponse(ORMFastMixin, BaseModel):
     id: int
     title: str
     company: str
@@ -95,10 +79,9 @@ class JobListResponse(BaseModel):
     total_candidates: Optional[int] = 0
     qualified_candidates: Optional[int] = 0
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra='forbid', strict=True)
 
-class JobStats(BaseModel):
+class JobStats(StatsStruct):
     total_jobs: int
     active_jobs: int
     published_jobs: int
@@ -114,3 +97,5 @@ class JobSearchFilters(BaseModel):
     is_active: Optional[bool] = None
     is_published: Optional[bool] = None
 
+# Compiled once and reused for job list serialization
+JOB_LIST_ADAPTER = get_adapter(List[JobListResponse])
@@ -2,10 +2,12 @@
 Resume schemas for request/response validation
 """
 
-from pydantic import BaseModel, EmailStr, validator
+from pydantic import BaseModel, ConfigDict
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 
+from .base import ORMFastMixin, get_adapter, RawJSONList, StatsStruct, _TimestampedModel
+
 class ResumeBase(BaseModel):
     filename: str
     original_filename: str
@@ -21,19 +23,17 @@ class ResumeUploadResponse(BaseModel):
     processing_status: str
     created_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra='forbid', strict=True)
 
-class ResumeResponse(ResumeBase):
-    id: int
+class ResumeResponse(ORMFastMixin, _TimestampedModel, ResumeBase):
     file_path: str
     candidate_name: Optional[str] = None
     candidate_email: Optional[str] = None
     candidate_phone: Optional[str] = None
     extracted_text: Optional[str] = None
     skills: Optional[List[str]] = None
-    experience: Optional[List[Dict[str, Any]]] = None
-    education: Optional[List[Dict[str, Any]]] = None
+    experience: RawJSONList = None
+    education: RawJSONList = None
     certifications: Optional[List[str]] = None
     ai_summary: Optional[str] = None
     strengths: Optional[List[str]] = None
@@ -41,15 +41,12 @@ class ResumeResponse(ResumeBase):
     is_processed: bool
     processing_status: str
     processing_error: Optional[str] = None
-    created_at: datetime
-    updated_at: Optional[datetime] = None
     processed_at: Optional[datetime] = None
     uploaded_by: int
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra='forbid', strict=True)
 
-class ResumeListResponse(BaseModel):
+class ResumeListResponse(ORMFastMixin, BaseModel):
     id: int
     filename: str
     original_filename: str
@@ -61,8 +58,7 @@ class ResumeListResponse(BaseModel):
     processing_status: str
     created_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra='forbid', strict=True)
 
 class ResumeAnalysisRequest(BaseModel):
     resume_id: int
@@ -75,8 +71,7 @@ class ResumeMatchResult(BaseModel):
     is_qualified: bool
     match_details: Dict[str, Any]
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 class ResumeProcessingStatus(BaseModel):
     id: int
@@ -85,10 +80,9 @@ class ResumeProcessingStatus(BaseModel):
     processing_error: Optional[str] = None
     processed_at: Optional[datetime] = None
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
-class ResumeStats(BaseModel):
+class ResumeStats(StatsStruct):
     total_resumes: int
     processed_resumes: int
     pending_resumes: int
@@ -99,4 +93,8 @@ class BulkResumeUploadResponse(BaseModel):
     failed_uploads: List[Dict[str, str]]
     total_uploaded: int
     total_failed: int
+    
+    model_config = ConfigDict(frozen=True, extra='forbid')
 
+# Compiled once and reused for bulk upload serialization
+RESUME_UPLOAD_LIST_ADAPTER = get_adapter(List[ResumeUploadResponse])
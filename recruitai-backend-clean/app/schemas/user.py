@@ -2,18 +2,21 @@
 User schemas for request/response validation
 """
 
-from pydantic import BaseModel, EmailStr, validator
-from typing import Optional
+from pydantic import BaseModel, ConfigDict, EmailStr, field_validator
+from typing import List, Optional
 from datetime import datetime
 
+from .base import ORMFastMixin, get_adapter, StatsStruct, _TimestampedModel
+
 class UserBase(BaseModel):
     username: str
-    email: EmailStr
+    email: str
     company_name: str
     phone_number: Optional[str] = None
     role: str = "user"
 
 class UserCreate(UserBase):
+    email: EmailStr
     password: str
 
 class UserUpdate(BaseModel):
@@ -23,26 +26,23 @@ class UserUpdate(BaseModel):
     phone_number: Optional[str] = None
     bio: Optional[str] = None
     
-    @validator('username')
+    @field_validator('username')
+    @classmethod
     def validate_username(cls, v):
         if v is not None and len(v) < 3:
             raise ValueError('Username must be at least 3 characters long')
         return v
 
-class UserResponse(UserBase):
-    id: int
+class UserResponse(ORMFastMixin, _TimestampedModel, UserBase):
     is_active: bool
     is_verified: bool
-    created_at: datetime
-    updated_at: Optional[datetime] = None
     last_login: Optional[datetime] = None
     profile_picture: Optional[str] = None
     bio: Optional[str] = None
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra='forbid', strict=True)
 
-class UserProfile(BaseModel):
+class UserProfile(ORMFastMixin, BaseModel):
     id: int
     username: str
     email: str
@@ -61,12 +61,13 @@ class UserProfile(BaseModel):
     total_interviews: Optional[int] = 0
     credits_balance: Optional[int] = 0
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra='forbid', strict=True)
 
-class UserStats(BaseModel):
+class UserStats(StatsStruct):
     total_users: int
     active_users: int
     new_users_this_month: int
     total_companies: int
 
+# Compiled once and reused for user list serialization
+USER_LIST_ADAPTER = get_adapter(List[UserResponse])
@@ -0,0 +1,246 @@
+"""
+Bulk resume extraction and match scoring through the OpenAI Batch API
+
+Submitting a batch starts a background poller that writes the results back once
+OpenAI finishes it (within 24h); GET /candidates/batch/{batch_id} does the same on demand.
+"""
+
+import asyncio
+import io
+import logging
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import orjson
+from sqlalchemy.orm import Session
+
+from ..core.config import settings
+from ..core.database import SessionLocal
+from ..models.candidate import Candidate
+from ..models.job import Job
+from ..models.resume import Resume
+from .ai_service_backup import (
+    _client,
+    build_match_score_request,
+    build_resume_extraction_request,
+    parse_match_score_result,
+)
+
+logger = logging.getLogger(__name__)
+
+# Batch statuses after which OpenAI won't change the batch again
+_FINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+# Running pollers; referenced here so they aren't garbage collected mid-poll
+_pollers: Set[asyncio.Task] = set()
+
+def _batch_line(custom_id: str, body: Dict[str, Any]) -> bytes:
+    """One JSONL request line for the chat completions batch endpoint"""
+    return orjson.dumps({
+        "custom_id": custom_id,
+        "method": "POST",
+        "url": "/v1/chat/completions",
+        "body": body
+    })
+
+async def _submit_batch(lines: List[bytes], description: str) -> Optional[str]:
+    """Upload the request lines and start a batch, returning its id"""
+    if _client is None or not lines:
+        return None
+    
+    batch_file = await _client.files.create(
+        file=("batch.jsonl", io.BytesIO(b"\n".join(lines))),
+        purpose="batch"
+    )
+    batch = await _client.batches.create(
+        input_file_id=batch_file.id,
+        endpoint="/v1/chat/completions",
+        completion_window="24h",
+        metadata={"description": description}
+    )
+    return batch.id
+
+async def submit_resume_extraction_batch(resumes: List[Resume]) -> Optional[str]:
+    """Queue AI extraction for resumes whose text has already been extracted"""
+    lines = [
+        _batch_line(f"extract:{resume.id}", build_resume_extraction_request(resume.extracted_text))
+        for resume in resumes
+        if resume.extracted_text
+    ]
+    return await _submit_batch(lines, "resume extraction")
+
+async def submit_match_score_batch(job: Job, resumes: List[Resume]) -> Optional[str]:
+    """Queue match scoring of the resumes against a job"""
+    lines = [
+        _batch_line(f"match:{job.id}:{resume.id}", build_match_score_request(resume, job))
+        for resume in resumes
+    ]
+    return await _submit_batch(lines, f"match scoring for job {job.id}")
+
+async def submit_pending_resume_extractions(db: Session, limit: int = 1000) -> Optional[str]:
+    """Send pending resumes to a batch and mark them processing until its results arrive"""
+    resumes = db.query(Resume).filter(
+        Resume.processing_status == "pending",
+        Resume.extracted_text.isnot(None)
+    ).limit(limit).all()
+    
+    batch_id = await submit_resume_extraction_batch(resumes)
+    if batch_id:
+        for resume in resumes:
+            resume.processing_status = "processing"
+        db.commit()
+        start_polling(batch_id)
+    return batch_id
+
+async def submit_job_match_scoring(job: Job, db: Session) -> Optional[str]:
+    """Send the processed resumes of a job's candidates to a match scoring batch"""
+    resumes = db.query(Resume).join(Candidate, Candidate.resume_id == Resume.id).filter(
+        Candidate.job_id == job.id,
+        Resume.is_processed == True
+    ).distinct().all()
+    
+    batch_id = await submit_match_score_batch(job, resumes)
+    if batch_id:
+        start_polling(batch_id)
+    return batch_id
+
+def _apply_extraction(db: Session, resume_id: int, content: str):
+    """Store extracted fields on the resume, as process_resume does for live extraction"""
+    resume = db.query(Resume).filter(Resume.id == resume_id).first()
+    if not resume:
+        return
+    
+    try:
+        extracted = orjson.loads(content)
+    except orjson.JSONDecodeError:
+        extracted = None
+    if not isinstance(extracted, dict):
+        resume.processing_status = "failed"
+        resume.processing_error = "Batch extraction returned invalid JSON"
+        return
+    
+    resume.candidate_name = extracted.get("candidate_name")
+    resume.candidate_email = extracted.get("candidate_email")
+    resume.candidate_phone = extracted.get("candidate_phone")
+    resume.skills = extracted.get("skills", [])
+    resume.experience = extracted.get("experience", [])
+    resume.education = extracted.get("education", [])
+    resume.certifications = extracted.get("certifications", [])
+    resume.ai_summary = extracted.get("summary")
+    resume.is_processed = True
+    resume.processing_status = "completed"
+    resume.processed_at = datetime.utcnow()
+    resume.processing_error = None
+
+def _apply_match_score(db: Session, job_id: int, resume_id: int, content: str):
+    """Store the match result on the candidates linking this resume to the job"""
+    result = parse_match_score_result(content)
+    candidates = db.query(Candidate).filter(
+        Candidate.job_id == job_id,
+        Candidate.resume_id == resume_id
+    ).all()
+    for candidate in candidates:
+        candidate.match_score = result["match_score"]
+        candidate.is_qualified = result["is_qualified"]
+        candidate.match_details = result["match_details"]
+
+def _fail_extraction(db: Session, resume_id: int, error: str):
+    """Mark a resume whose batch extraction didn't produce a result"""
+    resume = db.query(Resume).filter(Resume.id == resume_id).first()
+    if resume and resume.processing_status == "processing":
+        resume.processing_status = "failed"
+        resume.processing_error = error
+
+async def _file_lines(file_id: Optional[str]) -> List[str]:
+    """Non-empty lines of a batch input/output/error file"""
+    if not file_id:
+        return []
+    content = await _client.files.content(file_id)
+    return [line for line in content.text.splitlines() if line.strip()]
+
+async def _submitted_resumes(batch, db: Session) -> List[Resume]:
+    """Resumes from the batch's extraction requests that are still waiting on it"""
+    resume_ids = []
+    for line in await _file_lines(batch.input_file_id):
+        kind, *ids = orjson.loads(line)["custom_id"].split(":")
+        if kind == "extract":
+            resume_ids.append(int(ids[0]))
+    if not resume_ids:
+        return []
+    return db.query(Resume).filter(
+        Resume.id.in_(resume_ids),
+        Resume.processing_status == "processing"
+    ).all()
+
+def _parse_result_line(line: str) -> Tuple[str, List[int], Optional[str]]:
+    """Split one output line into its kind, ids and reply content (None if the request failed)"""
+    item = orjson.loads(line)
+    kind, *ids = item["custom_id"].split(":")
+    response = item.get("response") or {}
+    if response.get("status_code") != 200:
+        logger.warning("Batch request %s failed: %s", item["custom_id"], item.get("error"))
+        return kind, [int(i) for i in ids], None
+    return kind, [int(i) for i in ids], response["body"]["choices"][0]["message"]["content"]
+
+async def apply_batch_results(batch_id: str, db: Session) -> Optional[str]:
+    """
+    Write a finished batch's results back to the database.
+    Returns the batch status (None without an OpenAI key); results are applied once it is final.
+    """
+    if _client is None:
+        return None
+    
+    batch = await _client.batches.retrieve(batch_id)
+    if batch.status not in _FINAL_STATUSES:
+        return batch.status
+    
+    if batch.status != "completed":
+        # Nothing came back: put the resumes back in the queue so the next batch retries them
+        for resume in await _submitted_resumes(batch, db):
+            resume.processing_status = "pending"
+        db.commit()
+        logger.warning("Batch %s ended with status %s", batch_id, batch.status)
+        return batch.status
+    
+    lines = await _file_lines(batch.output_file_id) + await _file_lines(batch.error_file_id)
+    for line in lines:
+        # One malformed line skips that item only, not the rest of the batch
+        try:
+            kind, ids, content = _parse_result_line(line)
+            if kind == "extract":
+                if content is None:
+                    _fail_extraction(db, ids[0], "Batch extraction request failed")
+                else:
+                    _apply_extraction(db, ids[0], content)
+            elif kind == "match" and content is not None:
+                _apply_match_score(db, ids[0], ids[1], content)
+        except (orjson.JSONDecodeError, KeyError, IndexError, TypeError, ValueError, AttributeError) as e:
+            logger.warning("Skipping malformed line in batch %s: %s", batch_id, e)
+    
+    # Anything without a usable result line would otherwise stay "processing" forever
+    db.flush()
+    for resume in await _submitted_resumes(batch, db):
+        resume.processing_status = "failed"
+        resume.processing_error = "Batch returned no result for this resume"
+    
+    db.commit()
+    return batch.status
+
+async def poll_batch(batch_id: str):
+    """Background task applying a batch's results once OpenAI has finished it"""
+    while True:
+        await asyncio.sleep(settings.AI_BATCH_POLL_SECONDS)
+        try:
+            with SessionLocal() as db:
+                batch_status = await apply_batch_results(batch_id, db)
+        except Exception:
+            logger.exception("Polling batch %s failed", batch_id)
+            continue
+        if batch_status is None or batch_status in _FINAL_STATUSES:
+            return
+
+def start_polling(batch_id: str):
+    """Poll the batch in the background until its results have been applied"""
+    task = asyncio.create_task(poll_batch(batch_id))
+    _pollers.add(task)
+    task.add_done_callback(_pollers.discard)
@@ -2,15 +2,24 @@
 Multi-Provider AI service with Google AI, DeepSeek, OpenAI, and offline fallbacks
 """
 
+import asyncio
 import openai
 import httpx
 import json
+import orjson
+import msgspec
 import logging
 from typing import Dict, List, Any, Optional, Union
 from datetime import datetime
 import re
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+import os
+import threading
+import hashlib
+import joblib
+from cachetools import LRUCache
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential_jitter
+from sklearn.feature_extraction.text import HashingVectorizer, TfidfTransformer
+from sklearn.preprocessing import normalize
 import numpy as np
 
 from ..core.config import settings
@@ -18,6 +27,142 @@ from .google_ai_service import google_ai_service
 
 logger = logging.getLogger(__name__)
 
+# Precompiled patterns for offline extraction and response parsing
+_EXP_RE = re.compile(
+    r'(\d+)\+?\s*years?\s*(?:of\s*)?experience'
+    r'|(\d+)\+?\s*years?\s*in'
+    r'|experience\s*:\s*(\d+)\+?\s*years?',
+    re.IGNORECASE
+)
+_JOB_IND_RE = re.compile(r'\b(software engineer|developer|analyst|manager|specialist)\b', re.IGNORECASE)
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b')
+_PHONE_RE = re.compile(r'[+]?[1-9]?[0-9]{7,15}')
+_JSON_DECODER = json.JSONDecoder()
+# Stable serialization for cache-key fingerprints
+_KEY_DUMP_OPTIONS = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+
+# Only the parts of a chat completion reply that are read; other keys are skipped when decoding
+class _ChatMessage(msgspec.Struct):
+    content: Optional[str] = None
+
+class _ChatChoice(msgspec.Struct):
+    message: _ChatMessage
+
+class _ChatCompletion(msgspec.Struct):
+    choices: List[_ChatChoice]
+
+_CHAT_COMPLETION_DECODER = msgspec.json.Decoder(_ChatCompletion)
+
+def _keep_top(matches: List[Dict[str, Any]], top_k: Optional[int]) -> List[Dict[str, Any]]:
+    """Keep the best top_k of ranked matches; None (or 0) keeps them all"""
+    return matches[:top_k] if top_k else matches
+
+_RACE_STAGGER = 0.5  # Seconds between starting each configured provider in _race_providers
+
+# Concurrent DeepSeek match requests are grouped into one call
+_MATCH_BATCH_SIZE = 16
+_MATCH_BATCH_WINDOW = 0.01  # Seconds to wait for more requests to join a batch
+_MATCH_BATCH_MAX_CANDIDATES = 40  # Candidates per call, so every score fits in one completion
+_MATCH_TOKENS_PER_CANDIDATE = 80  # Completion budget for one score with its reasons
+_MATCH_MAX_TOKENS = 8192  # DeepSeek's completion limit
+_MATCH_RESULT_TIMEOUT = 90.0  # Seconds a caller waits for its batch before falling back
+_FALLBACK_SKILLS_RE = re.compile(r'skill[s]?[:\-\s]*([^\n,]+)', re.IGNORECASE)
+
+# Skills recognized by offline extraction
+COMMON_SKILLS = (
+    # Programming languages
+    "python", "javascript", "java", "c++", "c#", "php", "ruby", "go", "rust", "swift",
+    # Frameworks
+    "react", "angular", "vue", "django", "flask", "fastapi", "spring", "express",
+    # Databases
+    "mysql", "postgresql", "mongodb", "redis", "elasticsearch",
+    # Cloud & DevOps
+    "aws", "azure", "gcp", "docker", "kubernetes", "jenkins", "terraform",
+    # Other technical skills
+    "machine learning", "ai", "data science", "sql", "git", "linux", "api"
+)
+
+# Keywords that mark a resume line as education
+_EDU_KEYWORDS = (
+    "bachelor", "master", "phd", "doctorate", "mba", "degree",
+    "university", "college", "institute", "school"
+)
+
+# Template interview questions used when no provider is available
+_TECH_JOB_KEYWORDS = ('python', 'programming', 'software', 'developer')
+_TECHNICAL_QUESTIONS = (
+    {
+        "question": "Can you walk me through your experience with Python development?",
+        "type": "technical",
+        "category": "experience",
+        "expected_duration": 300
+    },
+    {
+        "question": "Describe a challenging technical problem you solved recently.",
+        "type": "technical",
+        "category": "problem_solving",
+        "expected_duration": 300
+    }
+)
+_GENERAL_QUESTIONS = (
+    {
+        "question": "Tell me about yourself and your professional background.",
+        "type": "general",
+        "category": "introduction",
+        "expected_duration": 180
+    },
+    {
+        "question": "Why are you interested in this position?",
+        "type": "general",
+        "category": "motivation",
+        "expected_duration": 120
+    },
+    {
+        "question": "What are your greatest strengths?",
+        "type": "behavioral",
+        "category": "strengths",
+        "expected_duration": 120
+    },
+    {
+        "question": "Describe a time when you had to work under pressure.",
+        "type": "behavioral",
+        "category": "stress_management",
+        "expected_duration": 180
+    },
+    {
+        "question": "Where do you see yourself in 5 years?",
+        "type": "general",
+        "category": "career_goals",
+        "expected_duration": 120
+    }
+)
+
+# Single-word skills are matched by token lookup, multi-word ones by scanning
+_SINGLE_WORD_SKILLS = frozenset(skill for skill in COMMON_SKILLS if " " not in skill)
+_MULTI_WORD_SKILLS = [skill for skill in COMMON_SKILLS if " " in skill]
+_SKILL_TOKEN_RE = re.compile(r'[a-z0-9+#]+')
+
+# Aho-Corasick automaton over multi-word skills (falls back to per-skill scans if unavailable)
+try:
+    import ahocorasick
+    _SKILL_AC = ahocorasick.Automaton()
+    for _skill in _MULTI_WORD_SKILLS:
+        _SKILL_AC.add_word(_skill, _skill)
+    _SKILL_AC.make_automaton()
+except ImportError:
+    logger.warning("pyahocorasick not available, using per-skill substring scans")
+    _SKILL_AC = None
+
+# Redis persists the response cache across restarts (optional)
+try:
+    import redis.asyncio as aioredis
+except ImportError:
+    aioredis = None
+
+def _is_whole_word(text: str, start: int, end: int) -> bool:
+    """Check that text[start:end] is not part of a longer word"""
+    return (start == 0 or not text[start - 1].isalnum()) and (end == len(text) or not text[end].isalnum())
+
 class MultiProviderAIService:
     """
     Multi-provider AI service with intelligent fallbacks:
@@ -33,42 +178,140 @@ class MultiProviderAIService:
         self.openai_api_key = settings.OPENAI_API_KEY
         self.deepseek_base_url = "https://api.deepseek.com/v1"
         
+        # DeepSeek client is created on first use and reused for keep-alive
+        self._deepseek_client: Optional[httpx.AsyncClient] = None
+        
+        # Match batching worker is started on first use, inside the running loop
+        self._match_queue: Optional[asyncio.Queue] = None
+        self._match_worker: Optional[asyncio.Task] = None
+        
         # Initialize OpenAI client if key available
+        self._openai = None
         if self.openai_api_key:
-            openai.api_key = self.openai_api_key
-        
-        # Initialize TF-IDF vectorizer for offline matching
-        self.vectorizer = TfidfVectorizer(
+            self._openai = openai.AsyncOpenAI(api_key=self.openai_api_key, timeout=15.0, max_retries=2)
+        
+        # Stateless hashing vectorizer for offline matching (no vocabulary to fit)
+        self.hasher = HashingVectorizer(
+            n_features=2 ** 18,
+            alternate_sign=False,
+            ngram_range=(1, 2),
+            norm=None,
             stop_words='english',
-            max_features=1000,
-            ngram_range=(1, 2)
+            lowercase=False  # Callers pass already-lowercased text
         )
+        
+        # IDF weights are fitted once on a bootstrap corpus, then only transformed
+        self.idf_transformer = TfidfTransformer(norm='l2')
+        self._idf_fitted = False
+        self._bootstrap_corpus: List[str] = []
+        self._idf_lock = threading.Lock()  # Offline analysis runs in worker threads
+        self._load_idf_transformer()
+        
+        # Job requirement vectors, reused when one job is scored against many resumes
+        self._job_vec_cache = LRUCache(maxsize=128)
+        self._job_vec_lock = threading.Lock()
+        
+        # Provider responses keyed by a hash of their inputs; Redis backs the LRU when configured
+        self._cache = LRUCache(maxsize=settings.AI_CACHE_SIZE)
+        self._redis = None
+        if settings.REDIS_URL:
+            if aioredis:
+                self._redis = aioredis.from_url(settings.REDIS_URL)
+            else:
+                logger.warning("redis package not available, AI response cache is in-process only")
+    
+    def _load_idf_transformer(self):
+        """Load previously fitted IDF weights from disk if available"""
+        path = settings.TFIDF_WEIGHTS_PATH
+        if not os.path.exists(path):
+            return
+        try:
+            self.idf_transformer = joblib.load(path)
+            self._idf_fitted = True
+            logger.info(f"Loaded fitted IDF weights from {path}")
+        except Exception as e:
+            logger.warning(f"Could not load IDF weights from {path}: {e}")
+    
+    def _save_idf_transformer(self):
+        """Persist the fitted IDF weights so restarts don't refit"""
+        path = settings.TFIDF_WEIGHTS_PATH
+        try:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            joblib.dump(self.idf_transformer, path)
+        except Exception as e:
+            logger.warning(f"Could not save IDF weights to {path}: {e}")
+    
+    def _tfidf_transform(self, texts: List[str]):
+        """Vectorize texts into L2-normalized rows, applying IDF weights once they are fitted"""
+        counts = self.hasher.transform(texts)
+        if self._idf_fitted:
+            return self.idf_transformer.transform(counts)
+        
+        with self._idf_lock:
+            if not self._idf_fitted:
+                self._bootstrap_corpus.extend(texts)
+                if len(self._bootstrap_corpus) >= settings.TFIDF_BOOTSTRAP_DOCS:
+                    self.idf_transformer.fit(self.hasher.transform(self._bootstrap_corpus))
+                    self._idf_fitted = True
+                    self._bootstrap_corpus = []
+                    self._save_idf_transformer()
+                    logger.info("Fitted shared IDF weights")
+            if self._idf_fitted:
+                return self.idf_transformer.transform(counts)
+        
+        # Not enough documents yet: plain term frequencies
+        return normalize(counts)
+    
+    @staticmethod
+    def _cache_key(kind: str, *parts: str) -> str:
+        """Content-addressed key for a provider call"""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(kind.encode())
+        for part in parts:
+            digest.update(b"|")
+            digest.update(part.encode())
+        return digest.hexdigest()
+    
+    async def _cache_get(self, key: str) -> Optional[Any]:
+        """Look up a cached provider response, falling through to Redis on an LRU miss"""
+        if key in self._cache:
+            return self._cache[key]
+        if self._redis is None:
+            return None
+        try:
+            raw = await self._redis.get(f"ai:{key}")
+        except Exception as e:
+            logger.warning(f"AI cache lookup failed: {e}")
+            return None
+        if raw is None:
+            return None
+        value = orjson.loads(raw)
+        self._cache[key] = value
+        return value
+    
+    async def _cache_store(self, key: str, value: Any) -> Any:
+        """Cache a provider response and return it"""
+        self._cache[key] = value
+        if self._redis is not None:
+            try:
+                await self._redis.set(f"ai:{key}", orjson.dumps(value, default=str), ex=settings.AI_CACHE_TTL)
+            except Exception as e:
+                logger.warning(f"AI cache write failed: {e}")
+        return value
     
     async def analyze_resume(self, resume_text: str, job_requirements: List[str] = None) -> Dict[str, Any]:
         """
         Analyze resume with multi-provider fallback
         """
+        key = self._cache_key("resume", resume_text, *(job_requirements or []))
+        cached = await self._cache_get(key)
+        if cached is not None:
+            return cached
+        
         try:
-            # Try Google AI first (most comprehensive)
-            if self.google_ai_api_key:
-                result = await google_ai_service.parse_resume_comprehensive(resume_text)
-                if result:
-                    logger.info("Resume analysis completed with Google AI")
-                    return self._format_resume_analysis(result, "google_ai")
-            
-            # Try DeepSeek second
-            if self.deepseek_api_key:
-                result = await self._analyze_resume_deepseek(resume_text, job_requirements)
-                if result:
-                    logger.info("Resume analysis completed with DeepSeek")
-                    return result
-            
-            # Fallback to OpenAI
-            if self.openai_api_key:
-                result = await self._analyze_resume_openai(resume_text, job_requirements)
-                if result:
-                    logger.info("Resume analysis completed with OpenAI")
-                    return result
+            result = await self._race_providers(resume_text, job_requirements)
+            if result:
+                return await self._cache_store(key, result)
             
             # Final fallback to offline analysis
             logger.info("Using offline resume analysis")
@@ -78,37 +321,121 @@ class MultiProviderAIService:
             logger.error(f"All AI providers failed, using offline analysis: {e}")
             return await self._analyze_resume_offline(resume_text, job_requirements)
     
+    async def _get_deepseek_client(self) -> httpx.AsyncClient:
+        """Return the shared DeepSeek client, creating it on first use"""
+        if self._deepseek_client is None:
+            self._deepseek_client = httpx.AsyncClient(
+                base_url=self.deepseek_base_url,
+                headers={"Authorization": f"Bearer {self.deepseek_api_key}"},
+                timeout=httpx.Timeout(20.0, connect=3.0),
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+                http2=True
+            )
+        return self._deepseek_client
+    
+    async def aclose(self):
+        """Close pooled provider connections; called on application shutdown"""
+        if self._match_worker is not None:
+            # The worker resolves its pending requests as it stops, so no caller is left waiting
+            self._match_worker.cancel()
+            try:
+                await self._match_worker
+            except asyncio.CancelledError:
+                pass
+            self._match_worker = None
+        if self._deepseek_client is not None:
+            await self._deepseek_client.aclose()
+            self._deepseek_client = None
+        if self._openai is not None:
+            await self._openai.close()
+        if self._redis is not None:
+            await self._redis.aclose()
+    
+    @staticmethod
+    def _max_tokens_for(prompt: str) -> int:
+        """Cap completion length, leaving less room when the prompt is short"""
+        return 800 if len(prompt) < 2000 else 1500
+    
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential_jitter(1, 8),
+        retry=retry_if_exception_type((httpx.TimeoutException, httpx.ConnectError)),
+        reraise=True
+    )
+    async def _post_deepseek(self, prompt: str, max_tokens: Optional[int] = None) -> httpx.Response:
+        """Send a chat completion request to DeepSeek, retrying transient network errors"""
+        client = await self._get_deepseek_client()
+        return await client.post(
+            "/chat/completions",
+            headers={"Content-Type": "application/json"},
+            content=orjson.dumps({
+                "model": "deepseek-chat",
+                "messages": [
+                    {"role": "system", "content": "You are an expert HR analyst. Analyze resumes and provide structured JSON responses."},
+                    {"role": "user", "content": prompt}
+                ],
+                "temperature": 0.3,
+                "max_tokens": max_tokens or self._max_tokens_for(prompt)
+            })
+        )
+    
+    async def _race_providers(self, resume_text: str, job_requirements: List[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Run the configured providers concurrently and return the first usable result.
+        Later providers start after a short stagger so the preferred order
+        (Google AI, DeepSeek, OpenAI) still wins when it answers promptly.
+        """
+        async def google_ai(resume_text: str, job_requirements: List[str] = None):
+            result = await google_ai_service.parse_resume_comprehensive(resume_text)
+            return self._format_resume_analysis(result, "google_ai") if result else None
+        
+        async def staggered(analyze, delay: float):
+            if delay:
+                await asyncio.sleep(delay)
+            return await analyze(resume_text, job_requirements)
+        
+        configured = []
+        if self.google_ai_api_key:
+            configured.append(("Google AI", google_ai))
+        if self.deepseek_api_key:
+            configured.append(("DeepSeek", self._analyze_resume_deepseek))
+        if self.openai_api_key:
+            configured.append(("OpenAI", self._analyze_resume_openai))
+        
+        # Stagger by position among the configured providers, so the first one always starts at once
+        providers = {
+            asyncio.create_task(staggered(analyze, _RACE_STAGGER * index)): name
+            for index, (name, analyze) in enumerate(configured)
+        }
+        
+        pending = set(providers)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is not None:
+                        logger.error(f"{providers[task]} analysis failed: {task.exception()}")
+                    elif task.result():
+                        logger.info(f"Resume analysis completed with {providers[task]}")
+                        return task.result()
+            return None
+        finally:
+            # Cancel the providers that lost the race
+            for task in pending:
+                task.cancel()
+    
     async def _analyze_resume_deepseek(self, resume_text: str, job_requirements: List[str] = None) -> Optional[Dict[str, Any]]:
         """Analyze resume using DeepSeek API"""
         try:
             prompt = self._build_resume_analysis_prompt(resume_text, job_requirements)
+            response = await self._post_deepseek(prompt)
             
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    f"{self.deepseek_base_url}/chat/completions",
-                    headers={
-                        "Authorization": f"Bearer {self.deepseek_api_key}",
-                        "Content-Type": "application/json"
-                    },
-                    json={
-                        "model": "deepseek-chat",
-                        "messages": [
-                            {"role": "system", "content": "You are an expert HR analyst. Analyze resumes and provide structured JSON responses."},
-                            {"role": "user", "content": prompt}
-                        ],
-                        "temperature": 0.3,
-                        "max_tokens": 1500
-                    },
-                    timeout=30.0
-                )
-                
-                if response.status_code == 200:
-                    result = response.json()
-                    content = result["choices"][0]["message"]["content"]
-                    return self._parse_ai_response(content, "deepseek")
-                else:
-                    logger.error(f"DeepSeek API error: {response.status_code}")
-                    return None
+            if response.status_code == 200:
+                content = self._completion_content(response.content)
+                return self._parse_ai_response(content, "deepseek")
+            else:
+                logger.error(f"DeepSeek API error: {response.status_code}")
+                return None
                     
         except Exception as e:
             logger.error(f"DeepSeek analysis failed: {e}")
@@ -119,14 +446,14 @@ class MultiProviderAIService:
         try:
             prompt = self._build_resume_analysis_prompt(resume_text, job_requirements)
             
-            response = await openai.ChatCompletion.acreate(
+            response = await self._openai.chat.completions.create(
                 model="gpt-3.5-turbo",
                 messages=[
                     {"role": "system", "content": "You are an expert HR analyst. Analyze resumes and provide structured JSON responses."},
                     {"role": "user", "content": prompt}
                 ],
                 temperature=0.3,
-                max_tokens=1500
+                max_tokens=self._max_tokens_for(prompt)
             )
             
             content = response.choices[0].message.content
@@ -137,18 +464,25 @@ class MultiProviderAIService:
             return None
     
     async def _analyze_resume_offline(self, resume_text: str, job_requirements: List[str] = None) -> Dict[str, Any]:
+        """Offline resume analysis, run in a worker thread so it doesn't block the event loop"""
+        return await asyncio.to_thread(self._analyze_resume_offline_sync, resume_text, job_requirements)
+    
+    def _analyze_resume_offline_sync(self, resume_text: str, job_requirements: List[str] = None) -> Dict[str, Any]:
         """Offline resume analysis using rule-based algorithms"""
         
+        # Lowercase once and share with every extractor
+        text_lower = resume_text.lower()
+        
         # Extract basic information using regex patterns
-        skills = self._extract_skills_offline(resume_text)
+        skills = self._extract_skills_offline(resume_text, text_lower)
         experience = self._extract_experience_offline(resume_text)
-        education = self._extract_education_offline(resume_text)
+        education = self._extract_education_offline(resume_text, text_lower)
         contact_info = self._extract_contact_info_offline(resume_text)
         
         # Calculate match score if job requirements provided
         match_score = 0.0
         if job_requirements:
-            match_score = self._calculate_offline_match_score(resume_text, job_requirements)
+            match_score = self._calculate_offline_match_score(text_lower, job_requirements)
         
         return {
             "provider": "offline",
@@ -170,102 +504,97 @@ class MultiProviderAIService:
             "processing_time": 0.1
         }
     
-    def _extract_skills_offline(self, text: str) -> List[str]:
+    def _extract_skills_offline(self, text: str, text_lower: Optional[str] = None) -> List[str]:
         """Extract skills using keyword matching"""
-        common_skills = [
-            # Programming languages
-            "python", "javascript", "java", "c++", "c#", "php", "ruby", "go", "rust", "swift",
-            # Frameworks
-            "react", "angular", "vue", "django", "flask", "fastapi", "spring", "express",
-            # Databases
-            "mysql", "postgresql", "mongodb", "redis", "elasticsearch",
-            # Cloud & DevOps
-            "aws", "azure", "gcp", "docker", "kubernetes", "jenkins", "terraform",
-            # Other technical skills
-            "machine learning", "ai", "data science", "sql", "git", "linux", "api"
-        ]
-        
-        text_lower = text.lower()
-        found_skills = []
+        if text_lower is None:
+            text_lower = text.lower()
+        
+        # Tokenize once and intersect with the single-word skills
+        found = set(_SKILL_TOKEN_RE.findall(text_lower)) & _SINGLE_WORD_SKILLS
+        
+        if _SKILL_AC is not None:
+            for end, skill in _SKILL_AC.iter(text_lower):
+                if _is_whole_word(text_lower, end - len(skill) + 1, end + 1):
+                    found.add(skill)
+        else:
+            for skill in _MULTI_WORD_SKILLS:
+                idx = text_lower.find(skill)
+                while idx != -1:
+                    if _is_whole_word(text_lower, idx, idx + len(skill)):
+                        found.add(skill)
+                        break
+                    idx = text_lower.find(skill, idx + 1)
         
-        for skill in common_skills:
-            if skill in text_lower:
-                found_skills.append(skill.title())
+        # Keep the declared skill order so results are stable
+        found_skills = [skill.title() for skill in COMMON_SKILLS if skill in found]
         
         return found_skills[:10]  # Return top 10 skills
     
     def _extract_experience_offline(self, text: str) -> int:
         """Extract years of experience using regex"""
-        patterns = [
-            r'(\d+)\+?\s*years?\s*(?:of\s*)?experience',
-            r'(\d+)\+?\s*years?\s*in',
-            r'experience\s*:\s*(\d+)\+?\s*years?',
-        ]
-        
-        for pattern in patterns:
-            matches = re.findall(pattern, text.lower())
-            if matches:
-                return int(matches[0])
+        # One scan for all phrasings; exactly one group is set on a match
+        match = _EXP_RE.search(text)
+        if match:
+            return int(next(group for group in match.groups() if group))
         
         # Fallback: count job positions (rough estimate)
-        job_indicators = len(re.findall(r'\b(software engineer|developer|analyst|manager|specialist)\b', text.lower()))
+        job_indicators = len(_JOB_IND_RE.findall(text))
         return min(job_indicators * 2, 15)  # Estimate 2 years per position, max 15
     
-    def _extract_education_offline(self, text: str) -> List[str]:
+    def _extract_education_offline(self, text: str, text_lower: Optional[str] = None) -> List[str]:
         """Extract education information"""
-        education_keywords = [
-            "bachelor", "master", "phd", "doctorate", "mba", "degree",
-            "university", "college", "institute", "school"
-        ]
-        
         education = []
-        text_lower = text.lower()
-        
-        for keyword in education_keywords:
-            if keyword in text_lower:
-                # Try to extract the full education line
-                lines = text.split('\n')
-                for line in lines:
-                    if keyword in line.lower():
-                        education.append(line.strip())
-                        break
+        if text_lower is None:
+            text_lower = text.lower()
         
-        return education[:3]  # Return top 3 education entries
+        # Walk the lines once, keeping each line that mentions any keyword
+        for line, line_lower in zip(text.splitlines(), text_lower.splitlines()):
+            if any(keyword in line_lower for keyword in _EDU_KEYWORDS):
+                education.append(line.strip())
+                if len(education) == 3:
+                    break
+        
+        return education  # Return top 3 education entries
     
     def _extract_contact_info_offline(self, text: str) -> Dict[str, str]:
         """Extract contact information"""
         contact = {}
         
         # Email pattern
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        emails = re.findall(email_pattern, text)
-        if emails:
-            contact["email"] = emails[0]
+        email_match = _EMAIL_RE.search(text)
+        if email_match:
+            contact["email"] = email_match.group()
         
         # Phone pattern
-        phone_pattern = r'[\+]?[1-9]?[0-9]{7,15}'
-        phones = re.findall(phone_pattern, text)
-        if phones:
-            contact["phone"] = phones[0]
+        phone_match = _PHONE_RE.search(text)
+        if phone_match:
+            contact["phone"] = phone_match.group()
         
         return contact
     
-    def _calculate_offline_match_score(self, resume_text: str, job_requirements: List[str]) -> float:
-        """Calculate match score using TF-IDF similarity"""
+    def _job_vector(self, job_requirements: List[str]):
+        """TF-IDF vector for a set of job requirements, cached per requirement set"""
+        requirements = tuple(sorted(job_requirements))
+        # Vectors built before the IDF weights were fitted are not reused afterwards
+        key = (self._idf_fitted, requirements)
+        with self._job_vec_lock:
+            vector = self._job_vec_cache.get(key)
+        if vector is None:
+            vector = self._tfidf_transform([" ".join(requirements).lower()])
+            with self._job_vec_lock:
+                self._job_vec_cache[key] = vector
+        return vector
+    
+    def _calculate_offline_match_score(self, resume_lower: str, job_requirements: List[str]) -> float:
+        """Calculate match score using TF-IDF similarity (expects already-lowercased resume text)"""
         try:
-            # Combine job requirements into single text
-            job_text = " ".join(job_requirements)
+            resume_vector = self._tfidf_transform([resume_lower])
+            job_vector = self._job_vector(job_requirements)
             
-            # Create corpus
-            corpus = [resume_text.lower(), job_text.lower()]
+            # Rows are L2-normalized, so cosine similarity is a sparse dot product
+            similarity = resume_vector.multiply(job_vector).sum()
             
-            # Calculate TF-IDF vectors
-            tfidf_matrix = self.vectorizer.fit_transform(corpus)
-            
-            # Calculate cosine similarity
-            similarity = cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:2])
-            
-            return float(similarity[0][0])
+            return float(similarity)
             
         except Exception as e:
             logger.error(f"Offline match score calculation failed: {e}")
@@ -302,14 +631,32 @@ class MultiProviderAIService:
         
         return prompt
     
+    @staticmethod
+    def _completion_content(body: bytes) -> str:
+        """Decode a chat completion body and return the first choice's message text"""
+        completion = _CHAT_COMPLETION_DECODER.decode(body)
+        return completion.choices[0].message.content or ""
+    
+    @staticmethod
+    def _decode_json_object(content: str) -> Optional[Any]:
+        """Decode the first JSON object in a provider reply in a single pass"""
+        start = content.find('{')
+        if start < 0:
+            return None
+        try:
+            # Fast path: the reply is nothing but the JSON object
+            return orjson.loads(content[start:])
+        except orjson.JSONDecodeError:
+            try:
+                return _JSON_DECODER.raw_decode(content, start)[0]
+            except ValueError:
+                return None
+    
     def _parse_ai_response(self, content: str, provider: str) -> Dict[str, Any]:
         """Parse AI response and structure it"""
         try:
-            # Try to extract JSON from response
-            json_match = re.search(r'\{.*\}', content, re.DOTALL)
-            if json_match:
-                analysis = json.loads(json_match.group())
-            else:
+            analysis = self._decode_json_object(content)
+            if analysis is None:
                 # Fallback parsing
                 analysis = self._fallback_parse_response(content)
             
@@ -341,7 +688,7 @@ class MultiProviderAIService:
     def _fallback_parse_response(self, content: str) -> Dict[str, Any]:
         """Fallback parsing when JSON extraction fails"""
         return {
-            "skills": re.findall(r'skill[s]?[:\-\s]*([^\n,]+)', content.lower())[:5],
+            "skills": [skill.lower() for skill in _FALLBACK_SKILLS_RE.findall(content)[:5]],
             "experience_years": 0,
             "education": [],
             "match_score": 0.5,
@@ -350,35 +697,163 @@ class MultiProviderAIService:
             "recommendations": ["Review manually", "Verify information"]
         }
 
-    async def match_candidates(self, job_description: str, candidates: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    async def match_candidates(self, job_description: str, candidates: List[Dict[str, Any]], top_k: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Match candidates to job with multi-provider fallback
+        Returns every candidate ranked, or only the best top_k when it is given
         """
+        key = self._cache_key(
+            "match", job_description, str(top_k),
+            *sorted(orjson.dumps(candidate, option=_KEY_DUMP_OPTIONS, default=str).decode() for candidate in candidates)
+        )
+        cached = await self._cache_get(key)
+        if cached is not None:
+            return cached
+        
         try:
             # Try DeepSeek first
             if self.deepseek_api_key:
-                result = await self._match_candidates_deepseek(job_description, candidates)
+                result = await self._match_candidates_deepseek(job_description, candidates, top_k)
                 if result:
                     logger.info("Candidate matching completed with DeepSeek")
-                    return result
+                    return await self._cache_store(key, _keep_top(result, top_k))
             
             # Fallback to OpenAI
             if self.openai_api_key:
                 result = await self._match_candidates_openai(job_description, candidates)
                 if result:
                     logger.info("Candidate matching completed with OpenAI")
-                    return result
+                    return await self._cache_store(key, _keep_top(result, top_k))
             
             # Final fallback to offline matching
             logger.info("Using offline candidate matching")
-            return await self._match_candidates_offline(job_description, candidates)
+            return await self._match_candidates_offline(job_description, candidates, top_k)
             
         except Exception as e:
             logger.error(f"All AI providers failed for matching, using offline: {e}")
-            return await self._match_candidates_offline(job_description, candidates)
+            return await self._match_candidates_offline(job_description, candidates, top_k)
+    
+    async def _match_candidates_deepseek(self, job_description: str, candidates: List[Dict[str, Any]], top_k: Optional[int] = None) -> Optional[List[Dict[str, Any]]]:
+        """Match candidates with DeepSeek, sharing one request with concurrent callers"""
+        if not candidates:
+            return []
+        if self._match_worker is None or self._match_worker.done():
+            self._match_queue = asyncio.Queue()
+            self._match_worker = asyncio.create_task(self._run_match_batches())
+        
+        future = asyncio.get_running_loop().create_future()
+        await self._match_queue.put((job_description, candidates, future))
+        try:
+            result = await asyncio.wait_for(future, _MATCH_RESULT_TIMEOUT)
+        except asyncio.TimeoutError:
+            logger.error("DeepSeek batch matching timed out")
+            return None
+        return result
     
-    async def _match_candidates_offline(self, job_description: str, candidates: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Offline candidate matching using TF-IDF similarity"""
+    async def _run_match_batches(self):
+        """Collect queued match requests for a short window and send each batch as one request"""
+        loop = asyncio.get_running_loop()
+        batch: List[tuple] = []
+        carry = None  # Request that didn't fit the previous batch; it opens the next one
+        try:
+            while True:
+                batch = [carry or await self._match_queue.get()]
+                carry = None
+                total_candidates = len(batch[0][1])
+                deadline = loop.time() + _MATCH_BATCH_WINDOW
+                while len(batch) < _MATCH_BATCH_SIZE:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        item = await asyncio.wait_for(self._match_queue.get(), remaining)
+                    except asyncio.TimeoutError:
+                        break
+                    if total_candidates + len(item[1]) > _MATCH_BATCH_MAX_CANDIDATES:
+                        carry = item
+                        break
+                    batch.append(item)
+                    total_candidates += len(item[1])
+                
+                try:
+                    results = await self._match_batch_deepseek([(job, cands) for job, cands, _ in batch])
+                except Exception as e:
+                    logger.error(f"DeepSeek batch matching failed: {e}")
+                    results = [None] * len(batch)
+                
+                for (_, _, future), result in zip(batch, results):
+                    if not future.done():
+                        future.set_result(result)
+                batch = []
+        finally:
+            # On shutdown, answer everything still pending with None so callers fall back
+            pending = batch + ([carry] if carry else [])
+            while not self._match_queue.empty():
+                pending.append(self._match_queue.get_nowait())
+            for _, _, future in pending:
+                if not future.done():
+                    future.set_result(None)
+    
+    async def _match_batch_deepseek(self, batch: List[tuple]) -> List[Optional[List[Dict[str, Any]]]]:
+        """Score several (job description, candidates) pairs in a single DeepSeek call"""
+        prompt_parts = [
+            "Score how well each candidate fits its job from 0 to 1.",
+            'Respond with JSON only: {"jobs": [[{"candidate": <index>, "match_score": <0-1>, '
+            '"match_reasons": ["..."]}, ...], ...]} with one list per job, in the order given.'
+        ]
+        for job_index, (job_description, candidates) in enumerate(batch):
+            prompt_parts.append(f"\nJob {job_index}: {job_description}")
+            for candidate_index, candidate in enumerate(candidates):
+                skills = ", ".join(candidate.get('skills') or [])
+                resume = (candidate.get('resume_text') or "")[:500]
+                prompt_parts.append(
+                    f"  Candidate {candidate_index}: skills: {skills}; "
+                    f"experience: {candidate.get('experience_years', 0)} years; resume: {resume}"
+                )
+        
+        # Every candidate needs room for its score and reasons, or the JSON gets cut off
+        total_candidates = sum(len(candidates) for _, candidates in batch)
+        max_tokens = min(_MATCH_MAX_TOKENS, 200 + total_candidates * _MATCH_TOKENS_PER_CANDIDATE)
+        response = await self._post_deepseek("\n".join(prompt_parts), max_tokens=max_tokens)
+        if response.status_code != 200:
+            logger.error(f"DeepSeek API error: {response.status_code}")
+            return [None] * len(batch)
+        
+        content = self._completion_content(response.content)
+        parsed = self._decode_json_object(content) or {}
+        scored_jobs = parsed.get("jobs") or []
+        
+        results = []
+        for job_index, (_, candidates) in enumerate(batch):
+            if job_index >= len(scored_jobs):
+                results.append(None)
+                continue
+            scored = {}
+            for score in scored_jobs[job_index]:
+                index = score.get("candidate") if isinstance(score, dict) else None
+                if not isinstance(index, int) or not 0 <= index < len(candidates):
+                    continue
+                candidate = dict(candidates[index])
+                candidate['match_score'] = float(score.get("match_score", 0))
+                candidate['match_provider'] = 'deepseek'
+                candidate['match_reasons'] = score.get("match_reasons") or []
+                scored[index] = candidate
+            
+            # A partial answer would silently drop candidates; let the caller fall back instead
+            if len(scored) != len(candidates):
+                logger.warning(f"DeepSeek scored {len(scored)} of {len(candidates)} candidates, falling back")
+                results.append(None)
+                continue
+            matched = sorted(scored.values(), key=lambda x: x['match_score'], reverse=True)
+            results.append(matched)
+        return results
+    
+    async def _match_candidates_offline(self, job_description: str, candidates: List[Dict[str, Any]], top_k: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Offline candidate matching, run in a worker thread so it doesn't block the event loop"""
+        return await asyncio.to_thread(self._match_candidates_offline_sync, job_description, candidates, top_k)
+    
+    def _match_candidates_offline_sync(self, job_description: str, candidates: List[Dict[str, Any]], top_k: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Offline candidate matching using TF-IDF similarity, optionally keeping only the top_k"""
         
         if not candidates:
             return []
@@ -399,26 +874,34 @@ class MultiProviderAIService:
             
             # Calculate similarities
             all_texts = [job_text] + candidate_texts
-            tfidf_matrix = self.vectorizer.fit_transform(all_texts)
+            tfidf_matrix = self._tfidf_transform(all_texts)
             
             # Calculate similarity scores
             job_vector = tfidf_matrix[0:1]
             candidate_vectors = tfidf_matrix[1:]
             
-            similarities = cosine_similarity(job_vector, candidate_vectors)[0]
+            # Rows are L2-normalized, so cosine similarity is a sparse dot product
+            similarities = (job_vector @ candidate_vectors.T).toarray().ravel()
             
-            # Add scores to candidates
-            for i, candidate in enumerate(candidates):
+            # Rank by match score; with top_k only the best k are selected and sorted
+            if top_k is not None and 0 < top_k < len(candidates):
+                order = np.argpartition(similarities, -top_k)[-top_k:]
+                order = order[np.argsort(-similarities[order], kind='stable')]
+            else:
+                order = np.argsort(-similarities, kind='stable')
+            
+            # Add scores to the ranked candidates
+            ranked = []
+            for i in order:
+                candidate = candidates[i]
                 candidate['match_score'] = float(similarities[i])
                 candidate['match_provider'] = 'offline'
                 candidate['match_reasons'] = self._generate_offline_match_reasons(
                     job_description, candidate
                 )
+                ranked.append(candidate)
             
-            # Sort by match score
-            candidates.sort(key=lambda x: x.get('match_score', 0), reverse=True)
-            
-            return candidates
+            return ranked
             
         except Exception as e:
             logger.error(f"Offline matching failed: {e}")
@@ -428,7 +911,7 @@ class MultiProviderAIService:
                 candidate['match_provider'] = 'offline'
                 candidate['match_reasons'] = ["Manual review required"]
             
-            return candidates
+            return _keep_top(candidates, top_k)
     
     def _generate_offline_match_reasons(self, job_description: str, candidate: Dict[str, Any]) -> List[str]:
         """Generate match reasons for offline matching"""
@@ -463,20 +946,25 @@ class MultiProviderAIService:
         """
         Generate interview questions with multi-provider fallback
         """
+        key = self._cache_key("questions", job_description, orjson.dumps(candidate_info, option=_KEY_DUMP_OPTIONS, default=str).decode())
+        cached = await self._cache_get(key)
+        if cached is not None:
+            return cached
+        
         try:
             # Try DeepSeek first
             if self.deepseek_api_key:
                 result = await self._generate_questions_deepseek(job_description, candidate_info)
                 if result:
                     logger.info("Interview questions generated with DeepSeek")
-                    return result
+                    return await self._cache_store(key, result)
             
             # Fallback to OpenAI
             if self.openai_api_key:
                 result = await self._generate_questions_openai(job_description, candidate_info)
                 if result:
                     logger.info("Interview questions generated with OpenAI")
-                    return result
+                    return await self._cache_store(key, result)
             
             # Final fallback to template-based questions
             logger.info("Using template-based interview questions")
@@ -495,55 +983,11 @@ class MultiProviderAIService:
         questions = []
         
         # Technical questions based on job description
-        if any(tech in job_lower for tech in ['python', 'programming', 'software', 'developer']):
-            questions.extend([
-                {
-                    "question": "Can you walk me through your experience with Python development?",
-                    "type": "technical",
-                    "category": "experience",
-                    "expected_duration": 300
-                },
-                {
-                    "question": "Describe a challenging technical problem you solved recently.",
-                    "type": "technical", 
-                    "category": "problem_solving",
-                    "expected_duration": 300
-                }
-            ])
+        if any(tech in job_lower for tech in _TECH_JOB_KEYWORDS):
+            questions.extend(dict(q) for q in _TECHNICAL_QUESTIONS)
         
         # General questions
-        questions.extend([
-            {
-                "question": "Tell me about yourself and your professional background.",
-                "type": "general",
-                "category": "introduction",
-                "expected_duration": 180
-            },
-            {
-                "question": "Why are you interested in this position?",
-                "type": "general",
-                "category": "motivation",
-                "expected_duration": 120
-            },
-            {
-                "question": "What are your greatest strengths?",
-                "type": "behavioral",
-                "category": "strengths",
-                "expected_duration": 120
-            },
-            {
-                "question": "Describe a time when you had to work under pressure.",
-                "type": "behavioral",
-                "category": "stress_management",
-                "expected_duration": 180
-            },
-            {
-                "question": "Where do you see yourself in 5 years?",
-                "type": "general",
-                "category": "career_goals",
-                "expected_duration": 120
-            }
-        ])
+        questions.extend(dict(q) for q in _GENERAL_QUESTIONS)
         
         # Add candidate-specific questions if info available
         if candidate_info and candidate_info.get('skills'):
@@ -565,9 +1009,9 @@ async def analyze_resume_with_ai(resume_text: str, job_requirements: List[str] =
     """Analyze resume using multi-provider AI service"""
     return await ai_service.analyze_resume(resume_text, job_requirements)
 
-async def match_candidates_with_ai(job_description: str, candidates: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+async def match_candidates_with_ai(job_description: str, candidates: List[Dict[str, Any]], top_k: Optional[int] = None) -> List[Dict[str, Any]]:
     """Match candidates using multi-provider AI service"""
-    return await ai_service.match_candidates(job_description, candidates)
+    return await ai_service.match_candidates(job_description, candidates, top_k)
 
 async def generate_interview_questions_with_ai(job_description: str, candidate_info: Dict[str, Any] = None) -> List[Dict[str, Any]]:
     """Generate interview questions using multi-provider AI service"""
@@ -2,16 +2,216 @@
 AI service for OpenAI integration and AI-powered features
 """
 
+import asyncio
+import hashlib
+from functools import lru_cache
 import openai
-import json
+import orjson
 from typing import List, Dict, Any, Optional
 from ..core.config import settings
 from ..models.job import Job
 from ..models.resume import Resume
 from ..models.interview import Interview
 
-# Set OpenAI API key
-openai.api_key = settings.OPENAI_API_KEY
+# Shared OpenAI client (one connection pool; the SDK retries 429s and 5xx with backoff)
+_client = openai.AsyncOpenAI(api_key=settings.OPENAI_API_KEY, max_retries=3, timeout=30) if settings.OPENAI_API_KEY else None
+
+# Small, cheap model for extraction and scoring; supports automatic prompt caching
+CHAT_MODEL = "gpt-4o-mini"
+
+# Token-accurate truncation of prompt inputs (falls back to a character estimate)
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+@lru_cache(maxsize=1)
+def _encoding():
+    """Tokenizer for CHAT_MODEL, loaded once on first use"""
+    return tiktoken.encoding_for_model(CHAT_MODEL)
+
+def _truncate_tokens(text: str, max_tokens: int) -> str:
+    """Cut text to at most max_tokens tokens of CHAT_MODEL"""
+    if tiktoken is None:
+        return text[:max_tokens * 4]  # Roughly 4 characters per token
+    encoding = _encoding()
+    tokens = encoding.encode(text)
+    if len(tokens) <= max_tokens:
+        return text
+    return encoding.decode(tokens[:max_tokens])
+
+# Caps in-flight OpenAI requests so bursts don't trip rate limits
+_semaphore = asyncio.Semaphore(settings.OPENAI_MAX_CONCURRENCY)
+
+async def _chat_completion(**kwargs):
+    """Create a chat completion through the shared client, bounded by the semaphore"""
+    async with _semaphore:
+        return await _client.chat.completions.create(**kwargs)
+
+# Redis caches generated job content across workers (optional)
+try:
+    import redis.asyncio as aioredis
+except ImportError:
+    aioredis = None
+
+_redis = aioredis.from_url(settings.REDIS_URL) if aioredis and settings.REDIS_URL else None
+
+# Generated job content only changes when the job's fields do
+JOB_CONTENT_CACHE_TTL = 86400
+# Extraction output is fully determined by the resume text, so re-uploads can reuse it longer
+RESUME_EXTRACTION_CACHE_TTL = 30 * 86400
+
+def _job_cache_key(prefix: str, job: Job, *fields: Any) -> str:
+    """Cache key fingerprinting the job fields a generated result depends on"""
+    fingerprint = "|".join(str(field) for field in (
+        job.title, job.company, job.experience_level, job.job_type,
+        sorted(job.required_skills or []), job.description, *fields
+    ))
+    return f"{prefix}:{hashlib.sha1(fingerprint.encode()).hexdigest()}"
+
+async def _cache_get(key: str) -> Optional[Any]:
+    """Return a cached JSON value, or None on a miss or when Redis is unavailable"""
+    if _redis is None:
+        return None
+    try:
+        cached = await _redis.get(key)
+    except Exception as e:
+        print(f"Cache lookup failed: {e}")
+        return None
+    return orjson.loads(cached) if cached is not None else None
+
+async def _cache_set(key: str, value: Any, ttl: int = JOB_CONTENT_CACHE_TTL):
+    """Store a JSON value, by default with the job content TTL"""
+    if _redis is None:
+        return
+    try:
+        await _redis.setex(key, ttl, orjson.dumps(value))
+    except Exception as e:
+        print(f"Cache write failed: {e}")
+
+# Static instructions go in the system message and dynamic fields at the end of the
+# user message, so repeated calls share a cacheable prompt prefix. Response shapes
+# are enforced by the schemas below, so the prompts don't spell them out.
+INTERVIEW_QUESTIONS_SYSTEM = """You are an expert HR professional and technical interviewer.
+Write 10 interview questions for the job in the input.
+Assess: technical skills | communication | problem-solving | experience | cultural fit and motivation.
+For each question give its type, the skills it assesses, and the expected answer time in seconds."""
+
+JOB_SUMMARY_SYSTEM = """You are an expert recruiter.
+Write a concise, engaging 2-3 sentence summary of the job in the input that highlights the key aspects of the role and attracts qualified candidates."""
+
+EXTRACT_RESUME_SYSTEM = """You are an expert resume parser.
+Extract the candidate's contact details, skills, work experience, education, certifications and a brief professional summary from the resume in the input.
+Use only information clearly present in the resume; use null for missing contact details."""
+
+MATCH_SCORE_SYSTEM = f"""You are an expert recruiter.
+Assess how well the resume in the input matches the job posting: skills (matched and missing), experience relevance and level fit, education fit, overall assessment, strengths and concerns.
+Scores are 0.0-1.0. The candidate is qualified if match_score >= {settings.RESUME_MATCH_THRESHOLD}."""
+
+INTERVIEW_ANALYSIS_SYSTEM = """You are an expert interviewer and talent assessor.
+Give a fair, detailed and constructive analysis of the interview in the input: communication, technical knowledge, problem-solving, response quality, strengths, areas for improvement, a recommendation, your confidence, and feedback for the candidate.
+Scores are 0.0-1.0."""
+
+# Structured output schemas; strict mode makes the model's reply always parse into these shapes
+def _strict_object(properties: Dict[str, Any]) -> Dict[str, Any]:
+    """JSON schema object with every property required and no extra keys, as strict mode demands"""
+    return {
+        "type": "object",
+        "properties": properties,
+        "required": list(properties),
+        "additionalProperties": False
+    }
+
+def _json_schema_format(name: str, schema: Dict[str, Any]) -> Dict[str, Any]:
+    """response_format enforcing a JSON schema"""
+    return {"type": "json_schema", "json_schema": {"name": name, "schema": schema, "strict": True}}
+
+_STRING = {"type": "string"}
+_NULLABLE_STRING = {"type": ["string", "null"]}
+_NUMBER = {"type": "number"}
+_STRING_LIST = {"type": "array", "items": _STRING}
+
+QUESTIONS_SCHEMA = _strict_object({
+    "questions": {
+        "type": "array",
+        "items": _strict_object({
+            "id": {"type": "integer"},
+            "question": _STRING,
+            "type": {"type": "string", "enum": ["behavioral", "technical", "situational"]},
+            "skills_assessed": _STRING_LIST,
+            "expected_duration": {"type": "integer"}
+        })
+    }
+})
+
+EXTRACT_RESUME_SCHEMA = _strict_object({
+    "candidate_name": _NULLABLE_STRING,
+    "candidate_email": _NULLABLE_STRING,
+    "candidate_phone": _NULLABLE_STRING,
+    "skills": _STRING_LIST,
+    "experience": {
+        "type": "array",
+        "items": _strict_object({
+            "company": _STRING,
+            "position": _STRING,
+            "duration": _STRING,
+            "description": _STRING
+        })
+    },
+    "education": {
+        "type": "array",
+        "items": _strict_object({
+            "institution": _STRING,
+            "degree": _STRING,
+            "field": _STRING,
+            "year": _STRING
+        })
+    },
+    "certifications": _STRING_LIST,
+    "summary": _STRING
+})
+
+MATCH_SCORE_SCHEMA = _strict_object({
+    "match_score": _NUMBER,
+    "is_qualified": {"type": "boolean"},
+    "match_details": _strict_object({
+        "skills_match": _strict_object({
+            "score": _NUMBER,
+            "matched_skills": _STRING_LIST,
+            "missing_skills": _STRING_LIST
+        }),
+        "experience_match": _strict_object({
+            "score": _NUMBER,
+            "relevant_experience": _STRING,
+            "experience_level_fit": {"type": "boolean"}
+        }),
+        "education_match": _strict_object({
+            "score": _NUMBER,
+            "education_fit": _STRING
+        }),
+        "overall_assessment": _STRING,
+        "strengths": _STRING_LIST,
+        "concerns": _STRING_LIST
+    })
+})
+
+INTERVIEW_ANALYSIS_SCHEMA = _strict_object({
+    "overall_score": _NUMBER,
+    "communication_score": _NUMBER,
+    "technical_score": _NUMBER,
+    "problem_solving_score": _NUMBER,
+    "detailed_analysis": _strict_object({
+        "communication_assessment": _STRING,
+        "technical_assessment": _STRING,
+        "problem_solving_assessment": _STRING,
+        "response_quality": _STRING,
+        "areas_of_strength": _STRING_LIST,
+        "areas_for_improvement": _STRING_LIST
+    }),
+    "recommendation": {"type": "string", "enum": ["hire", "consider", "reject"]},
+    "confidence": _NUMBER,
+    "feedback": _STRING
+})
 
 async def generate_interview_questions(job: Job) -> List[Dict[str, Any]]:
     """Generate AI-powered interview questions for a job"""
@@ -19,62 +219,34 @@ async def generate_interview_questions(job: Job) -> List[Dict[str, Any]]:
     if not settings.OPENAI_API_KEY:
         return []
     
+    cache_key = _job_cache_key("iq", job)
+    cached = await _cache_get(cache_key)
+    if cached is not None:
+        return cached
+    
     try:
-        prompt = f"""
-        Generate 10 comprehensive interview questions for the following job position:
-        
-        Job Title: {job.title}
-        Company: {job.company}
-        Experience Level: {job.experience_level}
-        Job Type: {job.job_type}
-        Required Skills: {', '.join(job.required_skills or [])}
-        Job Description: {job.description[:500]}...
-        
-        Please generate questions that assess:
-        1. Technical skills relevant to the position
-        2. Communication and interpersonal skills
-        3. Problem-solving abilities
-        4. Experience and background
-        5. Cultural fit and motivation
-        
-        Return the response as a JSON array where each question has:
-        - id: sequential number
-        - question: the interview question
-        - type: "behavioral", "technical", or "situational"
-        - skills_assessed: array of skills this question evaluates
-        - expected_duration: estimated time in seconds for response
-        """
-        
-        response = await openai.ChatCompletion.acreate(
-            model="gpt-3.5-turbo",
+        prompt = f"""INPUT:
+Job Title: {job.title}
+Company: {job.company}
+Experience Level: {job.experience_level}
+Job Type: {job.job_type}
+Required Skills: {', '.join(job.required_skills or [])}
+Job Description: {_truncate_tokens(job.description, 400)}"""
+        
+        response = await _chat_completion(
+            model=CHAT_MODEL,
             messages=[
-                {"role": "system", "content": "You are an expert HR professional and technical interviewer. Generate comprehensive, relevant interview questions."},
+                {"role": "system", "content": INTERVIEW_QUESTIONS_SYSTEM},
                 {"role": "user", "content": prompt}
             ],
-            max_tokens=2000,
+            response_format=_json_schema_format("interview_questions", QUESTIONS_SCHEMA),
+            max_tokens=1200,
             temperature=0.7
         )
         
-        questions_text = response.choices[0].message.content
-        
-        # Try to parse as JSON
-        try:
-            questions = json.loads(questions_text)
-            return questions
-        except json.JSONDecodeError:
-            # If JSON parsing fails, create structured questions from text
-            lines = questions_text.strip().split('\n')
-            questions = []
-            for i, line in enumerate(lines[:10], 1):
-                if line.strip():
-                    questions.append({
-                        "id": i,
-                        "question": line.strip(),
-                        "type": "general",
-                        "skills_assessed": job.required_skills[:3] if job.required_skills else [],
-                        "expected_duration": 120
-                    })
-            return questions
+        questions = orjson.loads(response.choices[0].message.content)["questions"]
+        await _cache_set(cache_key, questions)
+        return questions
             
     except Exception as e:
         print(f"Error generating interview questions: {e}")
@@ -86,99 +258,122 @@ async def generate_job_summary(job: Job) -> str:
     if not settings.OPENAI_API_KEY:
         return ""
     
+    cache_key = _job_cache_key("js", job, job.location)
+    cached = await _cache_get(cache_key)
+    if cached is not None:
+        return cached
+    
     try:
-        prompt = f"""
-        Create a concise, engaging job summary for the following position:
-        
-        Job Title: {job.title}
-        Company: {job.company}
-        Experience Level: {job.experience_level}
-        Job Type: {job.job_type}
-        Location: {job.location or 'Remote'}
-        Required Skills: {', '.join(job.required_skills or [])}
-        Job Description: {job.description}
-        
-        Generate a 2-3 sentence summary that highlights the key aspects of the role and would attract qualified candidates.
-        """
-        
-        response = await openai.ChatCompletion.acreate(
-            model="gpt-3.5-turbo",
+        prompt = f"""INPUT:
+Job Title: {job.title}
+Company: {job.company}
+Experience Level: {job.experience_level}
+Job Type: {job.job_type}
+Location: {job.location or 'Remote'}
+Required Skills: {', '.join(job.required_skills or [])}
+Job Description: {job.description}"""
+        
+        response = await _chat_completion(
+            model=CHAT_MODEL,
             messages=[
-                {"role": "system", "content": "You are an expert recruiter. Create compelling job summaries that attract top talent."},
+                {"role": "system", "content": JOB_SUMMARY_SYSTEM},
                 {"role": "user", "content": prompt}
             ],
-            max_tokens=200,
+            max_tokens=120,
             temperature=0.7
         )
         
-        return response.choices[0].message.content.strip()
+        summary = response.choices[0].message.content.strip()
+        await _cache_set(cache_key, summary)
+        return summary
         
     except Exception as e:
         print(f"Error generating job summary: {e}")
         return ""
 
+def build_resume_extraction_request(resume_text: str) -> Dict[str, Any]:
+    """Chat completion parameters for resume extraction (shared by the live and batch paths)"""
+    prompt = f"""INPUT:
+{_truncate_tokens(resume_text, 2500)}"""
+    
+    return {
+        "model": CHAT_MODEL,
+        "messages": [
+            {"role": "system", "content": EXTRACT_RESUME_SYSTEM},
+            {"role": "user", "content": prompt}
+        ],
+        "response_format": _json_schema_format("resume_extraction", EXTRACT_RESUME_SCHEMA),
+        "max_tokens": 900,
+        "temperature": 0.3
+    }
+
 async def extract_resume_information(resume_text: str) -> Dict[str, Any]:
     """Extract structured information from resume text using AI"""
     
     if not settings.OPENAI_API_KEY:
         return {}
     
+    # Identical uploads share one extraction
+    cache_key = "resume_extract:" + hashlib.blake2b(resume_text.encode(), digest_size=16).hexdigest()
+    cached = await _cache_get(cache_key)
+    if cached is not None:
+        return cached
+    
     try:
-        prompt = f"""
-        Extract structured information from the following resume text:
-        
-        {resume_text[:3000]}...
-        
-        Please extract and return a JSON object with the following structure:
-        {{
-            "candidate_name": "Full name",
-            "candidate_email": "email@example.com",
-            "candidate_phone": "phone number",
-            "skills": ["skill1", "skill2", "skill3"],
-            "experience": [
-                {{
-                    "company": "Company Name",
-                    "position": "Job Title",
-                    "duration": "Start - End dates",
-                    "description": "Brief description"
-                }}
-            ],
-            "education": [
-                {{
-                    "institution": "School/University",
-                    "degree": "Degree type",
-                    "field": "Field of study",
-                    "year": "Graduation year"
-                }}
-            ],
-            "certifications": ["cert1", "cert2"],
-            "summary": "Brief professional summary"
-        }}
-        
-        Extract only information that is clearly present in the resume.
-        """
-        
-        response = await openai.ChatCompletion.acreate(
-            model="gpt-3.5-turbo",
-            messages=[
-                {"role": "system", "content": "You are an expert resume parser. Extract structured information accurately from resume text."},
-                {"role": "user", "content": prompt}
-            ],
-            max_tokens=1500,
-            temperature=0.3
-        )
-        
-        result_text = response.choices[0].message.content
+        response = await _chat_completion(**build_resume_extraction_request(resume_text))
         
-        try:
-            return json.loads(result_text)
-        except json.JSONDecodeError:
-            return {}
+        extracted = orjson.loads(response.choices[0].message.content)
+        await _cache_set(cache_key, extracted, RESUME_EXTRACTION_CACHE_TTL)
+        return extracted
             
     except Exception as e:
         print(f"Error extracting resume information: {e}")
         return {}
 
+def build_match_score_request(resume: Resume, job: Job) -> Dict[str, Any]:
+    """Chat completion parameters for resume-job match scoring (shared by the live and batch paths)"""
+    prompt = f"""INPUT:
+JOB POSTING:
+Title: {job.title}
+Experience Level: {job.experience_level}
+Required Skills: {', '.join(job.required_skills or [])}
+Preferred Skills: {', '.join(job.preferred_skills or [])}
+Description: {_truncate_tokens(job.description, 400)}
+
+RESUME:
+Candidate: {resume.candidate_name or 'Unknown'}
+Skills: {', '.join(resume.skills or [])}
+Experience: {orjson.dumps(resume.experience or []).decode()}
+Education: {orjson.dumps(resume.education or []).decode()}
+Summary: {resume.ai_summary or ''}"""
+    
+    return {
+        "model": CHAT_MODEL,
+        "messages": [
+            {"role": "system", "content": MATCH_SCORE_SYSTEM},
+            {"role": "user", "content": prompt}
+        ],
+        "response_format": _json_schema_format("match_score", MATCH_SCORE_SCHEMA),
+        "max_tokens": 500,
+        "temperature": 0.3
+    }
+
+def parse_match_score_result(result_text: str) -> Dict[str, Any]:
+    """Parse a match score reply, filling in any missing required fields"""
+    try:
+        result = orjson.loads(result_text)
+        # Ensure required fields exist
+        if "match_score" not in result:
+            result["match_score"] = 0.0
+        if "is_qualified" not in result:
+            result["is_qualified"] = result["match_score"] >= settings.RESUME_MATCH_THRESHOLD
+        if "match_details" not in result:
+            result["match_details"] = {}
+        
+        return result
+    except orjson.JSONDecodeError:
+        return {"match_score": 0.0, "is_qualified": False, "match_details": {}}
+
 async def calculate_resume_match_score(resume: Resume, job: Job) -> Dict[str, Any]:
     """Calculate match score between resume and job using AI"""
     
@@ -186,76 +381,9 @@ async def calculate_resume_match_score(resume: Resume, job: Job) -> Dict[str, An
         return {"match_score": 0.0, "is_qualified": False, "match_details": {}}
     
     try:
-        prompt = f"""
-        Analyze the match between this resume and job posting:
-        
-        JOB POSTING:
-        Title: {job.title}
-        Experience Level: {job.experience_level}
-        Required Skills: {', '.join(job.required_skills or [])}
-        Preferred Skills: {', '.join(job.preferred_skills or [])}
-        Description: {job.description[:500]}...
-        
-        RESUME:
-        Candidate: {resume.candidate_name or 'Unknown'}
-        Skills: {', '.join(resume.skills or [])}
-        Experience: {json.dumps(resume.experience or [])}
-        Education: {json.dumps(resume.education or [])}
-        Summary: {resume.ai_summary or ''}
-        
-        Provide a detailed match analysis as JSON:
-        {{
-            "match_score": 0.85,
-            "is_qualified": true,
-            "match_details": {{
-                "skills_match": {{
-                    "score": 0.8,
-                    "matched_skills": ["skill1", "skill2"],
-                    "missing_skills": ["skill3"]
-                }},
-                "experience_match": {{
-                    "score": 0.9,
-                    "relevant_experience": "Details about relevant experience",
-                    "experience_level_fit": true
-                }},
-                "education_match": {{
-                    "score": 0.7,
-                    "education_fit": "Assessment of education fit"
-                }},
-                "overall_assessment": "Detailed assessment of candidate fit",
-                "strengths": ["strength1", "strength2"],
-                "concerns": ["concern1", "concern2"]
-            }}
-        }}
-        
-        Score should be 0.0-1.0. Candidate is qualified if score >= {settings.RESUME_MATCH_THRESHOLD}.
-        """
+        response = await _chat_completion(**build_match_score_request(resume, job))
         
-        response = await openai.ChatCompletion.acreate(
-            model="gpt-3.5-turbo",
-            messages=[
-                {"role": "system", "content": "You are an expert recruiter. Analyze resume-job matches accurately and provide detailed assessments."},
-                {"role": "user", "content": prompt}
-            ],
-            max_tokens=1000,
-            temperature=0.3
-        )
-        
-        result_text = response.choices[0].message.content
-        
-        try:
-            result = json.loads(result_text)
-            # Ensure required fields exist
-            if "match_score" not in result:
-                result["match_score"] = 0.0
-            if "is_qualified" not in result:
-                result["is_qualified"] = result["match_score"] >= settings.RESUME_MATCH_THRESHOLD
-            if "match_details" not in result:
-                result["match_details"] = {}
-            
-            return result
-        except json.JSONDecodeError:
-            return {"match_score": 0.0, "is_qualified": False, "match_details": {}}
+        return parse_match_score_result(response.choices[0].message.content)
             
     except Exception as e:
         print(f"Error calculating match score: {e}")
@@ -278,53 +406,25 @@ async def analyze_interview_responses(interview: Interview) -> Dict[str, Any]:
                     "duration": response.get("duration", 0)
                 })
         
-        prompt = f"""
-        Analyze this interview performance:
-        
-        Job Title: {interview.job.title if hasattr(interview, 'job') else 'Unknown'}
-        Interview Duration: {interview.duration_minutes} minutes
-        
-        Questions and Responses:
-        {json.dumps(questions_and_responses, indent=2)}
-        
-        Provide a comprehensive analysis as JSON:
-        {{
-            "overall_score": 0.85,
-            "communication_score": 0.8,
-            "technical_score": 0.9,
-            "problem_solving_score": 0.8,
-            "detailed_analysis": {{
-                "communication_assessment": "Assessment of communication skills",
-                "technical_assessment": "Assessment of technical knowledge",
-                "problem_solving_assessment": "Assessment of problem-solving abilities",
-                "response_quality": "Overall quality of responses",
-                "areas_of_strength": ["strength1", "strength2"],
-                "areas_for_improvement": ["improvement1", "improvement2"]
-            }},
-            "recommendation": "hire",
-            "confidence": 0.85,
-            "feedback": "Detailed feedback for the candidate"
-        }}
-        
-        Scores should be 0.0-1.0. Recommendation should be "hire", "consider", or "reject".
-        """
+        prompt = f"""INPUT:
+Job Title: {interview.job.title if hasattr(interview, 'job') else 'Unknown'}
+Interview Duration: {interview.duration_minutes} minutes
+
+Questions and Responses:
+{orjson.dumps(questions_and_responses, option=orjson.OPT_INDENT_2).decode()}"""
         
-        response = await openai.ChatCompletion.acreate(
-            model="gpt-3.5-turbo",
+        response = await _chat_completion(
+            model=CHAT_MODEL,
             messages=[
-                {"role": "system", "content": "You are an expert interviewer and talent assessor. Provide fair, detailed, and constructive interview analysis."},
+                {"role": "system", "content": INTERVIEW_ANALYSIS_SYSTEM},
                 {"role": "user", "content": prompt}
             ],
+            response_format=_json_schema_format("interview_analysis", INTERVIEW_ANALYSIS_SCHEMA),
             max_tokens=1500,
             temperature=0.3
         )
         
-        result_text = response.choices[0].message.content
-        
-        try:
-            return json.loads(result_text)
-        except json.JSONDecodeError:
-            return {}
+        return orjson.loads(response.choices[0].message.content)
             
     except Exception as e:
         print(f"Error analyzing interview responses: {e}")
@@ -2,11 +2,16 @@
 Analytics service for dashboard metrics and reporting
 """
 
+import asyncio
+import logging
 from sqlalchemy.orm import Session
-from sqlalchemy import func, and_, or_
+from sqlalchemy import func, and_, or_, select, true, literal, union_all, text
 from typing import Dict, List, Any, Optional
 from datetime import datetime, timedelta
+from cachetools import TTLCache
+import orjson
 
+from ..core.config import settings
 from ..models.user import User
 from ..models.job import Job
 from ..models.candidate import Candidate
@@ -14,73 +19,134 @@ from ..models.interview import Interview
 from ..models.resume import Resume
 from ..models.credit import Credit
 
+logger = logging.getLogger(__name__)
+
+# Dashboards poll these aggregates; Redis shares them across workers when configured
+try:
+    import redis.asyncio as aioredis
+except ImportError:
+    aioredis = None
+
+_redis = aioredis.from_url(settings.REDIS_URL) if aioredis and settings.REDIS_URL else None
+_local_cache = TTLCache(maxsize=1024, ttl=settings.ANALYTICS_CACHE_TTL)
+
+# Admin counts are served from a materialized view once it exists (PostgreSQL only)
+ADMIN_ANALYTICS_VIEW = "analytics_admin_mv"
+_admin_view_ready = False
+
+# The sessions are synchronous; statements run in a worker thread so they don't block the event loop
+async def _fetch_one(db: Session, stmt):
+    return await asyncio.to_thread(lambda: db.execute(stmt).one())
+
+async def _fetch_all(db: Session, stmt):
+    return await asyncio.to_thread(lambda: db.execute(stmt).all())
+
+def _dashboard_cache_key(user_id: int, days: Any) -> str:
+    return f"analytics:dashboard:{user_id}:{days}"
+
+async def _cache_get(key: str) -> Optional[Dict[str, Any]]:
+    """Return a cached analytics payload, or None on a miss"""
+    if _redis is None:
+        return _local_cache.get(key)
+    try:
+        cached = await _redis.get(key)
+    except Exception as e:
+        logger.warning(f"Analytics cache lookup failed: {e}")
+        return None
+    return orjson.loads(cached) if cached is not None else None
+
+async def _cache_set(key: str, value: Dict[str, Any]):
+    """Store an analytics payload for the analytics cache TTL"""
+    if _redis is None:
+        _local_cache[key] = value
+        return
+    try:
+        await _redis.set(key, orjson.dumps(value), ex=settings.ANALYTICS_CACHE_TTL)
+    except Exception as e:
+        logger.warning(f"Analytics cache write failed: {e}")
+
+async def invalidate_dashboard_cache(user_id: int):
+    """Drop a user's cached dashboards after their candidates or interviews change"""
+    prefix = _dashboard_cache_key(user_id, "")
+    if _redis is None:
+        for key in [key for key in _local_cache if key.startswith(prefix)]:
+            _local_cache.pop(key, None)
+        return
+    try:
+        keys = [key async for key in _redis.scan_iter(match=f"{prefix}*")]
+        if keys:
+            await _redis.delete(*keys)
+    except Exception as e:
+        logger.warning(f"Analytics cache invalidation failed: {e}")
+
 async def get_dashboard_analytics(user_id: int, db: Session, days: int = 30) -> Dict[str, Any]:
     """Get comprehensive dashboard analytics for user"""
     
-    start_date = datetime.utcnow() - timedelta(days=days)
-    
-    # Get user's jobs
-    user_jobs = db.query(Job).filter(Job.owner_id == user_id).all()
-    job_ids = [job.id for job in user_jobs]
-    
-    # Basic metrics
-    total_jobs = len(user_jobs)
-    active_jobs = len([job for job in user_jobs if job.is_active])
-    published_jobs = len([job for job in user_jobs if job.is_published])
-    
-    # Candidate metrics
-    total_candidates = db.query(Candidate).filter(Candidate.job_id.in_(job_ids)).count() if job_ids else 0
-    qualified_candidates = db.query(Candidate).filter(
-        and_(Candidate.job_id.in_(job_ids), Candidate.is_qualified == True)
-    ).count() if job_ids else 0
-    
-    # Interview metrics
-    total_interviews = db.query(Interview).filter(Interview.job_id.in_(job_ids)).count() if job_ids else 0
-    completed_interviews = db.query(Interview).filter(
-        and_(Interview.job_id.in_(job_ids), Interview.status == "completed")
-    ).count() if job_ids else 0
-    
-    # Resume metrics
-    total_resumes = db.query(Resume).filter(Resume.uploaded_by == user_id).count()
-    processed_resumes = db.query(Resume).filter(
-        and_(Resume.uploaded_by == user_id, Resume.is_processed == True)
-    ).count()
-    
-    # Credit metrics
-    latest_credit = db.query(Credit).filter(Credit.user_id == user_id).order_by(Credit.created_at.desc()).first()
-    current_credits = latest_credit.balance_after if latest_credit else 0
-    
-    # Recent activity (last 30 days)
-    recent_candidates = db.query(Candidate).filter(
-        and_(
-            Candidate.job_id.in_(job_ids) if job_ids else False,
-            Candidate.application_date >= start_date
-        )
-    ).count() if job_ids else 0
+    cache_key = _dashboard_cache_key(user_id, days)
+    cached = await _cache_get(cache_key)
+    if cached is not None:
+        return cached
     
-    recent_interviews = db.query(Interview).filter(
-        and_(
-            Interview.job_id.in_(job_ids) if job_ids else False,
-            Interview.created_at >= start_date
-        )
-    ).count() if job_ids else 0
-    
-    # Performance metrics
-    avg_match_score = db.query(func.avg(Candidate.match_score)).filter(
-        and_(
-            Candidate.job_id.in_(job_ids) if job_ids else False,
-            Candidate.match_score.isnot(None)
-        )
-    ).scalar() or 0.0
+    start_date = datetime.utcnow() - timedelta(days=days)
     
-    avg_interview_score = db.query(func.avg(Interview.overall_score)).filter(
-        and_(
-            Interview.job_id.in_(job_ids) if job_ids else False,
-            Interview.overall_score.isnot(None)
+    # Every metric comes back in one row: one aggregate subquery per table, joined on true
+    job_ids = select(Job.id).where(Job.owner_id == user_id)
+    
+    job_stats = select(
+        func.count().label("total_jobs"),
+        func.count().filter(Job.is_active == True).label("active_jobs"),
+        func.count().filter(Job.is_published == True).label("published_jobs")
+    ).where(Job.owner_id == user_id).subquery()
+    
+    candidate_stats = select(
+        func.count().label("total_candidates"),
+        func.count().filter(Candidate.is_qualified == True).label("qualified_candidates"),
+        func.count().filter(Candidate.application_date >= start_date).label("recent_candidates"),
+        func.avg(Candidate.match_score).label("avg_match_score")
+    ).where(Candidate.job_id.in_(job_ids)).subquery()
+    
+    interview_stats = select(
+        func.count().label("total_interviews"),
+        func.count().filter(Interview.status == "completed").label("completed_interviews"),
+        func.count().filter(Interview.created_at >= start_date).label("recent_interviews"),
+        func.avg(Interview.overall_score).label("avg_interview_score")
+    ).where(Interview.job_id.in_(job_ids)).subquery()
+    
+    resume_stats = select(
+        func.count().label("total_resumes"),
+        func.count().filter(Resume.is_processed == True).label("processed_resumes")
+    ).where(Resume.uploaded_by == user_id).subquery()
+    
+    # Running balance kept on the user row by the credit service
+    latest_balance = select(User.credit_balance).where(User.id == user_id).scalar_subquery()
+    
+    metrics = await _fetch_one(db,
+        select(
+            job_stats, candidate_stats, interview_stats, resume_stats,
+            latest_balance.label("current_credits")
+        ).select_from(
+            job_stats.join(candidate_stats, true())
+            .join(interview_stats, true())
+            .join(resume_stats, true())
         )
-    ).scalar() or 0.0
-    
-    return {
+    )
+    
+    total_jobs = metrics.total_jobs
+    active_jobs = metrics.active_jobs
+    published_jobs = metrics.published_jobs
+    total_candidates = metrics.total_candidates
+    qualified_candidates = metrics.qualified_candidates
+    recent_candidates = metrics.recent_candidates
+    total_interviews = metrics.total_interviews
+    completed_interviews = metrics.completed_interviews
+    recent_interviews = metrics.recent_interviews
+    total_resumes = metrics.total_resumes
+    processed_resumes = metrics.processed_resumes
+    current_credits = metrics.current_credits or 0
+    avg_match_score = metrics.avg_match_score or 0.0
+    avg_interview_score = metrics.avg_interview_score or 0.0
+    
+    analytics = {
         "period_days": days,
         "jobs": {
             "total": total_jobs,
@@ -112,32 +178,38 @@ async def get_dashboard_analytics(user_id: int, db: Session, days: int = 30) ->
             "avg_interview_score": float(avg_interview_score)
         }
     }
+    
+    await _cache_set(cache_key, analytics)
+    return analytics
 
 async def get_hiring_funnel_analytics(user_id: int, db: Session, job_id: Optional[int] = None) -> Dict[str, Any]:
     """Get hiring funnel analytics"""
     
-    # Get user's jobs
+    # Get user's job ids
+    job_filter = Job.owner_id == user_id
     if job_id:
-        jobs = db.query(Job).filter(and_(Job.id == job_id, Job.owner_id == user_id)).all()
-    else:
-        jobs = db.query(Job).filter(Job.owner_id == user_id).all()
-    
-    job_ids = [job.id for job in jobs]
-    
-    if not job_ids:
+        job_filter = and_(Job.id == job_id, job_filter)
+    
+    job_ids = select(Job.id).where(job_filter)
+    
+    # Funnel stages, counted in one pass over the candidates
+    funnel = await _fetch_one(db,
+        select(
+            select(func.count()).select_from(Job).where(job_filter).scalar_subquery().label("total_jobs"),
+            func.count().label("total_applications"),
+            func.count().filter(Candidate.is_qualified == True).label("qualified_candidates"),
+            func.count().filter(Candidate.interview_completed == True).label("interviewed_candidates"),
+            func.count().filter(Candidate.application_status == "hired").label("hired_candidates")
+        ).where(Candidate.job_id.in_(job_ids))
+    )
+    
+    if not funnel.total_jobs:
         return {"stages": [], "conversion_rates": {}}
     
-    # Funnel stages
-    total_applications = db.query(Candidate).filter(Candidate.job_id.in_(job_ids)).count()
-    qualified_candidates = db.query(Candidate).filter(
-        and_(Candidate.job_id.in_(job_ids), Candidate.is_qualified == True)
-    ).count()
-    interviewed_candidates = db.query(Candidate).filter(
-        and_(Candidate.job_id.in_(job_ids), Candidate.interview_completed == True)
-    ).count()
-    hired_candidates = db.query(Candidate).filter(
-        and_(Candidate.job_id.in_(job_ids), Candidate.application_status == "hired")
-    ).count()
+    total_applications = funnel.total_applications
+    qualified_candidates = funnel.qualified_candidates
+    interviewed_candidates = funnel.interviewed_candidates
+    hired_candidates = funnel.hired_candidates
     
     stages = [
         {"name": "Applications", "count": total_applications},
@@ -164,95 +236,96 @@ async def get_time_series_analytics(user_id: int, db: Session, days: int = 30) -
     
     start_date = datetime.utcnow() - timedelta(days=days)
     
-    # Get user's jobs
-    user_jobs = db.query(Job).filter(Job.owner_id == user_id).all()
-    job_ids = [job.id for job in user_jobs]
-    
-    # Daily applications
-    daily_applications = db.query(
-        func.date(Candidate.application_date).label('date'),
-        func.count(Candidate.id).label('count')
-    ).filter(
-        and_(
-            Candidate.job_id.in_(job_ids) if job_ids else False,
-            Candidate.application_date >= start_date
-        )
-    ).group_by(func.date(Candidate.application_date)).all() if job_ids else []
-    
-    # Daily interviews
-    daily_interviews = db.query(
-        func.date(Interview.created_at).label('date'),
-        func.count(Interview.id).label('count')
-    ).filter(
-        and_(
-            Interview.job_id.in_(job_ids) if job_ids else False,
-            Interview.created_at >= start_date
-        )
-    ).group_by(func.date(Interview.created_at)).all() if job_ids else []
-    
-    # Daily resume uploads
-    daily_resumes = db.query(
-        func.date(Resume.created_at).label('date'),
-        func.count(Resume.id).label('count')
-    ).filter(
-        and_(
-            Resume.uploaded_by == user_id,
-            Resume.created_at >= start_date
-        )
-    ).group_by(func.date(Resume.created_at)).all()
+    job_ids = select(Job.id).where(Job.owner_id == user_id)
+    
+    # One round trip: each table is bucketed by day and tagged with its series name
+    daily_applications = select(
+        literal("daily_applications").label("series"),
+        func.date(Candidate.application_date).label("date"),
+        func.count(Candidate.id).label("count")
+    ).where(
+        and_(Candidate.job_id.in_(job_ids), Candidate.application_date >= start_date)
+    ).group_by(func.date(Candidate.application_date))
+    
+    daily_interviews = select(
+        literal("daily_interviews").label("series"),
+        func.date(Interview.created_at).label("date"),
+        func.count(Interview.id).label("count")
+    ).where(
+        and_(Interview.job_id.in_(job_ids), Interview.created_at >= start_date)
+    ).group_by(func.date(Interview.created_at))
+    
+    daily_resumes = select(
+        literal("daily_resumes").label("series"),
+        func.date(Resume.created_at).label("date"),
+        func.count(Resume.id).label("count")
+    ).where(
+        and_(Resume.uploaded_by == user_id, Resume.created_at >= start_date)
+    ).group_by(func.date(Resume.created_at))
+    
+    counts = {
+        (row.series, str(row.date)): row.count
+        for row in await _fetch_all(db, union_all(daily_applications, daily_interviews, daily_resumes))
+    }
     
-    return {
-        "period_days": days,
-        "daily_applications": [
-            {"date": str(item.date), "count": item.count}
-            for item in daily_applications
-        ],
-        "daily_interviews": [
-            {"date": str(item.date), "count": item.count}
-            for item in daily_interviews
-        ],
-        "daily_resumes": [
-            {"date": str(item.date), "count": item.count}
-            for item in daily_resumes
+    # Dense series: every day in the period is present, days without activity count 0
+    first_day = start_date.date()
+    dates = [
+        str(first_day + timedelta(days=offset))
+        for offset in range((datetime.utcnow().date() - first_day).days + 1)
+    ]
+    
+    result = {"period_days": days}
+    for series in ("daily_applications", "daily_interviews", "daily_resumes"):
+        result[series] = [
+            {"date": date, "count": counts.get((series, date), 0)}
+            for date in dates
         ]
-    }
+    return result
 
 async def get_job_performance_analytics(user_id: int, db: Session) -> List[Dict[str, Any]]:
     """Get performance analytics for each job"""
     
-    jobs = db.query(Job).filter(Job.owner_id == user_id).all()
+    # Interview scores are aggregated per job separately so the candidate join doesn't fan out
+    interview_scores = select(
+        Interview.job_id.label("job_id"),
+        func.avg(Interview.overall_score).label("avg_interview_score")
+    ).group_by(Interview.job_id).subquery()
+    
+    rows = await _fetch_all(db,
+        select(
+            Job.id, Job.title, Job.job_type, Job.experience_level,
+            Job.is_active, Job.is_published, Job.created_at,
+            func.count(Candidate.id).label("total_candidates"),
+            func.count(Candidate.id).filter(Candidate.is_qualified == True).label("qualified_candidates"),
+            func.count(Candidate.id).filter(Candidate.interview_completed == True).label("interviewed_candidates"),
+            func.count(Candidate.id).filter(Candidate.application_status == "hired").label("hired_candidates"),
+            func.avg(Candidate.match_score).label("avg_match_score"),
+            interview_scores.c.avg_interview_score
+        )
+        .select_from(Job)
+        .outerjoin(Candidate, Candidate.job_id == Job.id)
+        .outerjoin(interview_scores, interview_scores.c.job_id == Job.id)
+        .where(Job.owner_id == user_id)
+        .group_by(Job.id, interview_scores.c.avg_interview_score)
+        .order_by(Job.id)
+    )
     
     job_analytics = []
-    for job in jobs:
-        # Candidate metrics
-        total_candidates = db.query(Candidate).filter(Candidate.job_id == job.id).count()
-        qualified_candidates = db.query(Candidate).filter(
-            and_(Candidate.job_id == job.id, Candidate.is_qualified == True)
-        ).count()
-        interviewed_candidates = db.query(Candidate).filter(
-            and_(Candidate.job_id == job.id, Candidate.interview_completed == True)
-        ).count()
-        hired_candidates = db.query(Candidate).filter(
-            and_(Candidate.job_id == job.id, Candidate.application_status == "hired")
-        ).count()
-        
-        # Average scores
-        avg_match_score = db.query(func.avg(Candidate.match_score)).filter(
-            and_(Candidate.job_id == job.id, Candidate.match_score.isnot(None))
-        ).scalar() or 0.0
-        
-        avg_interview_score = db.query(func.avg(Interview.overall_score)).filter(
-            and_(Interview.job_id == job.id, Interview.overall_score.isnot(None))
-        ).scalar() or 0.0
+    for row in rows:
+        total_candidates = row.total_candidates
+        qualified_candidates = row.qualified_candidates
+        interviewed_candidates = row.interviewed_candidates
+        hired_candidates = row.hired_candidates
         
         job_analytics.append({
-            "job_id": job.id,
-            "job_title": job.title,
-            "job_type": job.job_type,
-            "experience_level": job.experience_level,
-            "is_active": job.is_active,
-            "is_published": job.is_published,
-            "created_at": job.created_at,
+            "job_id": row.id,
+            "job_title": row.title,
+            "job_type": row.job_type,
+            "experience_level": row.experience_level,
+            "is_active": row.is_active,
+            "is_published": row.is_published,
+            "created_at": row.created_at,
             "metrics": {
                 "total_candidates": total_candidates,
                 "qualified_candidates": qualified_candidates,
@@ -261,50 +334,131 @@ async def get_job_performance_analytics(user_id: int, db: Session) -> List[Dict[
                 "qualification_rate": (qualified_candidates / total_candidates * 100) if total_candidates > 0 else 0,
                 "interview_rate": (interviewed_candidates / qualified_candidates * 100) if qualified_candidates > 0 else 0,
                 "hire_rate": (hired_candidates / interviewed_candidates * 100) if interviewed_candidates > 0 else 0,
-                "avg_match_score": float(avg_match_score),
-                "avg_interview_score": float(avg_interview_score)
+                "avg_match_score": float(row.avg_match_score or 0.0),
+                "avg_interview_score": float(row.avg_interview_score or 0.0)
             }
         })
     
     return job_analytics
 
+def _admin_metrics_select(week_ago):
+    """Table-wide counts as Core aggregates, one subquery per table, fetched as a single row"""
+    
+    user_stats = select(
+        func.count().label("total_users"),
+        func.count().filter(User.is_active == True).label("active_users"),
+        func.count().filter(User.role == "admin").label("admin_users"),
+        func.count().filter(User.created_at >= week_ago).label("new_users_week")
+    ).subquery()
+    
+    job_stats = select(
+        func.count().label("total_jobs"),
+        func.count().filter(Job.is_active == True).label("active_jobs"),
+        func.count().filter(Job.is_published == True).label("published_jobs"),
+        func.count().filter(Job.created_at >= week_ago).label("new_jobs_week")
+    ).subquery()
+    
+    candidate_stats = select(
+        func.count().label("total_candidates"),
+        func.count().filter(Candidate.is_qualified == True).label("qualified_candidates"),
+        func.count().filter(Candidate.application_date >= week_ago).label("new_candidates_week")
+    ).subquery()
+    
+    interview_stats = select(
+        func.count().label("total_interviews"),
+        func.count().filter(Interview.status == "completed").label("completed_interviews")
+    ).subquery()
+    
+    resume_stats = select(
+        func.count().label("total_resumes"),
+        func.count().filter(Resume.is_processed == True).label("processed_resumes")
+    ).subquery()
+    
+    credit_stats = select(
+        func.sum(Credit.amount).filter(Credit.amount > 0).label("total_credits_issued"),
+        func.sum(Credit.amount).filter(Credit.amount < 0).label("total_credits_used"),
+        func.sum(Credit.amount_paid).label("total_revenue")
+    ).subquery()
+    
+    return select(
+        literal(1).label("id"),
+        user_stats, job_stats, candidate_stats, interview_stats, resume_stats, credit_stats
+    ).select_from(
+        user_stats.join(job_stats, true())
+        .join(candidate_stats, true())
+        .join(interview_stats, true())
+        .join(resume_stats, true())
+        .join(credit_stats, true())
+    )
+
+def create_admin_analytics_view(engine) -> bool:
+    """Create the admin analytics materialized view; only PostgreSQL supports it"""
+    global _admin_view_ready
+    
+    if engine.dialect.name != "postgresql":
+        return False
+    
+    week_ago = func.now() - text("interval '7 days'")
+    query = _admin_metrics_select(week_ago).compile(
+        dialect=engine.dialect, compile_kwargs={"literal_binds": True}
+    )
+    with engine.begin() as conn:
+        conn.execute(text(f"CREATE MATERIALIZED VIEW IF NOT EXISTS {ADMIN_ANALYTICS_VIEW} AS {query}"))
+        # REFRESH ... CONCURRENTLY needs a unique index on a plain column
+        conn.execute(text(
+            f"CREATE UNIQUE INDEX IF NOT EXISTS {ADMIN_ANALYTICS_VIEW}_id ON {ADMIN_ANALYTICS_VIEW} (id)"
+        ))
+    
+    _admin_view_ready = True
+    return True
+
+def refresh_admin_analytics_view(engine):
+    """Recompute the admin analytics view without blocking readers"""
+    with engine.begin() as conn:
+        conn.execute(text(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {ADMIN_ANALYTICS_VIEW}"))
+
+async def refresh_admin_analytics_periodically(engine):
+    """Background task keeping the admin analytics view fresh"""
+    while True:
+        await asyncio.sleep(settings.ADMIN_ANALYTICS_REFRESH_SECONDS)
+        try:
+            await asyncio.to_thread(refresh_admin_analytics_view, engine)
+        except Exception:
+            logger.exception("Admin analytics view refresh failed")
+
 async def get_admin_analytics(db: Session) -> Dict[str, Any]:
     """Get system-wide analytics for admin dashboard"""
     
-    # User metrics
-    total_users = db.query(User).count()
-    active_users = db.query(User).filter(User.is_active == True).count()
-    admin_users = db.query(User).filter(User.role == "admin").count()
-    
-    # Job metrics
-    total_jobs = db.query(Job).count()
-    active_jobs = db.query(Job).filter(Job.is_active == True).count()
-    published_jobs = db.query(Job).filter(Job.is_published == True).count()
-    
-    # Candidate metrics
-    total_candidates = db.query(Candidate).count()
-    qualified_candidates = db.query(Candidate).filter(Candidate.is_qualified == True).count()
-    
-    # Interview metrics
-    total_interviews = db.query(Interview).count()
-    completed_interviews = db.query(Interview).filter(Interview.status == "completed").count()
-    
-    # Resume metrics
-    total_resumes = db.query(Resume).count()
-    processed_resumes = db.query(Resume).filter(Resume.is_processed == True).count()
+    cached = await _cache_get("analytics:admin")
+    if cached is not None:
+        return cached
     
-    # Credit metrics
-    total_credits_issued = db.query(func.sum(Credit.amount)).filter(Credit.amount > 0).scalar() or 0
-    total_credits_used = abs(db.query(func.sum(Credit.amount)).filter(Credit.amount < 0).scalar() or 0)
-    total_revenue = db.query(func.sum(Credit.amount_paid)).filter(Credit.amount_paid.isnot(None)).scalar() or 0.0
-    
-    # Recent activity (last 7 days)
-    week_ago = datetime.utcnow() - timedelta(days=7)
-    new_users_week = db.query(User).filter(User.created_at >= week_ago).count()
-    new_jobs_week = db.query(Job).filter(Job.created_at >= week_ago).count()
-    new_candidates_week = db.query(Candidate).filter(Candidate.application_date >= week_ago).count()
-    
-    return {
+    if _admin_view_ready:
+        # Precomputed by the materialized view, refreshed in the background
+        metrics = await _fetch_one(db, text(f"SELECT * FROM {ADMIN_ANALYTICS_VIEW}"))
+    else:
+        metrics = await _fetch_one(db, _admin_metrics_select(datetime.utcnow() - timedelta(days=7)))
+    
+    total_users = metrics.total_users
+    active_users = metrics.active_users
+    admin_users = metrics.admin_users
+    total_jobs = metrics.total_jobs
+    active_jobs = metrics.active_jobs
+    published_jobs = metrics.published_jobs
+    total_candidates = metrics.total_candidates
+    qualified_candidates = metrics.qualified_candidates
+    total_interviews = metrics.total_interviews
+    completed_interviews = metrics.completed_interviews
+    total_resumes = metrics.total_resumes
+    processed_resumes = metrics.processed_resumes
+    total_credits_issued = metrics.total_credits_issued or 0
+    total_credits_used = abs(metrics.total_credits_used or 0)
+    total_revenue = metrics.total_revenue or 0.0
+    new_users_week = metrics.new_users_week
+    new_jobs_week = metrics.new_jobs_week
+    new_candidates_week = metrics.new_candidates_week
+    
+    analytics = {
         "users": {
             "total": total_users,
             "active": active_users,
@@ -339,4 +493,6 @@ async def get_admin_analytics(db: Session) -> Dict[str, Any]:
             "total_revenue": float(total_revenue)
         }
     }
-
+    
+    await _cache_set("analytics:admin", analytics)
+    return analytics
@@ -1,22 +1,130 @@
 """
 Credit management service for handling user credits and transactions
+
+Ledger writes only flush; the caller owns the transaction and commits it together
+with its other changes (pass autocommit=True to commit inside the service instead).
 """
 
-from sqlalchemy.orm import Session
-from typing import Optional
+from sqlalchemy.orm import Session, aliased
+from sqlalchemy import event, func, update, select, insert, delete, bindparam, literal, union_all, tuple_, Integer
+from sqlalchemy.dialects import postgresql, sqlite
+from typing import Dict, List, Optional, Set, Tuple
 from datetime import datetime
+import logging
 
 from ..models.credit import Credit
+from ..models.credit_stats import CreditStats
 from ..models.user import User
 
+logger = logging.getLogger(__name__)
+
+# Hot-path statements are built once at import; values are bound per call, so SQLAlchemy
+# reuses the compiled SQL instead of rebuilding and re-keying the expression every time
+_BALANCE_QUERY = select(User.credit_balance).where(User.id == bindparam("uid"))
+
+_APPLY_BALANCE_CHANGE = (
+    update(User)
+    .where(User.id == bindparam("uid"), User.credit_balance + bindparam("delta") >= 0)
+    .values(credit_balance=User.credit_balance + bindparam("delta"))
+    .returning(User.credit_balance)
+)
+
+_INSERT_LEDGER_ENTRY = insert(Credit).returning(Credit.id)
+
+def _credit_stats_upsert(dialect_insert):
+    """Fold one ledger entry into credit_stats, creating the user's row on their first entry"""
+    stmt = dialect_insert(CreditStats).values(
+        user_id=bindparam("uid"),
+        total_earned=bindparam("earned"),
+        total_spent=bindparam("spent"),
+        current_balance=bindparam("balance_after"),
+        last_transaction_at=bindparam("now")
+    )
+    # One statement, so two first-time writers for a user can't both try to insert the row
+    return stmt.on_conflict_do_update(
+        index_elements=[CreditStats.user_id],
+        set_={
+            "total_earned": CreditStats.total_earned + stmt.excluded.total_earned,
+            "total_spent": CreditStats.total_spent + stmt.excluded.total_spent,
+            "current_balance": stmt.excluded.current_balance,
+            "last_transaction_at": stmt.excluded.last_transaction_at,
+            "updated_at": func.now()
+        }
+    )
+
+_UPSERT_CREDIT_STATS = {
+    "postgresql": _credit_stats_upsert(postgresql.insert),
+    "sqlite": _credit_stats_upsert(sqlite.insert)
+}
+
+# Keyset pagination on (created_at, id): each page is an index descent from the cursor,
+# so deep pages cost the same as the first one instead of reading and discarding rows
+_HISTORY_QUERY = (
+    select(Credit)
+    .where(Credit.user_id == bindparam("uid"))
+    .order_by(Credit.created_at.desc(), Credit.id.desc())
+    .limit(bindparam("limit"))
+)
+
+_HISTORY_AFTER_QUERY = _HISTORY_QUERY.where(
+    tuple_(Credit.created_at, Credit.id) < tuple_(bindparam("after_ts"), bindparam("after_id"))
+)
+
+# Balances already read or written in this session, keyed by user id; lives in Session.info
+# so it is scoped to the request's session and dropped with it
+_BALANCE_CACHE_KEY = "credit_balances"
+
+def _balance_cache(db: Session) -> Dict[int, int]:
+    """Return this session's balance cache, creating it on first use"""
+    return db.info.setdefault(_BALANCE_CACHE_KEY, {})
+
+@event.listens_for(Session, "after_rollback")
+def _clear_balance_cache(session):
+    """Rolled-back writes must not leave their balances behind in the cache"""
+    session.info.pop(_BALANCE_CACHE_KEY, None)
+
+def _finish(db: Session, autocommit: bool):
+    """Commit when asked to; otherwise flush so the caller's commit includes the ledger write"""
+    if autocommit:
+        db.commit()
+    else:
+        db.flush()
+
 async def get_user_credit_balance(user_id: int, db: Session) -> int:
     """Get current credit balance for user"""
     
-    latest_credit = db.query(Credit).filter(
-        Credit.user_id == user_id
-    ).order_by(Credit.created_at.desc()).first()
+    cache = _balance_cache(db)
+    if user_id not in cache:
+        cache[user_id] = db.execute(_BALANCE_QUERY, {"uid": user_id}).scalar() or 0
     
-    return latest_credit.balance_after if latest_credit else 0
+    return cache[user_id]
+
+def _apply_balance_change(user_id: int, delta: int, db: Session) -> Optional[int]:
+    """Atomically apply delta to the user's balance; returns the new balance, or None if it would go negative"""
+    
+    # Check and update in one statement so concurrent requests can't overdraw the account
+    balance = db.execute(_APPLY_BALANCE_CHANGE, {"uid": user_id, "delta": delta}).scalar()
+    if balance is not None:
+        _balance_cache(db)[user_id] = balance
+    
+    return balance
+
+def _record_ledger_entry(db: Session, **values) -> int:
+    """Append one ledger row with a single INSERT ... RETURNING; returns its id"""
+    
+    # Core insert: no ORM object to track, and the row is written now rather than at flush
+    return db.execute(_INSERT_LEDGER_ENTRY, values).scalar_one()
+
+def _update_credit_stats(user_id: int, delta: int, balance_after: int, db: Session):
+    """Fold one ledger entry into the user's pre-aggregated statistics"""
+    
+    db.execute(_UPSERT_CREDIT_STATS[db.get_bind().dialect.name], {
+        "uid": user_id,
+        "earned": max(delta, 0),
+        "spent": max(-delta, 0),
+        "balance_after": balance_after,
+        "now": datetime.utcnow()
+    })
 
 async def deduct_credits(
     user_id: int, 
@@ -24,36 +132,96 @@ async def deduct_credits(
     transaction_type: str, 
     db: Session,
     description: Optional[str] = None,
-    reference_id: Optional[str] = None
+    reference_id: Optional[str] = None,
+    autocommit: bool = False
 ) -> bool:
     """Deduct credits from user account"""
     
     if amount <= 0:
         return False
     
-    # Get current balance
-    current_balance = await get_user_credit_balance(user_id, db)
-    
-    # Check if user has enough credits
-    if current_balance < amount:
+    # Deduct only if the user has enough credits
+    balance_after = _apply_balance_change(user_id, -amount, db)
+    if balance_after is None:
         return False
     
-    # Create deduction transaction
-    credit_transaction = Credit(
+    # Record the deduction in the ledger
+    _record_ledger_entry(
+        db,
         user_id=user_id,
         amount=-amount,  # Negative for deduction
-        balance_after=current_balance - amount,
+        balance_after=balance_after,
         transaction_type=transaction_type,
         description=description or f"Credit usage: {transaction_type}",
         reference_id=reference_id,
         status="completed"
     )
-    
-    db.add(credit_transaction)
-    db.commit()
+    _update_credit_stats(user_id, -amount, balance_after, db)
+    _finish(db, autocommit)
     
     return True
 
+async def deduct_credits_bulk(
+    deductions: List[Tuple[int, int, str, Optional[str]]],
+    db: Session,
+    autocommit: bool = False
+) -> Set[int]:
+    """Deduct credits for many users with one UPDATE and one multi-row INSERT
+
+    Each deduction is (user_id, amount, transaction_type, reference_id). A user's
+    deductions in the batch succeed or fail together; returns the ids of users charged.
+    """
+    
+    pending = [deduction for deduction in deductions if deduction[1] > 0]
+    if not pending:
+        return set()
+    
+    totals: Dict[int, int] = {}
+    for user_id, amount, _, _ in pending:
+        totals[user_id] = totals.get(user_id, 0) + amount
+    
+    # Charge every user whose balance covers their batch total in a single statement
+    batch = union_all(*[
+        select(literal(user_id, Integer).label("user_id"), literal(total, Integer).label("amount"))
+        for user_id, total in totals.items()
+    ]).subquery("batch")
+    charged = dict(db.execute(
+        update(User)
+        .where(User.id == batch.c.user_id, User.credit_balance >= batch.c.amount)
+        .values(credit_balance=User.credit_balance - batch.c.amount)
+        .returning(User.id, User.credit_balance),
+        execution_options={"synchronize_session": False}
+    ).all())
+    
+    if not charged:
+        return set()
+    
+    _balance_cache(db).update(charged)
+    
+    # Replay each user's deductions in order so every ledger row carries its running balance
+    balances = {user_id: balance + totals[user_id] for user_id, balance in charged.items()}
+    ledger_rows = []
+    for user_id, amount, transaction_type, reference_id in pending:
+        if user_id not in charged:
+            continue
+        balances[user_id] -= amount
+        ledger_rows.append({
+            "user_id": user_id,
+            "amount": -amount,
+            "balance_after": balances[user_id],
+            "transaction_type": transaction_type,
+            "description": f"Credit usage: {transaction_type}",
+            "reference_id": reference_id,
+            "status": "completed"
+        })
+    
+    db.execute(insert(Credit), ledger_rows)
+    for user_id, balance_after in charged.items():
+        _update_credit_stats(user_id, -totals[user_id], balance_after, db)
+    _finish(db, autocommit)
+    
+    return set(charged)
+
 async def add_credits(
     user_id: int,
     amount: int,
@@ -64,21 +232,24 @@ async def add_credits(
     payment_method: Optional[str] = None,
     payment_reference: Optional[str] = None,
     amount_paid: Optional[float] = None,
-    currency: Optional[str] = None
+    currency: Optional[str] = None,
+    autocommit: bool = False
 ) -> bool:
     """Add credits to user account"""
     
     if amount <= 0:
         return False
     
-    # Get current balance
-    current_balance = await get_user_credit_balance(user_id, db)
+    balance_after = _apply_balance_change(user_id, amount, db)
+    if balance_after is None:
+        return False
     
-    # Create addition transaction
-    credit_transaction = Credit(
+    # Record the addition in the ledger
+    _record_ledger_entry(
+        db,
         user_id=user_id,
         amount=amount,  # Positive for addition
-        balance_after=current_balance + amount,
+        balance_after=balance_after,
         transaction_type=transaction_type,
         description=description or f"Credit purchase: {amount} credits",
         reference_id=reference_id,
@@ -88,54 +259,73 @@ async def add_credits(
         currency=currency,
         status="completed"
     )
-    
-    db.add(credit_transaction)
-    db.commit()
+    _update_credit_stats(user_id, amount, balance_after, db)
+    _finish(db, autocommit)
     
     return True
 
 async def get_credit_history(
     user_id: int, 
     db: Session, 
-    skip: int = 0, 
-    limit: int = 100
-) -> list:
-    """Get credit transaction history for user"""
+    after: Optional[Tuple[datetime, int]] = None, 
+    limit: int = 100,
+    transaction_type: Optional[str] = None
+) -> Tuple[list, Optional[Tuple[datetime, int]]]:
+    """Get a page of credit transaction history for user, newest first
+    
+    Pass the cursor returned with the previous page as `after` to fetch the next one;
+    the cursor is None once the last page has been reached.
+    """
+    
+    params = {"uid": user_id, "limit": limit}
+    if after is None:
+        stmt = _HISTORY_QUERY
+    else:
+        stmt = _HISTORY_AFTER_QUERY
+        params["after_ts"], params["after_id"] = after
+    
+    if transaction_type:
+        stmt = stmt.where(Credit.transaction_type == transaction_type)
     
-    credits = db.query(Credit).filter(
-        Credit.user_id == user_id
-    ).order_by(Credit.created_at.desc()).offset(skip).limit(limit).all()
+    credits = db.execute(stmt, params).scalars().all()
     
-    return credits
+    next_cursor = None
+    if len(credits) == limit:
+        last = credits[-1]
+        next_cursor = (last.created_at, last.id)
+    
+    return credits, next_cursor
 
 async def get_credit_statistics(user_id: int, db: Session) -> dict:
     """Get credit statistics for user"""
     
-    # Total credits earned (positive transactions)
-    total_earned = db.query(Credit).filter(
-        Credit.user_id == user_id,
-        Credit.amount > 0
-    ).with_entities(db.func.sum(Credit.amount)).scalar() or 0
-    
-    # Total credits spent (negative transactions)
-    total_spent = abs(db.query(Credit).filter(
-        Credit.user_id == user_id,
-        Credit.amount < 0
-    ).with_entities(db.func.sum(Credit.amount)).scalar() or 0)
-    
-    # Current balance
+    # The balance comes from users.credit_balance, the value charges are checked against
     current_balance = await get_user_credit_balance(user_id, db)
     
-    # Last transaction date
-    last_transaction = db.query(Credit).filter(
-        Credit.user_id == user_id
-    ).order_by(Credit.created_at.desc()).first()
+    # Totals are maintained incrementally by every ledger write
+    stats = db.get(CreditStats, user_id)
+    if stats:
+        return {
+            "current_balance": current_balance,
+            "total_earned": stats.total_earned,
+            "total_spent": stats.total_spent,
+            "last_transaction": stats.last_transaction_at
+        }
+    
+    # No stats row yet (history predates the backfill): aggregate the ledger in one round trip
+    totals = db.execute(
+        select(
+            func.sum(Credit.amount).filter(Credit.amount > 0).label("total_earned"),
+            func.sum(Credit.amount).filter(Credit.amount < 0).label("total_spent"),
+            func.max(Credit.created_at).label("last_transaction")
+        ).where(Credit.user_id == user_id)
+    ).one()
     
     return {
         "current_balance": current_balance,
-        "total_earned": total_earned,
-        "total_spent": total_spent,
-        "last_transaction": last_transaction.created_at if last_transaction else None
+        "total_earned": totals.total_earned or 0,
+        "total_spent": abs(totals.total_spent or 0),
+        "last_transaction": totals.last_transaction
     }
 
 async def process_credit_purchase(
@@ -145,7 +335,8 @@ async def process_credit_purchase(
     payment_reference: str,
     amount_paid: float,
     currency: str,
-    db: Session
+    db: Session,
+    autocommit: bool = False
 ) -> bool:
     """Process credit purchase transaction"""
     
@@ -160,21 +351,24 @@ async def process_credit_purchase(
             payment_method=payment_method,
             payment_reference=payment_reference,
             amount_paid=amount_paid,
-            currency=currency
+            currency=currency,
+            autocommit=autocommit
         )
         
         return success
         
-    except Exception as e:
-        print(f"Error processing credit purchase: {e}")
-        return False
+    except Exception:
+        # Re-raise so the caller's transaction is rolled back instead of committed half-done
+        logger.exception("Error processing credit purchase", extra={"user_id": user_id})
+        raise
 
 async def refund_credits(
     user_id: int,
     amount: int,
     original_transaction_id: str,
     db: Session,
-    reason: Optional[str] = None
+    reason: Optional[str] = None,
+    autocommit: bool = False
 ) -> bool:
     """Refund credits to user account"""
     
@@ -186,12 +380,57 @@ async def refund_credits(
             transaction_type="refund",
             db=db,
             description=f"Credit refund: {reason or 'Refund processed'}",
-            reference_id=original_transaction_id
+            reference_id=original_transaction_id,
+            autocommit=autocommit
         )
         
         return success
         
-    except Exception as e:
-        print(f"Error processing credit refund: {e}")
-        return False
+    except Exception:
+        logger.exception("Error processing credit refund", extra={"user_id": user_id})
+        raise
+
+async def reconcile_credit_balances(db: Session) -> int:
+    """Reset denormalized balances that drifted from the ledger; returns how many were fixed"""
+    
+    latest = select(Credit.balance_after).where(
+        Credit.user_id == User.id
+    ).order_by(Credit.created_at.desc(), Credit.id.desc()).limit(1).scalar_subquery()
+    ledger_balance = func.coalesce(latest, 0)
+    
+    result = db.execute(
+        update(User)
+        .where(User.credit_balance != ledger_balance)
+        .values(credit_balance=ledger_balance)
+    )
+    db.commit()
+    db.info.pop(_BALANCE_CACHE_KEY, None)
+    
+    return result.rowcount
 
+async def backfill_credit_stats(db: Session) -> int:
+    """Rebuild credit_stats from the full ledger in one grouped pass; returns the number of users"""
+    
+    latest = aliased(Credit)
+    latest_balance = select(latest.balance_after).where(
+        latest.user_id == Credit.user_id
+    ).order_by(latest.created_at.desc(), latest.id.desc()).limit(1).scalar_subquery()
+    
+    totals = select(
+        Credit.user_id,
+        func.coalesce(func.sum(Credit.amount).filter(Credit.amount > 0), 0),
+        func.coalesce(-func.sum(Credit.amount).filter(Credit.amount < 0), 0),
+        latest_balance,
+        func.max(Credit.created_at)
+    ).group_by(Credit.user_id)
+    
+    db.execute(delete(CreditStats))
+    result = db.execute(
+        insert(CreditStats).from_select(
+            ["user_id", "total_earned", "total_spent", "current_balance", "last_transaction_at"],
+            totals
+        )
+    )
+    db.commit()
+    
+    return result.rowcount
@@ -3,17 +3,77 @@ Enhanced Multi-Provider AI service with Google AI integration
 Maintains backward compatibility while adding Google AI Studio features
 """
 
+import asyncio
 import json
 import logging
-from typing import Dict, List, Any, Optional, Union
-from datetime import datetime
+from typing import Dict, List, Any, Optional, Tuple, Union
+from datetime import datetime, timedelta, timezone
+from cachetools import TTLCache
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 
 from .ai_service import MultiProviderAIService
 from .google_ai_service import google_ai_service
 from ..core.config import settings
+from ..core.database import SessionLocal
+from ..models.ai_parse_cache import AIParseCache
 
 logger = logging.getLogger(__name__)
 
+# Google AI parses are deterministic per input text; retries and re-uploads reuse them
+_PARSE_CACHE_SIZE = 1024
+_PARSE_CACHE_TTL = 3600
+
+_QUESTION_CATEGORIES = ('general', 'technical', 'behavioral', 'situational')
+
+# Static fallback question bank; the question dicts are shared between calls, treat them as read-only
+_BASIC_QUESTIONS = (
+    {"question": "Tell me about yourself and your experience.", "category": "general", "duration": 5},
+    {"question": "Why are you interested in this position?", "category": "general", "duration": 3},
+    {"question": "What are your greatest strengths?", "category": "behavioral", "duration": 4},
+    {"question": "Describe a challenging project you worked on.", "category": "behavioral", "duration": 6},
+    {"question": "Where do you see yourself in 5 years?", "category": "general", "duration": 3}
+)
+_BASIC_DURATION = sum(q["duration"] for q in _BASIC_QUESTIONS)
+
+def _load_stored_parse(content_hash: str) -> Optional[Dict]:
+    """Read a persisted parse younger than AI_CACHE_TTL; storage errors only cost a fresh parse"""
+    db = SessionLocal()
+    try:
+        cutoff = datetime.now(timezone.utc) - timedelta(seconds=settings.AI_CACHE_TTL)
+        return db.execute(
+            select(AIParseCache.result).where(
+                AIParseCache.content_hash == content_hash,
+                AIParseCache.created_at > cutoff
+            )
+        ).scalar()
+    except SQLAlchemyError as e:
+        logger.warning(f"AI parse cache lookup failed: {e}")
+        return None
+    finally:
+        db.close()
+
+def _store_parse(content_hash: str, kind: str, result: Dict):
+    """Persist a parse, replacing an expired one; a concurrent writer that got there first wins"""
+    db = SessionLocal()
+    try:
+        db.merge(AIParseCache(
+            content_hash=content_hash, kind=kind, result=result,
+            created_at=datetime.now(timezone.utc)
+        ))
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+    except SQLAlchemyError as e:
+        db.rollback()
+        logger.warning(f"AI parse cache write failed: {e}")
+    finally:
+        db.close()
+
+def _now_iso() -> str:
+    """Timestamp stamped on formatted analysis results"""
+    return datetime.now(timezone.utc).isoformat()
+
 class EnhancedAIService(MultiProviderAIService):
     """
     Enhanced AI service that extends the existing MultiProviderAIService
@@ -23,6 +83,37 @@ class EnhancedAIService(MultiProviderAIService):
     def __init__(self):
         super().__init__()
         self.google_ai_available = bool(settings.GOOGLE_AI_API_KEY)
+        self._parse_cache = TTLCache(maxsize=_PARSE_CACHE_SIZE, ttl=_PARSE_CACHE_TTL)
+        self._parse_inflight: Dict[str, asyncio.Task] = {}
+    
+    async def _cached_parse(self, kind: str, text: str, parse) -> Optional[Dict]:
+        """Run a Google AI parse once per distinct text; concurrent callers share one request"""
+        key = self._cache_key(kind, text)
+        if key in self._parse_cache:
+            return self._parse_cache[key]
+        
+        # Every caller awaits the same task; it leaves the map only once it has finished,
+        # by which time a successful result is already in the cache for later callers
+        task = self._parse_inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._run_parse(key, kind, text, parse))
+            self._parse_inflight[key] = task
+            task.add_done_callback(lambda _: self._parse_inflight.pop(key, None))
+        
+        # Shielded so one caller giving up doesn't cancel the request for the others
+        return await asyncio.shield(task)
+    
+    async def _run_parse(self, key: str, kind: str, text: str, parse) -> Optional[Dict]:
+        """Answer a parse from the database, or run it and store the result"""
+        # Re-uploads of the same document are answered from the database
+        result = await asyncio.to_thread(_load_stored_parse, key)
+        if result is None:
+            result = await parse(text)
+            if result:
+                await asyncio.to_thread(_store_parse, key, kind, result)
+        if result:
+            self._parse_cache[key] = result
+        return result
     
     def _format_resume_analysis(self, google_ai_result: Dict, provider: str) -> Dict[str, Any]:
         """Format Google AI result to match existing API structure"""
@@ -30,39 +121,43 @@ class EnhancedAIService(MultiProviderAIService):
             return {}
         
         candidate = google_ai_result['candidate']
+        contact_info = candidate.get('contact_info') or {}
+        skills = candidate.get('skills_section', [])
+        work_experience = candidate.get('work_experience', [])
+        education = candidate.get('education', [])
         
         # Convert to existing format while preserving new data
         formatted_result = {
             "provider": provider,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _now_iso(),
             "success": True,
             
             # Existing format fields
-            "name": candidate.get('contact_info', {}).get('name', ''),
-            "email": candidate.get('contact_info', {}).get('email', ''),
-            "phone": candidate.get('contact_info', {}).get('phone', ''),
-            "skills": candidate.get('skills_section', []),
+            "name": contact_info.get('name', ''),
+            "email": contact_info.get('email', ''),
+            "phone": contact_info.get('phone', ''),
+            "skills": skills,
             "experience_years": candidate.get('experience_years', 0),
             "summary": candidate.get('summary', ''),
             
             # Enhanced fields from Google AI
             "enhanced_data": {
-                "contact_info": candidate.get('contact_info', {}),
+                "contact_info": contact_info,
                 "top_skills": candidate.get('top_skills', []),
-                "work_experience": candidate.get('work_experience', []),
-                "education": candidate.get('education', []),
+                "work_experience": work_experience,
+                "education": education,
                 "certifications": candidate.get('certifications', []),
-                "linkedin": candidate.get('contact_info', {}).get('linkedin', ''),
+                "linkedin": contact_info.get('linkedin', ''),
                 "location": {
-                    "city": candidate.get('contact_info', {}).get('city', ''),
-                    "state": candidate.get('contact_info', {}).get('state', '')
+                    "city": contact_info.get('city', ''),
+                    "state": contact_info.get('state', '')
                 }
             },
             
             # Compatibility fields
-            "extracted_skills": candidate.get('skills_section', []),
-            "work_history": candidate.get('work_experience', []),
-            "education_history": candidate.get('education', [])
+            "extracted_skills": skills,
+            "work_history": work_experience,
+            "education_history": education
         }
         
         return formatted_result
@@ -73,10 +168,12 @@ class EnhancedAIService(MultiProviderAIService):
             return {}
         
         job = google_ai_result['job']
+        qualifications = job.get('qualifications', [])
+        required_skills = job.get('required_skills', [])
         
         formatted_result = {
             "provider": provider,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _now_iso(),
             "success": True,
             
             # Existing format fields
@@ -84,14 +181,14 @@ class EnhancedAIService(MultiProviderAIService):
             "company": job.get('company', ''),
             "location": job.get('location', ''),
             "description": job.get('summary', ''),
-            "requirements": job.get('qualifications', []),
-            "skills_required": job.get('required_skills', []),
+            "requirements": qualifications,
+            "skills_required": required_skills,
             
             # Enhanced fields from Google AI
             "enhanced_data": {
                 "responsibilities": job.get('responsibilities', []),
-                "qualifications": job.get('qualifications', []),
-                "required_skills": job.get('required_skills', []),
+                "qualifications": qualifications,
+                "required_skills": required_skills,
                 "preferred_skills": job.get('preferred_skills', []),
                 "experience_level": job.get('experience_level', ''),
                 "experience_years": job.get('experience_years', 0),
@@ -101,8 +198,8 @@ class EnhancedAIService(MultiProviderAIService):
             },
             
             # Compatibility fields
-            "extracted_requirements": job.get('qualifications', []),
-            "key_skills": job.get('required_skills', [])
+            "extracted_requirements": qualifications,
+            "key_skills": required_skills
         }
         
         return formatted_result
@@ -115,7 +212,9 @@ class EnhancedAIService(MultiProviderAIService):
         try:
             # Try Google AI first for comprehensive analysis
             if self.google_ai_available:
-                result = await google_ai_service.parse_resume_comprehensive(resume_text)
+                result = await self._cached_parse(
+                    "google_resume", resume_text, google_ai_service.parse_resume_comprehensive
+                )
                 if result:
                     logger.info("Enhanced resume analysis completed with Google AI")
                     return self._format_resume_analysis(result, "google_ai")
@@ -135,7 +234,9 @@ class EnhancedAIService(MultiProviderAIService):
         try:
             # Try Google AI first for comprehensive analysis
             if self.google_ai_available:
-                result = await google_ai_service.parse_job_comprehensive(job_description)
+                result = await self._cached_parse(
+                    "google_job", job_description, google_ai_service.parse_job_comprehensive
+                )
                 if result:
                     logger.info("Enhanced job analysis completed with Google AI")
                     return self._format_job_analysis(result, "google_ai")
@@ -144,7 +245,7 @@ class EnhancedAIService(MultiProviderAIService):
             logger.info("Using basic job analysis")
             return {
                 "provider": "offline",
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": _now_iso(),
                 "success": True,
                 "title": "Job Position",
                 "company": "Company",
@@ -159,6 +260,16 @@ class EnhancedAIService(MultiProviderAIService):
             logger.error(f"Enhanced job analysis failed: {e}")
             return {"success": False, "error": str(e)}
     
+    async def analyze_pair(self, resume_text: str, job_description: str) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Analyze a resume and a job concurrently; the two provider calls are independent
+        """
+        resume_analysis, job_analysis = await asyncio.gather(
+            self.analyze_resume_enhanced(resume_text),
+            self.analyze_job_enhanced(job_description)
+        )
+        return resume_analysis, job_analysis
+    
     async def match_candidate_enhanced(self, candidate_data: Dict, job_data: Dict) -> Dict[str, Any]:
         """
         Enhanced candidate matching with Google AI integration
@@ -185,21 +296,24 @@ class EnhancedAIService(MultiProviderAIService):
     
     def _format_match_analysis(self, match_analysis: Dict, provider: str) -> Dict[str, Any]:
         """Format Google AI match analysis to existing structure"""
+        overall_score = match_analysis.get('overall_score', 0)
+        skill_match = match_analysis.get('skill_match') or {}
+        
         return {
             "provider": provider,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _now_iso(),
             "success": True,
             
             # Existing format
-            "overall_score": match_analysis.get('overall_score', 0),
-            "match_percentage": match_analysis.get('overall_score', 0),
-            "matched_skills": match_analysis.get('skill_match', {}).get('matched_skills', []),
-            "missing_skills": match_analysis.get('skill_match', {}).get('missing_skills', []),
+            "overall_score": overall_score,
+            "match_percentage": overall_score,
+            "matched_skills": skill_match.get('matched_skills', []),
+            "missing_skills": skill_match.get('missing_skills', []),
             "recommendation": match_analysis.get('recommendation', 'review'),
             
             # Enhanced analysis
             "enhanced_analysis": {
-                "skill_match": match_analysis.get('skill_match', {}),
+                "skill_match": skill_match,
                 "experience_match": match_analysis.get('experience_match', {}),
                 "education_match": match_analysis.get('education_match', {}),
                 "location_match": match_analysis.get('location_match', {}),
@@ -225,13 +339,21 @@ class EnhancedAIService(MultiProviderAIService):
                 "recommendation": "review"
             }
         
-        # Simple skill matching
+        # Simple skill matching: lowercase each side once, exact matches skip the substring scan
+        cand_lc = {skill.lower() for skill in candidate_skills}
+        req_lc = [(req, req.lower()) for req in job_requirements]
+        req_set = {rl for _, rl in req_lc}
+        
         matched_skills = []
         for skill in candidate_skills:
-            for req in job_requirements:
-                if skill.lower() in req.lower() or req.lower() in skill.lower():
-                    matched_skills.append(skill)
-                    break
+            sl = skill.lower()
+            if sl in req_set or any(sl in rl or rl in sl for rl in req_set):
+                matched_skills.append(skill)
+        
+        missing_skills = [
+            req for req, rl in req_lc
+            if rl not in cand_lc and not any(sl in rl for sl in cand_lc)
+        ]
         
         match_score = (len(matched_skills) / len(job_requirements)) * 100 if job_requirements else 0
         
@@ -241,7 +363,7 @@ class EnhancedAIService(MultiProviderAIService):
             "overall_score": min(match_score, 100),
             "match_percentage": min(match_score, 100),
             "matched_skills": matched_skills,
-            "missing_skills": [req for req in job_requirements if not any(skill.lower() in req.lower() for skill in candidate_skills)],
+            "missing_skills": missing_skills,
             "recommendation": "hire" if match_score > 80 else "interview" if match_score > 60 else "review"
         }
     
@@ -273,44 +395,35 @@ class EnhancedAIService(MultiProviderAIService):
         questions = google_result.get('interview_questions', {})
         
         # Flatten all questions into a single list for backward compatibility
-        all_questions = []
-        
-        for category in ['general', 'technical', 'behavioral', 'situational']:
-            category_questions = questions.get(category, [])
-            for q in category_questions:
-                all_questions.append({
-                    "question": q.get('question', ''),
-                    "category": category,
-                    "type": q.get('type', category),
-                    "difficulty": q.get('difficulty', 'medium'),
-                    "duration": q.get('expected_duration', 5)
-                })
+        all_questions = [
+            {
+                "question": q.get('question', ''),
+                "category": category,
+                "type": q.get('type', category),
+                "difficulty": q.get('difficulty', 'medium'),
+                "duration": q.get('expected_duration', 5)
+            }
+            for category in _QUESTION_CATEGORIES
+            for q in questions.get(category) or ()
+        ]
         
         return {
             "provider": provider,
             "success": True,
             "questions": all_questions,
             "total_questions": len(all_questions),
-            "estimated_duration": google_result.get('estimated_duration', len(all_questions) * 5),
+            "estimated_duration": google_result.get('estimated_duration') or sum(q["duration"] for q in all_questions),
             "enhanced_structure": questions
         }
     
     def _generate_basic_interview_questions(self, job_data: Dict) -> Dict[str, Any]:
         """Basic interview question generation fallback"""
-        basic_questions = [
-            {"question": "Tell me about yourself and your experience.", "category": "general", "duration": 5},
-            {"question": "Why are you interested in this position?", "category": "general", "duration": 3},
-            {"question": "What are your greatest strengths?", "category": "behavioral", "duration": 4},
-            {"question": "Describe a challenging project you worked on.", "category": "behavioral", "duration": 6},
-            {"question": "Where do you see yourself in 5 years?", "category": "general", "duration": 3}
-        ]
-        
         return {
             "provider": "offline",
             "success": True,
-            "questions": basic_questions,
-            "total_questions": len(basic_questions),
-            "estimated_duration": sum(q["duration"] for q in basic_questions)
+            "questions": list(_BASIC_QUESTIONS),
+            "total_questions": len(_BASIC_QUESTIONS),
+            "estimated_duration": _BASIC_DURATION
         }
 
 # Global instance
@@ -321,6 +434,10 @@ async def analyze_resume_with_ai(resume_text: str, job_requirements: List[str] =
     """Backward compatible resume analysis"""
     return await enhanced_ai_service.analyze_resume_enhanced(resume_text, job_requirements)
 
+async def analyze_resume_and_job_with_ai(resume_text: str, job_description: str) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """Resume and job analysis run concurrently"""
+    return await enhanced_ai_service.analyze_pair(resume_text, job_description)
+
 async def match_candidates_with_ai(candidate_data: Dict, job_data: Dict) -> Dict[str, Any]:
     """Backward compatible candidate matching"""
     return await enhanced_ai_service.match_candidate_enhanced(candidate_data, job_data)
@@ -3,15 +3,281 @@ Google AI service for enhanced resume and job analysis
 Integrates with Google AI Studio for comprehensive parsing and matching
 """
 
-import json
 import logging
 import asyncio
-from typing import Dict, List, Optional, Any
+import hashlib
+import re
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Any, Tuple
 import httpx
+import orjson
+from cachetools import LRUCache
+from tenacity import AsyncRetrying, retry_if_exception_type, stop_after_attempt, wait_exponential_jitter
 from ..core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Redis shares cached responses across workers and restarts (optional)
+try:
+    import redis.asyncio as aioredis
+except ImportError:
+    aioredis = None
+
+# aiohttp is an optional transport for heavily concurrent batch workloads (AI_HTTP_BACKEND)
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+# Network failures from either transport (aiohttp signals timeouts with asyncio.TimeoutError)
+_RETRYABLE_ERRORS = (httpx.TransportError, asyncio.TimeoutError) + ((aiohttp.ClientError,) if aiohttp else ())
+
+# Throttling and server-side failures are retried; other 4xx responses are permanent
+_RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+_RETRY_AFTER_CAP = 30.0
+_backoff = wait_exponential_jitter(1, 8)
+
+class _RetryableStatus(Exception):
+    """A response worth retrying, carrying the server's Retry-After hint when it sent one"""
+    
+    def __init__(self, status_code: int, retry_after: Optional[float]):
+        super().__init__(f"HTTP {status_code}")
+        self.retry_after = retry_after
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After in seconds; HTTP-date values fall back to the jittered backoff"""
+    try:
+        return max(float(value), 0.0) if value else None
+    except ValueError:
+        return None
+
+def _wait_for_retry(retry_state) -> float:
+    """Honour Retry-After on throttled responses, otherwise back off with jitter"""
+    error = retry_state.outcome.exception()
+    if isinstance(error, _RetryableStatus) and error.retry_after is not None:
+        return min(error.retry_after, _RETRY_AFTER_CAP)
+    return _backoff(retry_state)
+
+# Resumes per batched parse, bounded so the prompt stays near ~6k tokens (about 4 chars each)
+# and the combined output fits the batch token limit
+_BATCH_MAX_RESUMES = 5
+_BATCH_MAX_CHARS = 24000
+_BATCH_MAX_OUTPUT_TOKENS = 8192
+
+# Prompt templates: the fixed instructions and schema come first and the per-call data is
+# appended last, so every request shares a byte-identical prefix the provider can cache
+_RESUME_SCHEMA = """{
+  "candidate": {
+    "contact_info": {
+      "name": "string",
+      "city": "string",
+      "state": "string",
+      "phone": "string",
+      "email": "string",
+      "linkedin": "string"
+    },
+    "summary": "string - professional summary",
+    "top_skills": ["array of top 5 most important skills"],
+    "work_experience": [
+      {
+        "title": "string",
+        "company": "string",
+        "location": "string",
+        "start_date": "string",
+        "end_date": "string",
+        "responsibilities": ["array of key responsibilities"]
+      }
+    ],
+    "education": [
+      {
+        "degree": "string",
+        "institution": "string",
+        "location": "string",
+        "year": "string"
+      }
+    ],
+    "skills_section": ["array of all skills mentioned"],
+    "experience_years": "number - total years of experience",
+    "certifications": ["array of certifications if any"]
+  }
+}"""
+
+_RESUME_PROMPT = (
+    "Parse the following resume text and extract information in this exact JSON structure:\n\n"
+    + _RESUME_SCHEMA
+    + "\n\nIf information is not available, use empty string or empty array.\n\nResume text:\n"
+)
+
+_RESUME_BATCH_PROMPT = (
+    "Parse each resume below. Return {\"candidates\": [...]} with exactly one entry per resume, "
+    "in the order given, each shaped like the \"candidate\" object in this JSON structure:\n\n"
+    + _RESUME_SCHEMA
+    + "\n\nIf information is not available, use empty string or empty array.\n"
+)
+
+_JOB_PROMPT = """Parse the following job description and extract information in this exact JSON structure:
+
+{
+  "job": {
+    "title": "string",
+    "company": "string",
+    "location": "string",
+    "summary": "string - job summary",
+    "responsibilities": ["array of key responsibilities"],
+    "qualifications": ["array of required qualifications"],
+    "required_skills": ["array of required technical skills"],
+    "preferred_skills": ["array of preferred skills"],
+    "experience_level": "string - entry/mid/senior/executive",
+    "experience_years": "number - minimum years required",
+    "education_requirements": ["array of education requirements"],
+    "employment_type": "string - full-time/part-time/contract",
+    "salary_range": {
+      "min": "number or null",
+      "max": "number or null",
+      "currency": "string"
+    }
+  }
+}
+
+If information is not available, use empty string, empty array, or null.
+
+Job description:
+"""
+
+_MATCH_PROMPT = """Analyze the match between the candidate and job posting below. Provide detailed matching analysis.
+
+Return analysis in this exact JSON structure:
+
+{
+  "match_analysis": {
+    "overall_score": "number between 0-100",
+    "skill_match": {
+      "score": "number between 0-100",
+      "matched_skills": ["array of matching skills"],
+      "missing_skills": ["array of skills candidate lacks"],
+      "additional_skills": ["array of extra skills candidate has"]
+    },
+    "experience_match": {
+      "score": "number between 0-100",
+      "candidate_years": "number",
+      "required_years": "number",
+      "level_match": "string - under/meets/exceeds"
+    },
+    "education_match": {
+      "score": "number between 0-100",
+      "meets_requirements": "boolean",
+      "details": "string explanation"
+    },
+    "location_match": {
+      "score": "number between 0-100",
+      "compatible": "boolean",
+      "details": "string explanation"
+    },
+    "strengths": ["array of candidate strengths for this role"],
+    "concerns": ["array of potential concerns or gaps"],
+    "recommendation": "string - hire/interview/pass with reasoning",
+    "confidence": "number between 0-1"
+  }
+}
+
+Candidate:
+"""
+
+_INTERVIEW_SCHEMA = """
+
+Return questions in this exact JSON structure:
+
+{
+  "interview_questions": {
+    "general": [
+      {
+        "question": "string",
+        "type": "general",
+        "purpose": "string - what this question assesses",
+        "expected_duration": "number - minutes"
+      }
+    ],
+    "technical": [
+      {
+        "question": "string",
+        "type": "technical",
+        "skill_area": "string",
+        "difficulty": "string - easy/medium/hard",
+        "expected_duration": "number - minutes"
+      }
+    ],
+    "behavioral": [
+      {
+        "question": "string",
+        "type": "behavioral",
+        "competency": "string",
+        "expected_duration": "number - minutes"
+      }
+    ],
+    "situational": [
+      {
+        "question": "string",
+        "type": "situational",
+        "scenario": "string",
+        "expected_duration": "number - minutes"
+      }
+    ]
+  },
+  "total_questions": "number",
+  "estimated_duration": "number - total minutes"
+}
+
+Generate 8-12 questions total across all categories.
+
+Job:
+"""
+
+_INTERVIEW_PROMPT = "Generate interview questions for this job posting." + _INTERVIEW_SCHEMA
+_INTERVIEW_CANDIDATE_PROMPT = "Generate interview questions for this job posting and candidate." + _INTERVIEW_SCHEMA
+
+_PROMPT_SUFFIX = "\n\nReturn only valid JSON."
+
+@dataclass(frozen=True)
+class _PromptTemplate:
+    """A fixed prompt prefix plus the metadata used to cache and validate its responses
+    
+    Bump version whenever the template text changes so stale cached responses are not reused.
+    """
+    kind: str
+    version: str
+    prefix: str
+    required_key: str  # Top-level key a valid response must contain
+    
+    def render(self, *parts: str) -> str:
+        """Append the per-call text to the fixed prefix in one join"""
+        return "".join((self.prefix, *parts, _PROMPT_SUFFIX))
+
+_RESUME_TEMPLATE = _PromptTemplate("resume", "v2", _RESUME_PROMPT, "candidate")
+_RESUME_BATCH_TEMPLATE = _PromptTemplate("resume_batch", "v1", _RESUME_BATCH_PROMPT, "candidates")
+_JOB_TEMPLATE = _PromptTemplate("job", "v2", _JOB_PROMPT, "job")
+_MATCH_TEMPLATE = _PromptTemplate("match", "v2", _MATCH_PROMPT, "match_analysis")
+_INTERVIEW_TEMPLATE = _PromptTemplate("interview", "v2", _INTERVIEW_PROMPT, "interview_questions")
+_INTERVIEW_CANDIDATE_TEMPLATE = _PromptTemplate("interview", "v2", _INTERVIEW_CANDIDATE_PROMPT, "interview_questions")
+
+# Pre-pass over resume/job text: drop control characters, collapse runs of spaces and blank
+# lines. Whitespace and extraction noise cost input tokens without helping the parse.
+_NONPRINT_RE = re.compile(r"[^\t\n\x20-\x7e\u00a0-\uffff]")
+_SPACES_RE = re.compile(r"[ \t\u00a0]+")
+_LINE_EDGE_RE = re.compile(r" ?\n ?")
+_BLANK_LINES_RE = re.compile(r"\n{3,}")
+
+def _preprocess(text: str) -> str:
+    """Normalize document text before it is embedded in a prompt"""
+    text = _SPACES_RE.sub(" ", _NONPRINT_RE.sub("", text))
+    return _BLANK_LINES_RE.sub("\n\n", _LINE_EDGE_RE.sub("\n", text)).strip()
+
+# Compact, key-sorted payloads: fewer prompt tokens and a deterministic prompt for the cache key
+_PAYLOAD_DUMP_OPTIONS = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+
+def _dumps(obj: Any) -> str:
+    """Serialize a candidate/job payload for a prompt"""
+    return orjson.dumps(obj, option=_PAYLOAD_DUMP_OPTIONS, default=str).decode()
+
 class GoogleAIService:
     """Google AI service for resume and job analysis"""
     
@@ -19,24 +285,106 @@ class GoogleAIService:
         self.api_key = getattr(settings, 'GOOGLE_AI_API_KEY', None)
         self.base_url = "https://generativelanguage.googleapis.com/v1beta"
         self.model = "gemini-1.5-flash"
+        self._client: Optional[httpx.AsyncClient] = None
+        self._aiohttp_session = None
+        self._use_aiohttp = settings.AI_HTTP_BACKEND == "aiohttp"
+        if self._use_aiohttp and not aiohttp:
+            logger.warning("aiohttp package not available, Google AI requests use httpx")
+            self._use_aiohttp = False
         
-    async def _make_request(self, prompt: str, max_retries: int = 3) -> Optional[Dict]:
-        """Make request to Google AI API with retries"""
-        if not self.api_key:
-            logger.warning("Google AI API key not configured")
-            return None
-            
-        url = f"{self.base_url}/models/{self.model}:generateContent"
+        # Caps in-flight requests so concurrent pipelines don't trip the per-minute quota (429s)
+        self._semaphore = asyncio.Semaphore(settings.GOOGLE_AI_MAX_CONCURRENCY)
         
-        headers = {
-            "Content-Type": "application/json",
-        }
+        # Validated responses keyed by a hash of the prompt; Redis backs the LRU when configured
+        self._cache = LRUCache(maxsize=settings.AI_CACHE_SIZE)
+        self._redis = None
+        if settings.REDIS_URL and aioredis:
+            self._redis = aioredis.from_url(settings.REDIS_URL)
+    
+    async def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared Google AI client, creating it on first use so it binds to the running loop"""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                headers={"Content-Type": "application/json"},
+                params={"key": self.api_key},
+                timeout=httpx.Timeout(30.0),
+                # Idle connections are kept for a minute so bursts separated by short pauses reuse them
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=60.0),
+                http2=True
+            )
+        return self._client
+    
+    async def _get_aiohttp_session(self):
+        """Return the shared aiohttp session, creating it on first use inside the running loop"""
+        if self._aiohttp_session is None:
+            self._aiohttp_session = aiohttp.ClientSession(
+                headers={"Content-Type": "application/json"},
+                connector=aiohttp.TCPConnector(limit=100, limit_per_host=50, keepalive_timeout=60),
+                timeout=aiohttp.ClientTimeout(total=30)
+            )
+        return self._aiohttp_session
+    
+    async def _post(self, url: str, payload: Dict) -> Tuple[int, bytes, Optional[str]]:
+        """POST a JSON payload through the configured transport; returns (status, body, Retry-After)"""
+        if self._use_aiohttp:
+            session = await self._get_aiohttp_session()
+            async with session.post(
+                self.base_url + url, params={"key": self.api_key}, data=orjson.dumps(payload)
+            ) as response:
+                return response.status, await response.read(), response.headers.get("Retry-After")
         
-        params = {
-            "key": self.api_key
-        }
+        # Pooled keep-alive connections skip the TCP/TLS handshake on warm calls
+        client = await self._get_client()
+        response = await client.post(url, content=orjson.dumps(payload))
+        return response.status_code, response.content, response.headers.get("Retry-After")
+    
+    async def aclose(self):
+        """Close pooled connections; called on application shutdown"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        if self._aiohttp_session is not None:
+            await self._aiohttp_session.close()
+            self._aiohttp_session = None
+        if self._redis is not None:
+            await self._redis.aclose()
+    
+    async def _cached_request(
+        self, template: _PromptTemplate, prompt: str, max_output_tokens: int = 2048
+    ) -> Optional[Dict]:
+        """Send a prompt unless an identical one was answered before; only valid responses are cached"""
+        digest = hashlib.sha256(f"{template.kind}:{template.version}:".encode())
+        digest.update(prompt.encode())
+        key = f"llm:{digest.hexdigest()}"
+        
+        if key in self._cache:
+            return self._cache[key]
+        if self._redis is not None:
+            try:
+                raw = await self._redis.get(key)
+                if raw is not None:
+                    result = self._cache[key] = orjson.loads(raw)
+                    return result
+            except Exception as e:
+                logger.warning("Google AI cache lookup failed: %s", e)
+        
+        result = await self._make_request(prompt, max_output_tokens=max_output_tokens)
+        if not result or template.required_key not in result:
+            return None
+        
+        self._cache[key] = result
+        if self._redis is not None:
+            try:
+                await self._redis.set(key, orjson.dumps(result), ex=settings.AI_CACHE_TTL)
+            except Exception as e:
+                logger.warning("Google AI cache write failed: %s", e)
+        return result
         
-        payload = {
+    @staticmethod
+    def _build_payload(prompt: str, max_output_tokens: int = 2048) -> Dict:
+        """Request body for a generateContent call"""
+        return {
             "contents": [{
                 "parts": [{
                     "text": prompt
@@ -46,264 +394,152 @@ class GoogleAIService:
                 "temperature": 0.3,
                 "topK": 40,
                 "topP": 0.95,
-                "maxOutputTokens": 2048,
+                "maxOutputTokens": max_output_tokens,
             }
         }
+    
+    async def _make_request(self, prompt: str, max_retries: int = 3, max_output_tokens: int = 2048) -> Optional[Dict]:
+        """Make request to Google AI API with retries"""
+        if not self.api_key:
+            logger.warning("Google AI API key not configured")
+            return None
+            
+        url = f"/models/{self.model}:generateContent"
+        payload = self._build_payload(prompt, max_output_tokens)
         
-        for attempt in range(max_retries):
-            try:
-                async with httpx.AsyncClient(timeout=30.0) as client:
-                    response = await client.post(
-                        url, 
-                        headers=headers, 
-                        params=params,
-                        json=payload
-                    )
-                    
-                    if response.status_code == 200:
-                        result = response.json()
-                        if 'candidates' in result and result['candidates']:
-                            content = result['candidates'][0]['content']['parts'][0]['text']
-                            try:
-                                # Try to parse as JSON
-                                return json.loads(content)
-                            except json.JSONDecodeError:
-                                # Return as text if not JSON
-                                return {"text": content}
-                        return None
-                    else:
-                        logger.error(f"Google AI API error: {response.status_code} - {response.text}")
-                        
-            except Exception as e:
-                logger.error(f"Google AI API request failed (attempt {attempt + 1}): {str(e)}")
-                if attempt < max_retries - 1:
-                    await asyncio.sleep(2 ** attempt)  # Exponential backoff
-                    
+        # Only throttling, 5xx and network errors are retried; the slot is released while waiting
+        retrying = AsyncRetrying(
+            stop=stop_after_attempt(max_retries),
+            wait=_wait_for_retry,
+            retry=retry_if_exception_type(_RETRYABLE_ERRORS + (_RetryableStatus,)),
+            before_sleep=lambda state: logger.warning(
+                "Google AI API request failed (attempt %d): %s", state.attempt_number, state.outcome.exception()
+            ),
+            reraise=True
+        )
+        try:
+            async for attempt in retrying:
+                with attempt:
+                    async with self._semaphore:
+                        status_code, body, retry_after = await self._post(url, payload)
+                    if status_code in _RETRYABLE_STATUSES:
+                        raise _RetryableStatus(status_code, _parse_retry_after(retry_after))
+        except _RETRYABLE_ERRORS + (_RetryableStatus,) as e:
+            logger.error("Google AI API request failed: %s", e)
+            return None
+        except Exception:
+            # Every public method funnels through here, so this is the one place that logs tracebacks
+            logger.exception("Google AI API request failed")
+            return None
+        
+        if status_code != 200:
+            logger.error("Google AI API error: %s - %s", status_code, body.decode(errors='replace'))
+            return None
+        
+        try:
+            result = orjson.loads(body)
+            if 'candidates' in result and result['candidates']:
+                content = result['candidates'][0]['content']['parts'][0]['text']
+                try:
+                    # Try to parse as JSON
+                    return orjson.loads(content)
+                except orjson.JSONDecodeError:
+                    # Return as text if not JSON
+                    return {"text": content}
+        except (orjson.JSONDecodeError, KeyError, IndexError, TypeError) as e:
+            logger.error("Unexpected Google AI API response: %s", e)
         return None
 
     async def parse_resume_comprehensive(self, resume_text: str) -> Optional[Dict]:
         """Parse resume using Google AI with comprehensive structure"""
         
-        prompt = f"""
-        Parse the following resume text and extract information in this exact JSON structure:
-        
-        {{
-          "candidate": {{
-            "contact_info": {{
-              "name": "string",
-              "city": "string",
-              "state": "string", 
-              "phone": "string",
-              "email": "string",
-              "linkedin": "string"
-            }},
-            "summary": "string - professional summary",
-            "top_skills": ["array of top 5 most important skills"],
-            "work_experience": [
-              {{
-                "title": "string",
-                "company": "string",
-                "location": "string", 
-                "start_date": "string",
-                "end_date": "string",
-                "responsibilities": ["array of key responsibilities"]
-              }}
-            ],
-            "education": [
-              {{
-                "degree": "string",
-                "institution": "string",
-                "location": "string",
-                "year": "string"
-              }}
-            ],
-            "skills_section": ["array of all skills mentioned"],
-            "experience_years": "number - total years of experience",
-            "certifications": ["array of certifications if any"]
-          }}
-        }}
+        prompt = _RESUME_TEMPLATE.render(_preprocess(resume_text))
         
-        Resume text:
-        {resume_text}
+        return await self._cached_request(_RESUME_TEMPLATE, prompt)
+
+    async def parse_resumes_batch(self, resume_texts: List[str]) -> List[Optional[Dict]]:
+        """Parse many resumes with a few multi-resume prompts; results keep the input order
         
-        Return only valid JSON. If information is not available, use empty string or empty array.
+        Each result has the same shape as parse_resume_comprehensive's. A batch whose
+        response doesn't line up with its input is re-parsed one resume at a time.
         """
+        chunks: List[List[str]] = []
+        size = 0
+        for text in resume_texts:
+            if chunks and len(chunks[-1]) < _BATCH_MAX_RESUMES and size + len(text) <= _BATCH_MAX_CHARS:
+                chunks[-1].append(text)
+                size += len(text)
+            else:
+                chunks.append([text])
+                size = len(text)
         
-        try:
-            result = await self._make_request(prompt)
-            if result and 'candidate' in result:
-                return result
-            return None
-        except Exception as e:
-            logger.error(f"Error parsing resume with Google AI: {str(e)}")
-            return None
-
-    async def parse_job_comprehensive(self, job_description: str) -> Optional[Dict]:
-        """Parse job description using Google AI with comprehensive structure"""
+        results = await asyncio.gather(*(self._parse_resume_chunk(chunk) for chunk in chunks))
+        return [parsed for chunk_results in results for parsed in chunk_results]
+    
+    async def _parse_resume_chunk(self, resume_texts: List[str]) -> List[Optional[Dict]]:
+        """Parse one batch of resumes, falling back to single parses on a malformed response"""
+        if len(resume_texts) == 1:
+            return [await self.parse_resume_comprehensive(resume_texts[0])]
         
-        prompt = f"""
-        Parse the following job description and extract information in this exact JSON structure:
+        parts = []
+        for number, text in enumerate(resume_texts, 1):
+            parts.append(f"---\nRESUME {number}:\n")
+            parts.append(_preprocess(text))
+            parts.append("\n")
         
-        {{
-          "job": {{
-            "title": "string",
-            "company": "string",
-            "location": "string",
-            "summary": "string - job summary",
-            "responsibilities": ["array of key responsibilities"],
-            "qualifications": ["array of required qualifications"],
-            "required_skills": ["array of required technical skills"],
-            "preferred_skills": ["array of preferred skills"],
-            "experience_level": "string - entry/mid/senior/executive",
-            "experience_years": "number - minimum years required",
-            "education_requirements": ["array of education requirements"],
-            "employment_type": "string - full-time/part-time/contract",
-            "salary_range": {{
-              "min": "number or null",
-              "max": "number or null",
-              "currency": "string"
-            }}
-          }}
-        }}
+        result = await self._cached_request(
+            _RESUME_BATCH_TEMPLATE, _RESUME_BATCH_TEMPLATE.render(*parts),
+            max_output_tokens=_BATCH_MAX_OUTPUT_TOKENS
+        )
         
-        Job description:
-        {job_description}
+        candidates = result['candidates'] if result else None
+        if isinstance(candidates, list) and len(candidates) == len(resume_texts):
+            return [{"candidate": candidate} if isinstance(candidate, dict) else None for candidate in candidates]
         
-        Return only valid JSON. If information is not available, use empty string, empty array, or null.
-        """
+        logger.warning("Batch resume parse returned a mismatched result, parsing %d resumes individually", len(resume_texts))
+        return list(await asyncio.gather(*(self.parse_resume_comprehensive(text) for text in resume_texts)))
+
+    async def parse_job_comprehensive(self, job_description: str) -> Optional[Dict]:
+        """Parse job description using Google AI with comprehensive structure"""
         
-        try:
-            result = await self._make_request(prompt)
-            if result and 'job' in result:
-                return result
-            return None
-        except Exception as e:
-            logger.error(f"Error parsing job with Google AI: {str(e)}")
-            return None
+        prompt = _JOB_TEMPLATE.render(_preprocess(job_description))
+        
+        return await self._cached_request(_JOB_TEMPLATE, prompt)
 
     async def match_candidate_to_job(self, candidate_data: Dict, job_data: Dict) -> Optional[Dict]:
         """Match candidate to job using Google AI analysis"""
         
-        prompt = f"""
-        Analyze the match between this candidate and job posting. Provide detailed matching analysis.
-        
-        Candidate:
-        {json.dumps(candidate_data, indent=2)}
-        
-        Job:
-        {json.dumps(job_data, indent=2)}
-        
-        Return analysis in this exact JSON structure:
-        
-        {{
-          "match_analysis": {{
-            "overall_score": "number between 0-100",
-            "skill_match": {{
-              "score": "number between 0-100",
-              "matched_skills": ["array of matching skills"],
-              "missing_skills": ["array of skills candidate lacks"],
-              "additional_skills": ["array of extra skills candidate has"]
-            }},
-            "experience_match": {{
-              "score": "number between 0-100",
-              "candidate_years": "number",
-              "required_years": "number", 
-              "level_match": "string - under/meets/exceeds"
-            }},
-            "education_match": {{
-              "score": "number between 0-100",
-              "meets_requirements": "boolean",
-              "details": "string explanation"
-            }},
-            "location_match": {{
-              "score": "number between 0-100",
-              "compatible": "boolean",
-              "details": "string explanation"
-            }},
-            "strengths": ["array of candidate strengths for this role"],
-            "concerns": ["array of potential concerns or gaps"],
-            "recommendation": "string - hire/interview/pass with reasoning",
-            "confidence": "number between 0-1"
-          }}
-        }}
-        
-        Return only valid JSON.
-        """
+        prompt = _MATCH_TEMPLATE.render(_dumps(candidate_data), "\n\nJob:\n", _dumps(job_data))
         
-        try:
-            result = await self._make_request(prompt)
-            if result and 'match_analysis' in result:
-                return result
-            return None
-        except Exception as e:
-            logger.error(f"Error matching candidate to job with Google AI: {str(e)}")
-            return None
+        return await self._cached_request(_MATCH_TEMPLATE, prompt)
 
     async def generate_interview_questions(self, job_data: Dict, candidate_data: Optional[Dict] = None) -> Optional[Dict]:
         """Generate interview questions using Google AI"""
         
-        context = f"Job: {json.dumps(job_data, indent=2)}"
         if candidate_data:
-            context += f"\n\nCandidate: {json.dumps(candidate_data, indent=2)}"
-        
-        prompt = f"""
-        Generate interview questions for this job posting{' and candidate' if candidate_data else ''}.
+            template = _INTERVIEW_CANDIDATE_TEMPLATE
+            prompt = template.render(_dumps(job_data), "\n\nCandidate:\n", _dumps(candidate_data))
+        else:
+            template = _INTERVIEW_TEMPLATE
+            prompt = template.render(_dumps(job_data))
         
-        {context}
-        
-        Return questions in this exact JSON structure:
+        return await self._cached_request(template, prompt)
+
+    async def analyze_resume_and_job(
+        self, resume_text: str, job_description: str
+    ) -> Tuple[Optional[Dict], Optional[Dict], Optional[Dict]]:
+        """Parse a resume and a job concurrently, then match them; returns (resume, job, match)"""
         
-        {{
-          "interview_questions": {{
-            "general": [
-              {{
-                "question": "string",
-                "type": "general",
-                "purpose": "string - what this question assesses",
-                "expected_duration": "number - minutes"
-              }}
-            ],
-            "technical": [
-              {{
-                "question": "string", 
-                "type": "technical",
-                "skill_area": "string",
-                "difficulty": "string - easy/medium/hard",
-                "expected_duration": "number - minutes"
-              }}
-            ],
-            "behavioral": [
-              {{
-                "question": "string",
-                "type": "behavioral", 
-                "competency": "string",
-                "expected_duration": "number - minutes"
-              }}
-            ],
-            "situational": [
-              {{
-                "question": "string",
-                "type": "situational",
-                "scenario": "string",
-                "expected_duration": "number - minutes"
-              }}
-            ]
-          }},
-          "total_questions": "number",
-          "estimated_duration": "number - total minutes"
-        }}
+        # The two parses are independent; over HTTP/2 they share one pooled connection
+        resume, job = await asyncio.gather(
+            self.parse_resume_comprehensive(resume_text),
+            self.parse_job_comprehensive(job_description)
+        )
+        if not resume or not job:
+            return resume, job, None
         
-        Generate 8-12 questions total across all categories. Return only valid JSON.
-        """
-        
-        try:
-            result = await self._make_request(prompt)
-            if result and 'interview_questions' in result:
-                return result
-            return None
-        except Exception as e:
-            logger.error(f"Error generating interview questions with Google AI: {str(e)}")
-            return None
+        match = await self.match_candidate_to_job(resume['candidate'], job['job'])
+        return resume, job, match
 
 # Global instance
 google_ai_service = GoogleAIService()
@@ -313,10 +549,18 @@ async def parse_resume_with_google_ai(resume_text: str) -> Optional[Dict]:
     """Parse resume using Google AI"""
     return await google_ai_service.parse_resume_comprehensive(resume_text)
 
+async def parse_resumes_batch_with_google_ai(resume_texts: List[str]) -> List[Optional[Dict]]:
+    """Parse many resumes using batched Google AI prompts"""
+    return await google_ai_service.parse_resumes_batch(resume_texts)
+
 async def parse_job_with_google_ai(job_description: str) -> Optional[Dict]:
     """Parse job description using Google AI"""
     return await google_ai_service.parse_job_comprehensive(job_description)
 
+async def analyze_resume_and_job(resume_text: str, job_description: str) -> Tuple[Optional[Dict], Optional[Dict], Optional[Dict]]:
+    """Parse resume and job concurrently, then match them using Google AI"""
+    return await google_ai_service.analyze_resume_and_job(resume_text, job_description)
+
 async def match_candidate_with_google_ai(candidate_data: Dict, job_data: Dict) -> Optional[Dict]:
     """Match candidate to job using Google AI"""
     return await google_ai_service.match_candidate_to_job(candidate_data, job_data)
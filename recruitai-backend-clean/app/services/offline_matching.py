@@ -7,7 +7,6 @@ import re
 import logging
 from typing import Dict, List, Any, Optional, Tuple
 from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
 import numpy as np
 from datetime import datetime
 
@@ -317,7 +316,8 @@ class OfflineMatchingService:
             # 1. TF-IDF similarity (40% weight)
             corpus = [resume_lower, job_text]
             tfidf_matrix = self.vectorizer.fit_transform(corpus)
-            tfidf_similarity = cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:2])[0][0]
+            # Rows are L2-normalized, so cosine similarity is a sparse dot product
+            tfidf_similarity = tfidf_matrix[0].multiply(tfidf_matrix[1]).sum()
             
             # 2. Skills match (35% weight)
             job_skills = []
@@ -1,6 +1,7 @@
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
+import asyncio
 import logging
 import os
 from datetime import datetime
@@ -19,7 +20,8 @@ app = FastAPI(
     description="AI-Powered Recruitment Platform Backend - No Authentication Version",
     version="2.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse
 )
 
 # CORS Configuration - Allow all origins for demo
@@ -133,12 +135,30 @@ async def startup_event():
     logger.info("Authentication: DISABLED")
     logger.info("CORS: Enabled for all origins")
     logger.info("Documentation available at: /docs")
+    
+    from app.core.database import engine
+    from app.services.analytics_service import (
+        create_admin_analytics_view, refresh_admin_analytics_periodically
+    )
+    try:
+        if await asyncio.to_thread(create_admin_analytics_view, engine):
+            app.state.admin_view_refresher = asyncio.create_task(refresh_admin_analytics_periodically(engine))
+            logger.info("Admin analytics materialized view enabled")
+    except Exception as e:
+        logger.warning(f"Admin analytics view unavailable, using live queries: {e}")
 
 # Shutdown event
 @app.on_event("shutdown")
 async def shutdown_event():
     """Application shutdown"""
     logger.info("RecruitAI Backend (No Auth) shutting down...")
+    refresher = getattr(app.state, "admin_view_refresher", None)
+    if refresher:
+        refresher.cancel()
+    from app.services.ai_service import ai_service
+    from app.services.google_ai_service import google_ai_service
+    await ai_service.aclose()
+    await google_ai_service.aclose()
 
 if __name__ == "__main__":
     port = int(os.getenv("PORT", 8000))
@@ -0,0 +1,37 @@
+"""Add users.credit_balance and backfill it from the credit ledger
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    # Databases created from the current models already have the column
+    columns = {column["name"] for column in sa.inspect(op.get_bind()).get_columns("users")}
+    if "credit_balance" not in columns:
+        with op.batch_alter_table("users") as batch_op:
+            batch_op.add_column(
+                sa.Column("credit_balance", sa.Integer(), server_default="0", nullable=False)
+            )
+    
+    # Seed each balance from the user's latest ledger entry so existing users keep their credits
+    op.execute("""
+        UPDATE users SET credit_balance = COALESCE((
+            SELECT credits.balance_after FROM credits
+            WHERE credits.user_id = users.id
+            ORDER BY credits.created_at DESC, credits.id DESC
+            LIMIT 1
+        ), 0)
+    """)
+
+def downgrade():
+    with op.batch_alter_table("users") as batch_op:
+        batch_op.drop_column("credit_balance")
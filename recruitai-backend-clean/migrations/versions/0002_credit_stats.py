@@ -0,0 +1,37 @@
+"""Create credit_stats and build it from the credit ledger
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-16
+"""
+
+import asyncio
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.orm import Session
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    bind = op.get_bind()
+    if not sa.inspect(bind).has_table("credit_stats"):
+        op.create_table(
+            "credit_stats",
+            sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id"), primary_key=True),
+            sa.Column("total_earned", sa.Integer(), server_default="0", nullable=False),
+            sa.Column("total_spent", sa.Integer(), server_default="0", nullable=False),
+            sa.Column("current_balance", sa.Integer(), server_default="0", nullable=False),
+            sa.Column("last_transaction_at", sa.DateTime(timezone=True), nullable=True),
+            sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now())
+        )
+    
+    # Aggregate the existing ledger; the session joins the migration's transaction
+    from app.services.credit_service import backfill_credit_stats
+    asyncio.run(backfill_credit_stats(Session(bind=bind)))
+
+def downgrade():
+    op.drop_table("credit_stats")
@@ -0,0 +1,27 @@
+"""Create ai_parse_cache
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    if not sa.inspect(op.get_bind()).has_table("ai_parse_cache"):
+        op.create_table(
+            "ai_parse_cache",
+            sa.Column("content_hash", sa.String(32), primary_key=True),
+            sa.Column("kind", sa.String(50), nullable=False),
+            sa.Column("result", sa.JSON(), nullable=False),
+            sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now())
+        )
+
+def downgrade():
+    op.drop_table("ai_parse_cache")